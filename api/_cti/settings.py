@@ -46,6 +46,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.server_timing.ServerTimingMiddleware',
+    'core.middleware.profiler.ProfilerMiddleware',
+    'core.middleware.compression.CompressionMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -57,6 +60,44 @@ MIDDLEWARE = [
 ]
 ROOT_URLCONF = '_cti.urls'
 
+# Instrumentação por requisição: consultas SQL e tempos no cabeçalho Server-Timing e em uma linha
+# de log JSON por requisição (logger core.middleware.server_timing)
+SERVER_TIMING_HEADER    = config('SERVER_TIMING_HEADER', default=True, cast=bool)
+SERVER_TIMING_LOG       = config('SERVER_TIMING_LOG', default=True, cast=bool)
+
+# Compressão das respostas JSON (brotli ou gzip, conforme o Accept-Encoding)
+COMPRESSION_MIN_SIZE        = config('COMPRESSION_MIN_SIZE', default=1024, cast=int)
+COMPRESSION_GZIP_LEVEL      = config('COMPRESSION_GZIP_LEVEL', default=6, cast=int)
+COMPRESSION_BROTLI_QUALITY  = config('COMPRESSION_BROTLI_QUALITY', default=4, cast=int)
+
+# Métricas para o Prometheus em /metrics (ver README). Com vários workers, defina a variável de
+# ambiente PROMETHEUS_MULTIPROC_DIR para os contadores serem agregados entre eles
+METRICS_ENABLED     = config('METRICS_ENABLED', default=True, cast=bool)
+METRICS_TOKEN       = config('METRICS_TOKEN', default='')
+
+# Profiling sob demanda de uma requisição (?profile=collapsed|pstats ou X-Profile), só para staff
+PROFILER_ENABLED    = config('PROFILER_ENABLED', default=False, cast=bool)
+PROFILER_DIR        = config('PROFILER_DIR', default='')
+PROFILER_INTERVAL   = config('PROFILER_INTERVAL', default=0.001, cast=float)
+
+LOGGING = {
+    'version'                   : 1,
+    'disable_existing_loggers'  : False,
+    'formatters': {
+        'message': { 'format': '%(message)s' },
+    },
+    'handlers': {
+        'server_timing': { 'class': 'logging.StreamHandler', 'formatter': 'message' },
+    },
+    'loggers': {
+        'core.middleware.server_timing': {
+            'handlers'  : [ 'server_timing' ],
+            'level'     : 'INFO',
+            'propagate' : False,
+        },
+    },
+}
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -73,16 +114,28 @@ TEMPLATES = [
     },
 ]
 WSGI_APPLICATION = '_cti.wsgi.application'
+ASGI_APPLICATION = '_cti.asgi.application'
+
+# Listagens de alertas e posts alertados servidas por views assíncronas (ORM assíncrono). Ativar
+# apenas servindo via ASGI (uvicorn), com DB_CONN_MAX_AGE=0: no modo assíncrono as conexões não
+# ficam presas a uma thread fixa e não devem ser persistentes.
+ASYNC_READ_VIEWS = config('ASYNC_READ_VIEWS', default=False, cast=bool)
 
+# Conexões persistentes: cada thread do gunicorn reaproveita sua conexão por até DB_CONN_MAX_AGE
+# segundos, validada por health check antes de ser reutilizada. O backend apenas instrumenta o
+# backend padrão do Django (estatísticas em /api/v1/db/stats/).
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        'ENGINE': 'core.db.backends.postgresql',
         'NAME': config('POSTGRES_DB'),
         'HOST': config('POSTGRES_HOST'),
         'PORT': config('POSTGRES_PORT'),
         'USER': config('POSTGRES_USER'),
         'PASSWORD': config('POSTGRES_PASSWORD'),
 
+        'CONN_MAX_AGE'          : config('DB_CONN_MAX_AGE', default=300, cast=int),
+        'CONN_HEALTH_CHECKS'    : config('DB_CONN_HEALTH_CHECKS', default=True, cast=bool),
+
         'OPTIONS': {
             'options': '-c search_path=django'
         },
@@ -115,11 +168,50 @@ STATIC_ROOT = path.join(BASE_DIR, 'staticfiles')
 MEDIA_URL = '/api/media/'
 MEDIA_ROOT = path.join(BASE_DIR, 'media')
 
+# Arquivamento dos posts alertados antigos em arquivos JSONL.gz (comando archive_posts_alerted)
+ARCHIVE_DIR         = config('ARCHIVE_DIR', default=path.join(BASE_DIR, 'archive'))
+ARCHIVE_AFTER_DAYS  = config('ARCHIVE_AFTER_DAYS', default=365, cast=int)
+
+# Cache compartilhado pelos workers (Redis); sem CACHE_REDIS_URL, cache local de cada processo
+CACHE_REDIS_URL = config('CACHE_REDIS_URL', default='')
+
+if CACHE_REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND'   : 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION'  : CACHE_REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND'   : 'django.core.cache.backends.locmem.LocMemCache',
+            'OPTIONS'   : { 'MAX_ENTRIES': 10000 },
+        }
+    }
+
+# Cache de leitura dos alertas: só com o cache compartilhado, para a invalidação valer em todos os
+# workers. ALERT_CACHE_TTL é quantos segundos o detalhe e as listagens ficam no cache
+ALERT_CACHE_ENABLED = bool(CACHE_REDIS_URL)
+ALERT_CACHE_TTL     = config('ALERT_CACHE_TTL', default=60, cast=int)
+
+# Cache das credenciais Basic já verificadas (por processo)
+AUTH_CACHE_MAX_SIZE = config('AUTH_CACHE_MAX_SIZE', default=1024, cast=int)
+AUTH_CACHE_TTL      = config('AUTH_CACHE_TTL', default=300, cast=int)
+
+# Cache de ids de fóruns, e-mails e palavras-chave por nome (por processo)
+DIMENSION_CACHE_MAX_SIZE    = config('DIMENSION_CACHE_MAX_SIZE', default=10000, cast=int)
+DIMENSION_CACHE_TTL         = config('DIMENSION_CACHE_TTL', default=300, cast=int)
+
+# Redis compartilhado pelos workers para os token buckets do throttling (vazio: por processo)
+THROTTLE_REDIS_URL = config('THROTTLE_REDIS_URL', default='')
+
 # Rest Framework
 REST_FRAMEWORK = {
     # Authentication
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework.authentication.BasicAuthentication',
+        'core.authentication.cached_basic_authentication.CachedBasicAuthentication',
+        'app_alert_param.authentication.ApiKeyAuthentication',
     ),
 
     # Permissions
@@ -127,12 +219,25 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.DjangoModelPermissions',
     ),
 
+    # Renderers e parsers (JSON com orjson; API navegável apenas em desenvolvimento)
+    'DEFAULT_RENDERER_CLASSES': (
+        'core.renderers.orjson_renderer.ORJSONRenderer',
+        *(('rest_framework.renderers.BrowsableAPIRenderer',) if DEBUG else ()),
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'core.parsers.orjson_parser.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
+
     # Throttling
     'DEFAULT_THROTTLE_CLASSES': (
-        'rest_framework.throttling.UserRateThrottle',
+        'core.throttling.token_bucket_throttle.TokenBucketThrottle',
     ),
     'DEFAULT_THROTTLE_RATES': {
-        'user': '50/second',
+        'read'      : config('THROTTLE_RATE_READ', default='50/second'),
+        'write'     : config('THROTTLE_RATE_WRITE', default='50/second'),
+        'ingestion' : config('THROTTLE_RATE_INGESTION', default='50/second'),
     },
 }
 
@@ -10,7 +10,9 @@ from django.contrib             import admin
 from django.urls                import path, include
 from django.conf.urls.static    import static
 
-from app_alert_param.urls import app_alert_param_router
+from core.db.views          import DatabaseStatsView
+from core.metrics.views     import metrics_view
+from app_alert_param.urls   import app_alert_param_router, async_read_urlpatterns
 
 
 # URL base da API
@@ -23,8 +25,15 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('auth/', include('rest_framework.urls')),
 
-    # API de perfis de alerta
+    # API de perfis de alerta (listagens assíncronas antes do roteador, se ativadas)
+    *([ path(f'{BASE}/{VERSION}/', include(async_read_urlpatterns)) ] if settings.ASYNC_READ_VIEWS else []),
     path(f'{BASE}/{VERSION}/', include(app_alert_param_router.urls)),
+
+    # Diagnóstico
+    path(f'{BASE}/{VERSION}/db/stats/', DatabaseStatsView.as_view()),
+
+    # Métricas para o Prometheus
+    *([ path('metrics', metrics_view) ] if settings.METRICS_ENABLED else []),
 ]
 
 urlpatterns += static( settings.STATIC_URL  ,   document_root=settings.STATIC_ROOT )
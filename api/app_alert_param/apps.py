@@ -16,3 +16,9 @@ class AppAlertParamConfig(AppConfig):
 
     verbose_name        = 'Parâmetros de Alerta'
     verbose_name_plural = 'Parâmetros de Alerta'
+
+    def ready(self):
+        """ Registra os sinais do aplicativo e das estatísticas de conexão com o banco. """
+
+        from app_alert_param import signals     # noqa: F401
+        from core.db import connection_stats    # noqa: F401
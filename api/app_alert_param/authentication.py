@@ -0,0 +1,84 @@
+"""
+Autenticação por chave de API para os serviços que consomem a API.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import hmac
+import hashlib
+import secrets
+
+from django.utils.translation       import gettext_lazy as _
+from rest_framework                 import exceptions
+from rest_framework.authentication  import BaseAuthentication, get_authorization_header
+
+from app_alert_param.models import ApiKey
+
+
+class ApiKeyAuthentication(BaseAuthentication):
+    """
+    Autenticação por chave de API: `Authorization: Api-Key <prefixo>.<segredo>`.
+
+    O prefixo identifica a chave (busca pelo índice único) e o segredo, gerado com 32 bytes
+    aleatórios, é comparado em tempo constante com o SHA-256 gravado. Como o segredo não é uma
+    senha escolhida por pessoas, um hash rápido basta e a verificação custa microssegundos, em
+    vez do PBKDF2 da autenticação Basic. A requisição é feita em nome do usuário dono da chave.
+    """
+
+    keyword = 'Api-Key'
+
+    # ini: methods
+
+    @staticmethod
+    def get_digest(secret: str) -> str:
+        """
+        Calcula o digest gravado para o segredo da chave.
+
+        :param secret:  Segredo da chave.
+        :return:        SHA-256 do segredo, em hexadecimal.
+        """
+
+        return hashlib.sha256(secret.encode()).hexdigest()
+
+    @classmethod
+    def generate_key(cls) -> tuple:
+        """
+        Gera uma nova chave de API.
+
+        :return:    Tupla (prefixo, chave completa para o cliente, digest para gravar).
+        """
+
+        prefix  = secrets.token_hex(8)
+        secret  = secrets.token_urlsafe(32)
+
+        return prefix, f'{prefix}.{secret}', cls.get_digest(secret)
+
+    def authenticate(self, request):
+        auth = get_authorization_header(request).split()
+
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+
+        if len(auth) != 2:
+            raise exceptions.AuthenticationFailed(_('Invalid API key header.'))
+
+        try:
+            prefix, secret = auth[1].decode().split('.', 1)
+        except (UnicodeDecodeError, ValueError):
+            raise exceptions.AuthenticationFailed(_('Invalid API key header.'))
+
+        api_key = ApiKey.objects.select_related('user').filter(prefix=prefix, is_active=True).first()
+
+        if api_key is None or not hmac.compare_digest(api_key.digest, self.get_digest(secret)):
+            raise exceptions.AuthenticationFailed(_('Invalid API key.'))
+
+        if not api_key.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        return (api_key.user, api_key)
+
+    def authenticate_header(self, request):
+        return self.keyword
+
+    # end: methods
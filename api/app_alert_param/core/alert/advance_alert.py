@@ -0,0 +1,194 @@
+"""
+Módulo responsável por avançar, em lote, o próximo dia a rodar dos alertas.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import calendar
+
+from datetime                   import date, timedelta
+
+from django.db.models           import Case, When, Value, F, Q, Func, DateField, DurationField
+from django.db.models.functions import Cast, Least
+from django.utils               import timezone
+from rest_framework             import status
+from rest_framework.request     import Request
+from rest_framework.response    import Response
+
+from core.metrics.metrics                    import count_alerts_advanced
+from core.response_utils.response_builder    import ResponseBuilder
+from core.response_utils.response_messages   import ResponseMessages
+from core.response_utils.response_error_code import ResponseErrorCode
+
+from app_alert_param.core.alert.alert_cache import AlertCache
+
+from app_alert_param.models import Alert
+
+
+class AdvanceAlert:
+    """
+    Classe responsável por avançar, em lote, o próximo dia a rodar dos alertas.
+
+    Aplica a mesma regra do UpdateAlert.update_run em um único UPDATE: `last_run` recebe `run`,
+    `run` avança conforme a frequência (aritmética de intervalos do Postgres, limitada à data
+    final) e alertas que já chegaram à data final são desativados.
+    """
+
+    # Unidade do make_interval para cada tipo de frequência
+    FREQUENCY_UNITS = {
+        'days'  : 'days',
+        'weeks' : 'weeks',
+        'months': 'months',
+        'years' : 'years',
+    }
+
+    # ini: methods
+
+    @staticmethod
+    def add_frequency(day: date, qte_frequency: int, type_frequency: str) -> date:
+        """
+        Soma a frequência à data, com a mesma aritmética do make_interval do Postgres (get_next_run):
+        meses e anos de calendário, com o dia limitado ao último dia do mês (31/01 + 1 mês = 28/02).
+
+        Tipos de frequência desconhecidos mantêm a data.
+
+        :param day:             Data de referência.
+        :param qte_frequency:   Quantidade de unidades da frequência.
+        :param type_frequency:  Tipo da frequência (days, weeks, months ou years).
+        :return:                Data somada.
+        """
+
+        if type_frequency == 'days':
+            return day + timedelta(days=qte_frequency)
+
+        if type_frequency == 'weeks':
+            return day + timedelta(weeks=qte_frequency)
+
+        if type_frequency not in ('months', 'years'):
+            return day
+
+        months      = qte_frequency * 12 if type_frequency == 'years' else qte_frequency
+        index       = day.year * 12 + day.month - 1 + months
+        year, month = index // 12, index % 12 + 1
+
+        return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+    @classmethod
+    def get_next_run(cls) -> Cast:
+        """
+        Expressão SQL do próximo dia a rodar: `LEAST((run + make_interval(...))::date, final_date)`.
+
+        Tipos de frequência desconhecidos mantêm o `run` atual, como no update_run.
+
+        :return:    Expressão do próximo dia a rodar.
+        """
+
+        interval = Case(
+            *[
+                When(
+                    type_frequency=type_frequency,
+                    then=Func(F('qte_frequency'), template=f'make_interval({unit} => %(expressions)s)'),
+                )
+                for type_frequency, unit in cls.FREQUENCY_UNITS.items()
+            ],
+            default=Value(timedelta(0)),
+            output_field=DurationField(),
+        )
+
+        return Least(Cast(F('run') + interval, DateField()), F('final_date'))
+
+    @classmethod
+    def advance(cls, alert_ids: list = None, lease: str = None) -> int:
+        """
+        Avança os alertas em um único UPDATE.
+
+        :param alert_ids:   Ids dos alertas a avançar. Se não informado, avança todos os alertas
+                            ativos com `run <= hoje` que não estejam reservados por um worker.
+        :param lease:       Token de reserva (LeaseAlert); se informado, só avança alertas dessa reserva.
+        :return:            Quantidade de alertas avançados ou desativados.
+        """
+
+        now     = timezone.now()
+        alerts  = Alert.objects.filter(is_active=True)
+
+        if alert_ids is not None:
+            alerts = alerts.filter(id__in=alert_ids)
+        else:
+            alerts = alerts.filter(run__lte=timezone.localdate())
+            alerts = alerts.filter(Q(leased_until__isnull=True) | Q(leased_until__lt=now))
+
+        if lease:
+            alerts = alerts.filter(lease_token=lease)
+
+        expired = Q(run__gte=F('final_date'))
+
+        updated = alerts.update(
+            last_run        = F('run'),
+            run             = Case(When(expired, then=F('run')), default=cls.get_next_run()),
+            is_active       = Case(When(expired, then=Value(False)), default=Value(True)),
+            leased_until    = None,
+            lease_token     = None,
+            updated_at      = now,
+        )
+
+        count_alerts_advanced('batch', updated)
+
+        # UPDATE em lote não dispara sinais: os alertas afetados não são conhecidos aqui
+        if updated:
+            AlertCache.invalidate_all()
+
+        return updated
+
+    @classmethod
+    def advance_run(cls, request: Request) -> Response:
+        """
+        Avança o próximo dia a rodar de uma lista de alertas, ou de todos os que devem rodar.
+
+        :param request: Requisição HTTP (opcionais: `ids`, lista de ids; `lease`, token de reserva).
+        :return:        Resposta HTTP com a quantidade de alertas atualizados.
+        """
+
+        try:
+            alert_ids = request.data.get('ids')
+            if alert_ids is not None:
+                # Uma string também é iterável: "12" viraria os ids 1 e 2
+                if not isinstance(alert_ids, list):
+                    raise TypeError('ids deve ser uma lista.')
+
+                alert_ids = [ int(alert_id) for alert_id in alert_ids ]
+
+            lease = request.data.get('lease')
+
+        except Exception as err:
+            return ResponseBuilder.build_response(
+                ResponseMessages.ERROR_GET_REQUEST,
+
+                error={
+                    'code'      : ResponseErrorCode.ERROR_GET_REQUEST[0],
+                    'message'   : ResponseErrorCode.ERROR_GET_REQUEST[1],
+                    'error'     : f'{type(err)}',
+                },
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            updated = cls.advance(alert_ids, lease)
+
+        except Exception as err:
+            return ResponseBuilder.build_response(
+                ResponseMessages.ERROR_ALERT_UPDATE_RUN,
+                error={
+                    'code': ResponseErrorCode.ERROR_ALERT_UPDATE_RUN[0],
+                    'message': ResponseErrorCode.ERROR_ALERT_UPDATE_RUN[1],
+                    'error': f'{type(err)}'
+                },
+                http_status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        return ResponseBuilder.build_response(
+            ResponseMessages.ALERTS_RUN_ADVANCED,
+            data={ 'updated': updated }
+        )
+
+    # end: methods
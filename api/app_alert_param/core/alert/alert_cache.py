@@ -0,0 +1,201 @@
+"""
+Módulo do cache de leitura (read-through) dos alertas.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import os
+import time
+import threading
+
+from django.conf        import settings
+from django.core.cache  import cache
+
+from core.metrics.metrics import count_cache_requests
+
+
+class AlertCache:
+    """
+    Cache de leitura do detalhe e das listagens de alertas, com chaves versionadas.
+
+    Cada chave de dados inclui as versões das quais depende: a época global, e a versão do
+    alerta (detalhe), do usuário (listagens por usuário) ou da listagem de hoje. Invalidar é
+    apenas trocar a versão, então entradas antigas deixam de ser lidas e expiram pelo TTL. As
+    versões são trocadas pelos sinais do alerta (post_save, post_delete, m2m_changed) e de
+    fóruns, e-mails e palavras-chave; atualizações em lote trocam a época e invalidam tudo.
+
+    O cache só é usado com um cache compartilhado (CACHE_REDIS_URL), em que a invalidação vale
+    para todos os workers. Com o cache local de cada processo, um worker não veria a invalidação
+    feita por outro, então o cache fica desativado (ALERT_CACHE_ENABLED): as chaves são None e
+    leituras e gravações não fazem nada.
+    """
+
+    PREFIX          = 'alert_cache'
+    EPOCH_KEY       = f'{PREFIX}:epoch'
+    RUN_TODAY_KEY   = f'{PREFIX}:run_today'
+
+    _lock           = threading.Lock()
+    hits            = 0
+    misses          = 0
+    invalidations   = 0
+
+    # ini: methods
+
+    @classmethod
+    def get_alert_key(cls, alert_id: int) -> str:
+        return f'{cls.PREFIX}:alert:{alert_id}'
+
+    @classmethod
+    def get_user_key(cls, user_id: int) -> str:
+        return f'{cls.PREFIX}:user:{user_id}'
+
+    @classmethod
+    def get_versions(cls, *version_keys: str) -> list:
+        """
+        Retorna as versões atuais, criando as que não existem.
+
+        Uma versão ausente (nunca criada ou descartada pelo cache) recebe um valor novo, então
+        nunca volta a apontar para dados gravados com uma versão anterior.
+
+        :param version_keys:    Chaves das versões.
+        :return:                Lista com as versões, na mesma ordem das chaves.
+        """
+
+        versions = cache.get_many(version_keys)
+
+        for key in version_keys:
+            if key not in versions:
+                cache.add(key, time.time_ns(), timeout=None)
+                versions[key] = cache.get(key)
+
+        return [ versions[key] for key in version_keys ]
+
+    @classmethod
+    def get_data_key(cls, name: str, *version_keys: str) -> str:
+        """
+        Monta a chave dos dados, versionada pela época e pelas versões informadas.
+
+        :param name:            Nome dos dados (ex.: `detail:1`).
+        :param version_keys:    Chaves das versões das quais os dados dependem.
+        :return:                Chave dos dados, ou None com o cache desativado.
+        """
+
+        if not settings.ALERT_CACHE_ENABLED:
+            return None
+
+        versions = cls.get_versions(cls.EPOCH_KEY, *version_keys)
+
+        return f'{cls.PREFIX}:data:{name}:' + ':'.join(str(version) for version in versions)
+
+    @classmethod
+    def get_detail_key(cls, alert_id: int) -> str:
+        return cls.get_data_key(f'detail:{alert_id}', cls.get_alert_key(alert_id))
+
+    @classmethod
+    def get_user_list_key(cls, user_id: int, active_only: bool) -> str:
+        return cls.get_data_key(f'user:{user_id}:{int(active_only)}', cls.get_user_key(user_id))
+
+    @classmethod
+    def get_run_today_key(cls, today) -> str:
+        return cls.get_data_key(f'run_today:{today.isoformat()}', cls.RUN_TODAY_KEY)
+
+    @classmethod
+    def get(cls, key: str):
+        """
+        Lê os dados em cache, contando acertos e faltas.
+
+        :param key: Chave dos dados (None com o cache desativado).
+        :return:    Dados em cache ou None.
+        """
+
+        if key is None:
+            return None
+
+        value = cache.get(key)
+
+        with cls._lock:
+            if value is None:
+                cls.misses += 1
+            else:
+                cls.hits += 1
+
+        count_cache_requests('alert', int(value is not None), int(value is None))
+
+        return value
+
+    @classmethod
+    def set(cls, key: str, value):
+        """
+        Grava os dados em cache.
+
+        :param key:     Chave dos dados (None com o cache desativado).
+        :param value:   Dados.
+        """
+
+        if key is None:
+            return
+
+        cache.set(key, value, timeout=settings.ALERT_CACHE_TTL)
+
+    @classmethod
+    def bump(cls, *version_keys: str):
+        """
+        Troca as versões informadas, invalidando os dados que dependem delas.
+
+        :param version_keys:    Chaves das versões.
+        """
+
+        if not settings.ALERT_CACHE_ENABLED:
+            return
+
+        version = time.time_ns()
+        cache.set_many({ key: version for key in version_keys }, timeout=None)
+
+        with cls._lock:
+            cls.invalidations += 1
+
+    @classmethod
+    def invalidate_alert(cls, alert_id: int, *user_ids: int):
+        """
+        Invalida o detalhe do alerta, as listagens dos seus usuários e a listagem de hoje.
+
+        :param alert_id:    Id do alerta.
+        :param user_ids:    Ids dos usuários do alerta (atual e anterior, se mudou).
+        """
+
+        cls.bump(
+            cls.get_alert_key(alert_id),
+            *{ cls.get_user_key(user_id) for user_id in user_ids if user_id is not None },
+            cls.RUN_TODAY_KEY,
+        )
+
+    @classmethod
+    def invalidate_all(cls):
+        """ Invalida todos os dados em cache (ex.: atualizações em lote, renomear palavra-chave). """
+
+        cls.bump(cls.EPOCH_KEY)
+
+    @classmethod
+    def as_dict(cls) -> dict:
+        """
+        Retorna os contadores do processo atual.
+
+        :return:    Dicionário com acertos, faltas e invalidações.
+        """
+
+        with cls._lock:
+            requests = cls.hits + cls.misses
+
+            return {
+                'pid'           : os.getpid(),
+                'enabled'       : settings.ALERT_CACHE_ENABLED,
+                'backend'       : settings.CACHES['default']['BACKEND'],
+                'ttl'           : settings.ALERT_CACHE_TTL,
+                'hits'          : cls.hits,
+                'misses'        : cls.misses,
+                'hit_rate'      : round(cls.hits / requests, 4) if requests else None,
+                'invalidations' : cls.invalidations,
+            }
+
+    # end: methods
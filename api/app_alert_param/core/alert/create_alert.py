@@ -7,6 +7,7 @@ Módulo para classe de criação de registro de alertas.
 
 import pytz
 
+from django.db                  import transaction
 from rest_framework             import status
 from rest_framework.request     import Request
 from rest_framework.response    import Response
@@ -17,64 +18,75 @@ from core.response_utils.response_builder    import ResponseBuilder
 from core.response_utils.response_messages   import ResponseMessages
 from core.response_utils.response_error_code import ResponseErrorCode
 
-from app_alert_param.models import (
-    Alert,
-    Forum,
-    Email,
-    Keyword,
+from app_alert_param.core.dimension.dimension_cache import (
+    forum_cache,
+    email_cache,
+    keyword_cache,
 )
 
+from app_alert_param.models import Alert
+
 
 class CreateAlert:
     """  Classe para criação de registro de alertas. """
 
+    @staticmethod
+    def add_ids(alert: Alert, field: str, dimension_cache, names: list):
+        """
+        Adiciona ao campo ManyToMany do alerta os ids dos nomes, criando os que não existem.
+
+        :param alert:           Objeto de alerta.
+        :param field:           Campo ManyToMany.
+        :param dimension_cache: Cache de ids da tabela do campo.
+        :param names:           Lista de nomes.
+        """
+
+        with transaction.atomic():
+            getattr(alert, field).add(*dimension_cache.get_or_create(names).values())
+
     @staticmethod
     def add_forums(alert: Alert, forums: list):
         """
-        Método para adicionar fóruns.
+        Método para adicionar fóruns (criando os que não existem).
 
         :param alert:  Objeto de alerta.
         :param forums: Lista de fóruns.
         """
 
-        for forum in forums:
-            try:
-                forum_obj, _ = Forum.objects.get_or_create(forum_name=forum.upper())
-                alert.forums.add(forum_obj)
-            except:
-                raise ValueError(f'Erro ao adicionar fóruns. (forum={forum})')
+        try:
+            names = [ forum.upper() for forum in forums ]
+            forum_cache.retry_stale(names, lambda: CreateAlert.add_ids(alert, 'forums', forum_cache, names))
+        except:
+            raise ValueError(f'Erro ao adicionar fóruns. (forums={forums})')
 
     @staticmethod
     def add_emails(alert: Alert, emails: list):
         """
-        Método para adicionar e-mails.
+        Método para adicionar e-mails (criando os que não existem).
 
         :param alert:  Objeto de alerta.
         :param emails: Lista de e-mails.
         """
 
-        for email in emails:
-            try:
-                email_obj, _ = Email.objects.get_or_create(email=email)
-                alert.emails.add(email_obj)
-            except:
-                raise ValueError(f'Erro ao adicionar e-mails. (email={email})')
+        try:
+            email_cache.retry_stale(emails, lambda: CreateAlert.add_ids(alert, 'emails', email_cache, emails))
+        except:
+            raise ValueError(f'Erro ao adicionar e-mails. (emails={emails})')
 
     @staticmethod
     def add_keywords(alert: Alert, keywords: list):
         """
-        Método para adicionar palavras-chave.
+        Método para adicionar palavras-chave (criando as que não existem).
 
         :param alert:  Objeto de alerta.
         :param keywords: Lista de palavras-chave.
         """
 
-        for keyword in keywords:
-            try:
-                keyword_obj, _ = Keyword.objects.get_or_create(word=keyword.upper())
-                alert.keywords.add(keyword_obj)
-            except:
-                raise ValueError(f'Erro ao adicionar palavras-chave. (keyword={keyword})')
+        try:
+            names = [ keyword.upper() for keyword in keywords ]
+            keyword_cache.retry_stale(names, lambda: CreateAlert.add_ids(alert, 'keywords', keyword_cache, names))
+        except:
+            raise ValueError(f'Erro ao adicionar palavras-chave. (keywords={keywords})')
 
     @staticmethod
     def create_alerts(
@@ -0,0 +1,142 @@
+"""
+Módulo responsável por reservar (lease) alertas que devem rodar para os workers do gerador.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import uuid
+
+from django.db                  import transaction
+from django.db.models           import Q
+from django.utils               import timezone
+from rest_framework             import status
+from rest_framework.request     import Request
+from rest_framework.response    import Response
+
+from core.response_utils.response_builder    import ResponseBuilder
+from core.response_utils.response_messages   import ResponseMessages
+from core.response_utils.response_error_code import ResponseErrorCode
+
+from app_alert_param.core.alert.update_alert import UpdateAlert
+
+from app_alert_param.models import Alert
+
+
+class LeaseAlert:
+    """
+    Classe responsável por reservar alertas que devem rodar.
+
+    Cada chamada reserva até `limit` alertas ativos com `run <= hoje` que não estejam reservados
+    (ou cuja reserva expirou), usando `SELECT ... FOR UPDATE SKIP LOCKED`. Workers concorrentes
+    nunca recebem o mesmo alerta e não esperam pelos locks uns dos outros. O token da reserva
+    deve ser enviado no update_run (`?lease=<token>`), que libera a reserva ao avançar o alerta.
+    """
+
+    DEFAULT_LIMIT           = 10
+    MAX_LIMIT               = 100
+
+    DEFAULT_LEASE_SECONDS   = 600
+    MAX_LEASE_SECONDS       = 24 * 60 * 60
+
+    # ini: methods
+
+    @staticmethod
+    def get_int_param(data: dict, name: str, default: int, maximum: int) -> int:
+        """
+        Lê um parâmetro inteiro positivo da requisição.
+
+        :param data:    Dados da requisição.
+        :param name:    Nome do parâmetro.
+        :param default: Valor padrão.
+        :param maximum: Valor máximo aceito.
+        :return:        Valor do parâmetro.
+        """
+
+        value = int(data.get(name, default))
+        if not 1 <= value <= maximum:
+            raise ValueError(f'{name} deve estar entre 1 e {maximum}.')
+        return value
+
+    @staticmethod
+    def claim_alerts(limit: int, lease_seconds: int) -> tuple:
+        """
+        Reserva atomicamente até `limit` alertas que devem rodar.
+
+        :param limit:           Quantidade máxima de alertas a reservar.
+        :param lease_seconds:   Duração da reserva, em segundos.
+        :return:                Tupla (token da reserva, validade da reserva, ids dos alertas reservados).
+        """
+
+        now             = timezone.now()
+        leased_until    = now + timezone.timedelta(seconds=lease_seconds)
+        token           = str(uuid.uuid4())
+
+        with transaction.atomic():
+            alert_ids = list(
+                Alert.objects
+                .select_for_update(skip_locked=True)
+                .filter(is_active=True, run__lte=timezone.localdate())
+                .filter(Q(leased_until__isnull=True) | Q(leased_until__lt=now))
+                .order_by('run', 'id')
+                .values_list('id', flat=True)[:limit]
+            )
+
+            Alert.objects.filter(id__in=alert_ids).update(leased_until=leased_until, lease_token=token)
+
+        return token, leased_until, alert_ids
+
+    @classmethod
+    def claim(cls, request: Request) -> Response:
+        """
+        Reserva alertas que devem rodar para o worker que fez a requisição.
+
+        :param request: Requisição HTTP (parâmetros opcionais `limit` e `lease_seconds`).
+        :return:        Resposta HTTP com o token da reserva e os alertas reservados.
+        """
+
+        try:
+            limit           = cls.get_int_param(request.data, 'limit', cls.DEFAULT_LIMIT, cls.MAX_LIMIT)
+            lease_seconds   = cls.get_int_param(
+                request.data, 'lease_seconds', cls.DEFAULT_LEASE_SECONDS, cls.MAX_LEASE_SECONDS
+            )
+
+        except Exception as err:
+            return ResponseBuilder.build_response(
+                ResponseMessages.ERROR_GET_REQUEST,
+
+                error={
+                    'code'      : ResponseErrorCode.ERROR_GET_REQUEST[0],
+                    'message'   : ResponseErrorCode.ERROR_GET_REQUEST[1],
+                    'error'     : f'{type(err)} - {str(err)}',
+                },
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            token, leased_until, alert_ids = cls.claim_alerts(limit, lease_seconds)
+
+            alerts = Alert.objects.filter(id__in=alert_ids).order_by('run', 'id')
+            data = UpdateAlert.get_data_alert(request, alerts)
+
+        except Exception as err:
+            return ResponseBuilder.build_response(
+                ResponseMessages.ERROR_CLAIM_ALERTS,
+                error={
+                    'code': ResponseErrorCode.ERROR_CLAIM_ALERTS[0],
+                    'message': ResponseErrorCode.ERROR_CLAIM_ALERTS[1],
+                    'error': f'{type(err)}'
+                },
+                http_status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        return ResponseBuilder.build_response(
+            ResponseMessages.CLAIM_ALERTS,
+            data={
+                'lease'         : token,
+                'leased_until'  : leased_until,
+                'alerts'        : data,
+            }
+        )
+
+    # end: methods
@@ -7,22 +7,50 @@ Módulo responsável por atualizar proximo dia a rodar alerta.
 
 import datetime
 
-from rest_framework             import status
-from rest_framework.request     import Request
-from rest_framework.response    import Response
+from asgiref.sync                           import sync_to_async
+from django.db                              import transaction
+from django.http                            import Http404
+from django.utils                           import timezone
+from django.db.models                       import OuterRef, QuerySet
+from django.contrib.postgres.expressions    import ArraySubquery
+from rest_framework                         import status
+from rest_framework.request                 import Request
+from rest_framework.response                import Response
+from rest_framework.generics                import get_object_or_404
+
+from app_alert_param.core.alert.alert_cache          import AlertCache
+from app_alert_param.core.alert.advance_alert        import AdvanceAlert
+from app_alert_param.core.dimension.dimension_cache   import forum_cache, email_cache, keyword_cache
+
+from core.metrics.metrics                     import count_alerts_advanced
+from core.pagination.keyset_pagination        import KeysetPagination, PaginationError
+from core.response_utils.conditional_response import ConditionalResponse
+from core.response_utils.response_builder     import ResponseBuilder
+from core.response_utils.response_messages    import ResponseMessages
+from core.response_utils.response_error_code  import ResponseErrorCode
+
+from app_alert_param.models         import Alert, Email, Forum, Keyword
+from app_alert_param.serializers    import AlertSerializer, AlertListSerializer
 
-from app_alert_param.core.alert.create_alert import CreateAlert
 
-from core.response_utils.response_builder    import ResponseBuilder
-from core.response_utils.response_messages   import ResponseMessages
-from core.response_utils.response_error_code import ResponseErrorCode
+class UpdateAlert:
+    """ Classe responsável por atualizar proximo dia a rodar alerta. """
 
-from app_alert_param.models         import Alert
-from app_alert_param.serializers    import AlertSerializer
+    # Paginação por cursor (opcional) das listagens
+    pagination = KeysetPagination(ordering=('id',))
 
+    # Tabelas cujos dados aparecem nas listagens, consideradas na ETag
+    RELATED_MODELS = (Forum, Email, Keyword)
 
-class UpdateAlert:
-    """ Classe responsável por atualizar proximo dia a rodar alerta. """
+    # Quantidade de alertas buscados por consulta (bloco pela chave), no modo streaming
+    STREAM_CHUNK_SIZE = 2000
+
+    # Cache de ids e se o nome é gravado em maiúsculo, para cada campo ManyToMany
+    NTN_DIMENSIONS = {
+        'keywords'  : (keyword_cache, True),
+        'forums'    : (forum_cache, True),
+        'emails'    : (email_cache, False),
+    }
 
     # ini: methods
 
@@ -41,81 +69,333 @@ class UpdateAlert:
         return data
 
     @staticmethod
-    def get_data_alert(request: Request, alerts: list) -> list:
+    def annotate_ntn_fields(alerts: QuerySet) -> QuerySet:
+        """
+        Anota no queryset os nomes de e-mails, palavras-chave e fóruns de cada alerta.
+
+        Cada relacionamento vira um ARRAY(SELECT ...) na mesma consulta dos alertas, na ordem
+        em que foi adicionado, mantendo a listagem com número constante de consultas.
+
+        :param alerts:  QuerySet de alertas.
+        :return:        QuerySet anotado.
+        """
+
+        return alerts.annotate(
+            emails_names    = ArraySubquery(
+                Alert.emails.through.objects.filter(alert_id=OuterRef('pk')).order_by('id').values('email__email')
+            ),
+            keywords_names  = ArraySubquery(
+                Alert.keywords.through.objects.filter(alert_id=OuterRef('pk')).order_by('id').values('keyword__word')
+            ),
+            forums_names    = ArraySubquery(
+                Alert.forums.through.objects.filter(alert_id=OuterRef('pk')).order_by('id').values('forum__forum_name')
+            ),
+        )
+
+    @staticmethod
+    def get_data_alert(request: Request, alerts: QuerySet) -> list:
         """
         Retorna os campos necessários para atualizar alerta.
 
         :param request: Request da requisição.
-        :param alerts:  Lista de alertas.
+        :param alerts:  QuerySet de alertas (ou lista de alertas já anotados por annotate_ntn_fields).
         :return:        Lista de alertas tratados.
         """
 
-        data = list()
-        for alert in alerts:
-            alert_data = AlertSerializer(alert, context={'request': request}).data
-            alert_data = UpdateAlert.get_ntn_fields(alert, alert_data)
-            data.append(alert_data)
-        return data
+        if isinstance(alerts, QuerySet):
+            alerts = UpdateAlert.annotate_ntn_fields(alerts)
+
+        return AlertListSerializer(alerts, many=True, context={'request': request}).data
 
     @classmethod
-    def list(cls, request: Request) -> Response:
+    def iter_data_alert(cls, request: Request, alerts: QuerySet):
         """
-        Sobrescreve o método list para incluir campos adicionais nos relacionamentos ManyToMany.
+        Gera os dados de cada alerta, lendo o queryset em blocos pela chave (id).
 
-        :param request: Requisição HTTP.
-        :return:        Resposta HTTP contendo a lista de alertas com campos adicionais.
+        :param request: Request da requisição.
+        :param alerts:  QuerySet de alertas.
+        :return:        Gerador com os dados de cada alerta.
         """
 
-        alerts = Alert.objects.all()
+        for alert in cls.pagination.iter_chunks(cls.annotate_ntn_fields(alerts), cls.STREAM_CHUNK_SIZE):
+            yield AlertListSerializer(alert, context={'request': request}).data
+
+    @classmethod
+    def build_list_response(
+            cls,
+            request: Request,
+            alerts: QuerySet,
+            error_code: tuple,
+            conditional: bool = True,
+            cache_key: str = None
+        ) -> Response:
+        """
+        Monta a resposta das listagens de alertas, paginada por cursor ou em streaming quando solicitado.
+
+        :param request:     Requisição HTTP.
+        :param alerts:      QuerySet dos alertas a listar.
+        :param error_code:  Código de erro (ResponseErrorCode) em caso de falha na listagem.
+        :param conditional: Emite ETag e responde `If-None-Match` com 304. Desativado nas listagens
+                            sem filtro, em que calcular a versão exigiria ler a tabela inteira.
+        :param cache_key:   Chave (AlertCache) da listagem; sem paginação nem streaming, os dados
+                            e a versão da ETag são lidos do cache, sem consultar o banco.
+        :return:            Resposta HTTP contendo a lista de alertas com campos adicionais.
+        """
+
+        pagination = None
 
         try:
-            data = cls.get_data_alert(request, alerts)
+            paginated   = cls.pagination.is_requested(request)
+            streamed    = not paginated and ResponseBuilder.is_stream_requested(request)
+
+            cached = None
+            if cache_key and not paginated and not streamed:
+                cached = AlertCache.get(cache_key)
+            else:
+                cache_key = None
+
+            version = None
+            if cached is not None:
+                version, data = cached
+            elif conditional:
+                version = ConditionalResponse.get_version(alerts, cls.RELATED_MODELS)
+
+            etag = None
+            if conditional:
+                etag = ConditionalResponse.get_etag(request, version)
+                if ConditionalResponse.is_not_modified(request, etag):
+                    return ConditionalResponse.build_not_modified(etag)
+
+            if streamed:
+                response = ResponseBuilder.build_streaming_response(
+                    ResponseMessages.LIST_ALERTS,
+                    cls.iter_data_alert(request, alerts)
+                )
+                if etag:
+                    response['ETag'] = etag
+                return response
+
+            if paginated:
+                alerts, pagination = cls.pagination.paginate_queryset(cls.annotate_ntn_fields(alerts), request)
+
+            if cached is None:
+                data = cls.get_data_alert(request, alerts)
+                if cache_key:
+                    AlertCache.set(cache_key, (version, data))
+
+        except PaginationError as err:
+            return ResponseBuilder.build_response(
+                ResponseMessages.ERROR_INVALID_PAGINATION,
+                error={
+                    'code': ResponseErrorCode.ERROR_INVALID_PAGINATION[0],
+                    'message': ResponseErrorCode.ERROR_INVALID_PAGINATION[1],
+                    'error': f'{str(err)}'
+                },
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
 
         except Exception as err:
             return ResponseBuilder.build_response(
                 ResponseMessages.ERROR_LIST_ALERTS,
                 error={
-                    'code': ResponseErrorCode.ERROR_LIST_ALERTS[0],
-                    'message': ResponseErrorCode.ERROR_LIST_ALERTS[1],
+                    'code': error_code[0],
+                    'message': error_code[1],
                     'error': f'{type(err)}'
                 },
                 http_status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-        return ResponseBuilder.build_response(
+        response = ResponseBuilder.build_response(
             ResponseMessages.LIST_ALERTS,
-            data=data
+            data=data,
+            pagination=pagination
         )
-    
+        if etag:
+            response['ETag'] = etag
+
+        return response
+
     @classmethod
-    def list_by_user(cls, request: Request, user_id: int) -> Response:
+    async def aiter_data_alert(cls, request: Request, alerts: QuerySet):
         """
-        Listar alerta de um usuário.
+        Versão assíncrona do iter_data_alert: lê o queryset em blocos pela chave (id).
 
-        :param request: Requisição HTTP.
-        :param user_id: ID do usuário.
-        :return:        Resposta HTTP contendo a lista de alertas com campos adicionais.
+        :param request: Request da requisição.
+        :param alerts:  QuerySet de alertas.
+        :return:        Gerador assíncrono com os dados de cada alerta.
         """
 
-        alerts = Alert.objects.filter(id_user=user_id)
+        async for alert in cls.pagination.aiter_chunks(cls.annotate_ntn_fields(alerts), cls.STREAM_CHUNK_SIZE):
+            yield AlertListSerializer(alert, context={'request': request}).data
+
+    @classmethod
+    async def abuild_list_response(
+            cls,
+            request: Request,
+            alerts: QuerySet,
+            error_code: tuple,
+            conditional: bool = True,
+            cache_key: str = None
+        ) -> Response:
+        """
+        Versão assíncrona do build_list_response (mesmos parâmetros), usando o ORM assíncrono.
+
+        :return:    Resposta HTTP contendo a lista de alertas com campos adicionais.
+        """
+
+        pagination = None
 
         try:
-            data = cls.get_data_alert(request, alerts)
+            paginated   = cls.pagination.is_requested(request)
+            streamed    = not paginated and ResponseBuilder.is_stream_requested(request)
+
+            cached = None
+            if cache_key and not paginated and not streamed:
+                cached = await sync_to_async(AlertCache.get)(cache_key)
+            else:
+                cache_key = None
+
+            version = None
+            if cached is not None:
+                version, data = cached
+            elif conditional:
+                version = await ConditionalResponse.aget_version(alerts, cls.RELATED_MODELS)
+
+            etag = None
+            if conditional:
+                etag = ConditionalResponse.get_etag(request, version)
+                if ConditionalResponse.is_not_modified(request, etag):
+                    return ConditionalResponse.build_not_modified(etag)
+
+            if streamed:
+                response = ResponseBuilder.build_streaming_response(
+                    ResponseMessages.LIST_ALERTS,
+                    cls.aiter_data_alert(request, alerts)
+                )
+                if etag:
+                    response['ETag'] = etag
+                return response
+
+            if cached is None:
+                if paginated:
+                    alerts, pagination = await cls.pagination.apaginate_queryset(cls.annotate_ntn_fields(alerts), request)
+                else:
+                    alerts = [ alert async for alert in cls.annotate_ntn_fields(alerts) ]
+
+                data = cls.get_data_alert(request, alerts)
+                if cache_key:
+                    await sync_to_async(AlertCache.set)(cache_key, (version, data))
+
+        except PaginationError as err:
+            return ResponseBuilder.build_response(
+                ResponseMessages.ERROR_INVALID_PAGINATION,
+                error={
+                    'code': ResponseErrorCode.ERROR_INVALID_PAGINATION[0],
+                    'message': ResponseErrorCode.ERROR_INVALID_PAGINATION[1],
+                    'error': f'{str(err)}'
+                },
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
 
         except Exception as err:
             return ResponseBuilder.build_response(
                 ResponseMessages.ERROR_LIST_ALERTS,
                 error={
-                    'code': ResponseErrorCode.ERROR_LIST_ALERTS_BY_USER[0],
-                    'message': ResponseErrorCode.ERROR_LIST_ALERTS_BY_USER[1],
+                    'code': error_code[0],
+                    'message': error_code[1],
                     'error': f'{type(err)}'
                 },
                 http_status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-        return ResponseBuilder.build_response(
+        response = ResponseBuilder.build_response(
             ResponseMessages.LIST_ALERTS,
-            data=data
+            data=data,
+            pagination=pagination
+        )
+        if etag:
+            response['ETag'] = etag
+
+        return response
+
+    @staticmethod
+    def get_user_list_cache_key(user_id: str, active_only: bool) -> str:
+        """
+        Retorna a chave (AlertCache) das listagens por usuário.
+
+        :param user_id:     ID do usuário, como recebido na URL.
+        :param active_only: Se a listagem é apenas dos alertas ativos.
+        :return:            Chave da listagem, ou None se o ID não for um inteiro (não usa cache).
+        """
+
+        try:
+            return AlertCache.get_user_list_key(int(user_id), active_only)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def retrieve(request: Request, alert_id: str) -> Response:
+        """
+        Retorna um alerta, lendo do cache quando possível.
+
+        :param request:     Requisição HTTP.
+        :param alert_id:    ID do alerta.
+        :return:            Resposta HTTP com os dados do alerta (mesmo formato do retrieve do DRF).
+        """
+
+        try:
+            cache_key = AlertCache.get_detail_key(int(alert_id))
+        except (TypeError, ValueError):
+            raise Http404
+
+        data = AlertCache.get(cache_key)
+        if data is None:
+            alert = get_object_or_404(Alert, pk=alert_id)
+            data = AlertSerializer(alert, context={'request': request}).data
+            AlertCache.set(cache_key, data)
+
+        return Response(data)
+
+    @staticmethod
+    def cache_stats(request: Request) -> Response:
+        """
+        Retorna os contadores do cache de alertas do worker que atendeu a requisição.
+
+        :param request: Requisição HTTP.
+        :return:        Resposta HTTP com acertos, faltas e invalidações.
+        """
+
+        return ResponseBuilder.build_response(
+            ResponseMessages.ALERT_CACHE_STATS,
+            data=AlertCache.as_dict()
+        )
+
+    @classmethod
+    def list(cls, request: Request) -> Response:
+        """
+        Sobrescreve o método list para incluir campos adicionais nos relacionamentos ManyToMany.
+
+        :param request: Requisição HTTP.
+        :return:        Resposta HTTP contendo a lista de alertas com campos adicionais.
+        """
+
+        alerts = Alert.objects.all()
+        return cls.build_list_response(request, alerts, ResponseErrorCode.ERROR_LIST_ALERTS, conditional=False)
+    
+    @classmethod
+    def list_by_user(cls, request: Request, user_id: int) -> Response:
+        """
+        Listar alerta de um usuário.
+
+        :param request: Requisição HTTP.
+        :param user_id: ID do usuário.
+        :return:        Resposta HTTP contendo a lista de alertas com campos adicionais.
+        """
+
+        alerts = Alert.objects.filter(id_user=user_id)
+        return cls.build_list_response(
+            request, alerts, ResponseErrorCode.ERROR_LIST_ALERTS_BY_USER,
+            cache_key=cls.get_user_list_cache_key(user_id, active_only=False)
         )
     
     @classmethod
@@ -129,24 +409,9 @@ class UpdateAlert:
         """
 
         active_alerts = Alert.objects.filter(id_user=user_id, is_active=True)
-
-        try:
-            data = UpdateAlert.get_data_alert(request, active_alerts)
-
-        except Exception as err:
-            return ResponseBuilder.build_response(
-                ResponseMessages.ERROR_LIST_ALERTS,
-                error={
-                    'code': ResponseErrorCode.ERROR_LIST_ACTIVE_ALERTS_BY_USER[0],
-                    'message': ResponseErrorCode.ERROR_LIST_ACTIVE_ALERTS_BY_USER[1],
-                    'error': f'{type(err)}'
-                },
-                http_status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
-
-        return ResponseBuilder.build_response(
-            ResponseMessages.LIST_ALERTS,
-            data=data
+        return cls.build_list_response(
+            request, active_alerts, ResponseErrorCode.ERROR_LIST_ACTIVE_ALERTS_BY_USER,
+            cache_key=cls.get_user_list_cache_key(user_id, active_only=True)
         )
     
     @classmethod
@@ -160,85 +425,138 @@ class UpdateAlert:
 
         today = datetime.date.today()
         active_alerts = Alert.objects.filter(run=today, is_active=True)
+        return cls.build_list_response(
+            request, active_alerts, ResponseErrorCode.ERROR_LIST_RUN_TODAY,
+            cache_key=AlertCache.get_run_today_key(today)
+        )
 
-        try:
-            data = UpdateAlert.get_data_alert(request, active_alerts)
+    @classmethod
+    async def alist(cls, request: Request) -> Response:
+        """ Versão assíncrona do list. """
 
-        except Exception as err:
-            return ResponseBuilder.build_response(
-                ResponseMessages.ERROR_LIST_ALERTS,
-                error={
-                    'code': ResponseErrorCode.ERROR_LIST_RUN_TODAY[0],
-                    'message': ResponseErrorCode.ERROR_LIST_RUN_TODAY[1],
-                    'error': f'{type(err)}'
-                },
-                http_status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        alerts = Alert.objects.all()
+        return await cls.abuild_list_response(request, alerts, ResponseErrorCode.ERROR_LIST_ALERTS, conditional=False)
 
-        return ResponseBuilder.build_response(
-            ResponseMessages.LIST_ALERTS,
-            data=data
+    @classmethod
+    async def alist_by_user(cls, request: Request, user_id: int) -> Response:
+        """ Versão assíncrona do list_by_user. """
+
+        alerts = Alert.objects.filter(id_user=user_id)
+        return await cls.abuild_list_response(
+            request, alerts, ResponseErrorCode.ERROR_LIST_ALERTS_BY_USER,
+            cache_key=await sync_to_async(cls.get_user_list_cache_key)(user_id, active_only=False)
+        )
+
+    @classmethod
+    async def alist_active_by_user(cls, request: Request, user_id: int) -> Response:
+        """ Versão assíncrona do list_active_by_user. """
+
+        active_alerts = Alert.objects.filter(id_user=user_id, is_active=True)
+        return await cls.abuild_list_response(
+            request, active_alerts, ResponseErrorCode.ERROR_LIST_ACTIVE_ALERTS_BY_USER,
+            cache_key=await sync_to_async(cls.get_user_list_cache_key)(user_id, active_only=True)
         )
 
+    @classmethod
+    async def alist_active_alerts_run_today(cls, request: Request) -> Response:
+        """ Versão assíncrona do list_active_alerts_run_today. """
+
+        today = datetime.date.today()
+        active_alerts = Alert.objects.filter(run=today, is_active=True)
+        return await cls.abuild_list_response(
+            request, active_alerts, ResponseErrorCode.ERROR_LIST_RUN_TODAY,
+            cache_key=await sync_to_async(AlertCache.get_run_today_key)(today)
+        )
+
+    @staticmethod
+    def holds_lease(alert: Alert, lease: str, now: datetime.datetime) -> bool:
+        """
+        Indica se a reserva informada ainda permite avançar o alerta.
+
+        :param alert:   Alerta lido com a linha bloqueada.
+        :param lease:   Token da reserva (LeaseAlert.claim).
+        :param now:     Momento da verificação.
+        :return:        True se o alerta é dessa reserva ou se a reserva atual já expirou.
+        """
+
+        return alert.lease_token == lease or (alert.leased_until is not None and alert.leased_until < now)
+
     @staticmethod
     def update_run(request: Request, alert: Alert) -> Response:
         """
         Atualiza proximo dia a rodar alerta.
 
+        Quando o alerta foi reservado (LeaseAlert.claim), o token da reserva pode ser enviado em
+        `?lease=<token>`: só o dono da reserva (ou qualquer um, se ela já expirou) avança o alerta,
+        e a reserva é liberada em seguida. Sem o token, a reserva não é alterada. O alerta é relido
+        com a linha bloqueada, então duas chamadas concorrentes não avançam o mesmo `run`.
+
         :param request: Request da requisição.
         :param alert:   Objeto a se atualizar.
         :return:        Response do resultado.
         """
 
-        last_run    = alert.run
-        final_date  = alert.final_date
+        lease = request.query_params.get('lease')
 
-        if last_run >= final_date:
-            alert.is_active = False
-            alert.last_run = last_run
-            alert.save()
+        with transaction.atomic():
+            alert = Alert.objects.select_for_update().get(pk=alert.pk)
 
-            serializer = AlertSerializer(alert, context={'request': request})
+            if lease and not UpdateAlert.holds_lease(alert, lease, timezone.now()):
+                return ResponseBuilder.build_response(
+                    ResponseMessages.ERROR_ALERT_UPDATE_RUN,
+                    error={
+                        'code': ResponseErrorCode.ERROR_ALERT_LEASE[0],
+                        'message': ResponseErrorCode.ERROR_ALERT_LEASE[1],
+                    },
+                    http_status=status.HTTP_409_CONFLICT
+                )
 
-            data = serializer.data
-            data = UpdateAlert.get_ntn_fields(alert, data)
+            if lease:
+                alert.leased_until  = None
+                alert.lease_token   = None
 
-            return ResponseBuilder.build_response(
-                ResponseMessages.ALERT_INACTIVE,
-                data=data
-            )
+            last_run    = alert.run
+            final_date  = alert.final_date
 
-        try:
-            next_run = alert.run
-            qte_frequency = alert.qte_frequency
-            type_frequency = alert.type_frequency
-
-            if type_frequency == 'days':
-                next_run += datetime.timedelta(days=qte_frequency)
-            elif type_frequency == 'weeks':
-                next_run += datetime.timedelta(weeks=qte_frequency)
-            elif type_frequency == 'months':
-                next_run += datetime.timedelta(months=qte_frequency)
-            elif type_frequency == 'years':
-                next_run += datetime.timedelta(years=qte_frequency)
-
-            if next_run > final_date:
-                next_run = final_date
-
-            alert.last_run = last_run
-            alert.run = next_run
-            alert.save()
+            if last_run >= final_date:
+                alert.is_active = False
+                alert.last_run = last_run
+                alert.save()
 
-        except Exception as err:
-            return ResponseBuilder.build_response(
-                ResponseMessages.ERROR_ALERT_UPDATE_RUN,
-                error={
-                    'code': ResponseErrorCode.ERROR_ALERT_UPDATE_RUN[0],
-                    'message': ResponseErrorCode.ERROR_ALERT_UPDATE_RUN[1],
-                    'error': f'{type(err)}'
-                },
-                http_status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+                count_alerts_advanced('single', 1)
+
+                serializer = AlertSerializer(alert, context={'request': request})
+
+                data = serializer.data
+                data = UpdateAlert.get_ntn_fields(alert, data)
+
+                return ResponseBuilder.build_response(
+                    ResponseMessages.ALERT_INACTIVE,
+                    data=data
+                )
+
+            try:
+                next_run = AdvanceAlert.add_frequency(alert.run, alert.qte_frequency, alert.type_frequency)
+
+                if next_run > final_date:
+                    next_run = final_date
+
+                alert.last_run = last_run
+                alert.run = next_run
+                alert.save()
+
+                count_alerts_advanced('single', 1)
+
+            except Exception as err:
+                return ResponseBuilder.build_response(
+                    ResponseMessages.ERROR_ALERT_UPDATE_RUN,
+                    error={
+                        'code': ResponseErrorCode.ERROR_ALERT_UPDATE_RUN[0],
+                        'message': ResponseErrorCode.ERROR_ALERT_UPDATE_RUN[1],
+                        'error': f'{type(err)}'
+                    },
+                    http_status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                )
 
         serializer = AlertSerializer(alert, context={'request': request})
 
@@ -273,65 +591,172 @@ class UpdateAlert:
             data=data
         )
 
-    @staticmethod
-    def update_keywords(request: Request, alert: Alert) -> Response:
+    @classmethod
+    def get_ntn_names(cls, field: str, names: list) -> list:
         """
-        Atualiza palavras-chave do alerta.
+        Valida e normaliza os nomes de um campo ManyToMany do alerta.
 
-        :param request: Request da requisição.
-        :param alert:   Objeto a se atualizar.
-        :return:        Response do resultado.
+        :param field:   Campo ManyToMany (`keywords`, `forums` ou `emails`).
+        :param names:   Lista de nomes.
+        :return:        Lista de nomes, em maiúsculo nos campos gravados assim.
         """
 
-        try:
-            nw_keywords = request.data.get('keywords', [])
-            alert.keywords.clear()
+        if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+            raise ValueError(f'{field} deve ser uma lista de textos.')
 
-            CreateAlert.add_keywords(alert, nw_keywords)
+        _, upper = cls.NTN_DIMENSIONS[field]
 
-        except Exception as err:
-            return ResponseBuilder.build_response(
-                ResponseMessages.ERROR_ALERT_UPDATE_KEYWORDS,
-                error={
-                    'code': ResponseErrorCode.ERROR_UPDATE_KEYWORDS[0],
-                    'message': ResponseErrorCode.ERROR_UPDATE_KEYWORDS[1],
-                    'error': f'{type(err)}'
-                },
-                http_status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        return [ name.upper() if upper else name for name in names ]
+
+    @classmethod
+    def get_ntn_data(cls, request: Request, field: str) -> tuple:
+        """
+        Valida o corpo da atualização de um campo ManyToMany, antes de qualquer gravação.
+
+        :param request: Request da requisição.
+        :param field:   Campo ManyToMany.
+        :return:        Tupla (nomes a adicionar, nomes a remover) no PATCH; (nova lista, None) no PUT.
+        """
+
+        if not isinstance(request.data, dict):
+            raise ValueError('O corpo deve ser um objeto.')
+
+        if request.method == 'PATCH':
+            return (
+                cls.get_ntn_names(field, request.data.get('add', [])),
+                cls.get_ntn_names(field, request.data.get('remove', [])),
             )
-        
-        serializer = AlertSerializer(alert, context={'request': request})
 
-        data = serializer.data
-        data = UpdateAlert.get_ntn_fields(alert, data)
+        return cls.get_ntn_names(field, request.data.get(field, [])), None
+
+    @classmethod
+    def get_ntn_ids(cls, field: str, names: list, create: bool = True) -> set:
+        """
+        Resolve os nomes (já normalizados) de um campo ManyToMany do alerta para ids, pelo cache de ids.
+
+        :param field:   Campo ManyToMany (`keywords`, `forums` ou `emails`).
+        :param names:   Lista de nomes (get_ntn_names).
+        :param create:  Se cria os nomes que não existem; se não, ignora-os.
+        :return:        Conjunto de ids.
+        """
+
+        dimension_cache, _ = cls.NTN_DIMENSIONS[field]
+
+        ids = dimension_cache.get_or_create(names) if create else dimension_cache.resolve(names)
+
+        return set(ids.values())
 
-        return ResponseBuilder.build_response(
-            ResponseMessages.ALERT_KEYWORDS_UPDATED,
-            data=data
-        )
-    
     @staticmethod
-    def update_forums(request: Request, alert: Alert) -> Response:
+    def apply_ntn_diff(alert: Alert, field: str, remove_ids: set, add_ids: set):
         """
-        Atualiza fóruns do alerta.
+        Remove e adiciona ids de um campo ManyToMany do alerta (um DELETE e um INSERT).
 
-        :param request: Request da requisição.
-        :param alert:   Objeto a se atualizar.
-        :return:        Response do resultado.
+        :param alert:       Objeto de alerta.
+        :param field:       Campo ManyToMany.
+        :param remove_ids:  Ids a remover.
+        :param add_ids:     Ids a adicionar.
+        """
+
+        related = getattr(alert, field)
+
+        if remove_ids:
+            related.remove(*remove_ids)
+
+        if add_ids:
+            related.add(*add_ids)
+
+    @classmethod
+    def replace_ntn(cls, alert: Alert, field: str, names: list):
+        """
+        Substitui um campo ManyToMany do alerta, aplicando apenas a diferença para o atual.
+
+        :param alert:   Objeto de alerta.
+        :param field:   Campo ManyToMany.
+        :param names:   Nova lista de nomes (get_ntn_names).
+        """
+
+        nw_ids      = cls.get_ntn_ids(field, names)
+        current_ids = set(getattr(alert, field).values_list('id', flat=True))
+
+        cls.apply_ntn_diff(alert, field, current_ids - nw_ids, nw_ids - current_ids)
+
+    @classmethod
+    def patch_ntn(cls, alert: Alert, field: str, add: list, remove: list):
+        """
+        Adiciona e remove nomes de um campo ManyToMany do alerta.
+
+        Nomes a remover que não existem são ignorados; um nome nas duas listas permanece no alerta.
+
+        :param alert:   Objeto de alerta.
+        :param field:   Campo ManyToMany.
+        :param add:     Nomes a adicionar (get_ntn_names).
+        :param remove:  Nomes a remover (get_ntn_names).
+        """
+
+        add_ids     = cls.get_ntn_ids(field, add)
+        remove_ids  = cls.get_ntn_ids(field, remove, create=False)
+
+        cls.apply_ntn_diff(alert, field, remove_ids - add_ids, add_ids)
+
+    @classmethod
+    def update_ntn(
+        cls,
+        request         : Request,
+        alert           : Alert,
+        field           : str,
+        message         : tuple,
+        error_message   : tuple,
+        error_code      : tuple,
+    ) -> Response:
+        """
+        Atualiza um campo ManyToMany do alerta.
+
+        PUT substitui a lista (`{"<campo>": [...]}`) e PATCH adiciona e remove nomes
+        (`{"add": [...], "remove": [...]}`); nos dois casos só a diferença é gravada. O corpo é
+        validado antes de qualquer gravação (400 se inválido). Se a gravação falhar por um id em
+        cache removido em outro worker, ela é refeita uma vez (retry_stale).
+
+        :param request:         Request da requisição.
+        :param alert:           Objeto a se atualizar.
+        :param field:           Campo ManyToMany.
+        :param message:         Mensagem de sucesso.
+        :param error_message:   Mensagem de erro.
+        :param error_code:      Código de erro.
+        :return:                Response do resultado.
         """
 
         try:
-            nw_forums = request.data.get('forums', [])
-            alert.forums.clear()
+            names, remove = cls.get_ntn_data(request, field)
+
+        except Exception as err:
+            return ResponseBuilder.build_response(
+                ResponseMessages.ERROR_GET_REQUEST,
+                error={
+                    'code': ResponseErrorCode.ERROR_GET_REQUEST[0],
+                    'message': ResponseErrorCode.ERROR_GET_REQUEST[1],
+                    'error': f'{str(err)}'
+                },
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        dimension_cache, _ = cls.NTN_DIMENSIONS[field]
 
-            CreateAlert.add_forums(alert, nw_forums)
+        def write():
+            with transaction.atomic():
+                if remove is not None:
+                    cls.patch_ntn(alert, field, names, remove)
+                else:
+                    cls.replace_ntn(alert, field, names)
+
+        try:
+            dimension_cache.retry_stale(names + (remove or []), write)
 
         except Exception as err:
             return ResponseBuilder.build_response(
-                ResponseMessages.ERROR_ALERT_UPDATE_FORUMS,
+                error_message,
                 error={
-                    'code': ResponseErrorCode.ERROR_UPDATE_FORUMS[0],
-                    'message': ResponseErrorCode.ERROR_UPDATE_FORUMS[1],
+                    'code': error_code[0],
+                    'message': error_code[1],
                     'error': f'{type(err)}'
                 },
                 http_status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -343,45 +768,59 @@ class UpdateAlert:
         data = UpdateAlert.get_ntn_fields(alert, data)
 
         return ResponseBuilder.build_response(
-            ResponseMessages.ALERT_FORUMS_UPDATED,
+            message,
             data=data
         )
-    
-    @staticmethod
-    def update_emails(request: Request, alert: Alert) -> Response:
+
+    @classmethod
+    def update_keywords(cls, request: Request, alert: Alert) -> Response:
         """
-        Atualiza emails do alerta.
+        Atualiza palavras-chave do alerta.
 
         :param request: Request da requisição.
         :param alert:   Objeto a se atualizar.
         :return:        Response do resultado.
         """
 
-        try:
-            nw_emails = request.data.get('emails', [])
-            alert.emails.clear()
+        return cls.update_ntn(
+            request, alert, 'keywords',
+            ResponseMessages.ALERT_KEYWORDS_UPDATED,
+            ResponseMessages.ERROR_ALERT_UPDATE_KEYWORDS,
+            ResponseErrorCode.ERROR_UPDATE_KEYWORDS,
+        )
 
-            CreateAlert.add_emails(alert, nw_emails)
+    @classmethod
+    def update_forums(cls, request: Request, alert: Alert) -> Response:
+        """
+        Atualiza fóruns do alerta.
 
-        except Exception as err:
-            return ResponseBuilder.build_response(
-                ResponseMessages.ERROR_ALERT_UPDATE_EMAILS,
-                error={
-                    'code': ResponseErrorCode.ERROR_UPDATE_EMAILS[0],
-                    'message': ResponseErrorCode.ERROR_UPDATE_EMAILS[1],
-                    'error': f'{type(err)}'
-                },
-                http_status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        :param request: Request da requisição.
+        :param alert:   Objeto a se atualizar.
+        :return:        Response do resultado.
+        """
 
-        serializer = AlertSerializer(alert, context={'request': request})
+        return cls.update_ntn(
+            request, alert, 'forums',
+            ResponseMessages.ALERT_FORUMS_UPDATED,
+            ResponseMessages.ERROR_ALERT_UPDATE_FORUMS,
+            ResponseErrorCode.ERROR_UPDATE_FORUMS,
+        )
 
-        data = serializer.data
-        data = UpdateAlert.get_ntn_fields(alert, data)
+    @classmethod
+    def update_emails(cls, request: Request, alert: Alert) -> Response:
+        """
+        Atualiza emails do alerta.
 
-        return ResponseBuilder.build_response(
+        :param request: Request da requisição.
+        :param alert:   Objeto a se atualizar.
+        :return:        Response do resultado.
+        """
+
+        return cls.update_ntn(
+            request, alert, 'emails',
             ResponseMessages.ALERT_EMAILS_UPDATED,
-            data=data
+            ResponseMessages.ERROR_ALERT_UPDATE_EMAILS,
+            ResponseErrorCode.ERROR_UPDATE_EMAILS,
         )
 
     # end: methods
@@ -0,0 +1,162 @@
+"""
+Módulo do cache de ids de fóruns, e-mails e palavras-chave.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+from django.db   import IntegrityError, transaction
+from django.conf import settings
+
+from core.cache.ttl_cache     import TTLCache
+from core.metrics.metrics     import count_cache_requests
+
+from app_alert_param.models import (
+    Forum,
+    Email,
+    Keyword,
+)
+
+
+class DimensionCache:
+    """
+    Cache em memória do processo de nome -> id de uma tabela pequena e quase imutável.
+
+    Resolve vários nomes de uma vez: os que estão em cache não consultam o banco, os demais são
+    buscados em uma única consulta `IN` e, se for para criar, os inexistentes são inseridos em
+    um único `bulk_create(ignore_conflicts=True)`. Alterações e remoções de registros existentes
+    limpam o cache do processo (ver app_alert_param.signals); nos outros workers, as entradas
+    expiram pelo TTL (DIMENSION_CACHE_TTL). Até lá, uma gravação com um id removido falha por
+    integridade: ela descarta os nomes do cache e é refeita uma vez (retry_stale).
+
+    Os ids lidos ou criados dentro de um bloco atômico só entram no cache quando a transação é
+    confirmada (on_commit): se ela for desfeita, ids de registros criados nela não ficam no cache.
+    """
+
+    def __init__(self, model, field: str):
+        """
+        Inicializa o cache.
+
+        :param model:   Model da tabela.
+        :param field:   Campo único com o nome do registro.
+        """
+
+        self.model  = model
+        self.field  = field
+        self.cache  = TTLCache(
+            maxsize = settings.DIMENSION_CACHE_MAX_SIZE,
+            ttl     = settings.DIMENSION_CACHE_TTL,
+        )
+
+    # ini: methods
+
+    def resolve(self, names) -> dict:
+        """
+        Retorna os ids dos nomes que existem no banco.
+
+        :param names:   Nomes a resolver.
+        :return:        Dicionário nome -> id, na ordem recebida, apenas com os nomes existentes.
+        """
+
+        names   = list(dict.fromkeys(names))
+        ids     = dict()
+
+        misses = list()
+        for name in names:
+            cached = self.cache.get(name, None)
+            if cached is None:
+                misses.append(name)
+            else:
+                ids[name] = cached
+
+        count_cache_requests(self.model._meta.model_name, len(names) - len(misses), len(misses))
+
+        if misses:
+            rows = self.model.objects.filter(**{ f'{self.field}__in': misses }).values_list(self.field, 'id')
+            found = dict(rows)
+            ids.update(found)
+
+            # Fora de um bloco atômico, executa na hora
+            transaction.on_commit(lambda: self.store(found))
+
+        return { name: ids[name] for name in names if name in ids }
+
+    def get_or_create(self, names) -> dict:
+        """
+        Retorna os ids dos nomes, criando os que não existem.
+
+        :param names:   Nomes a resolver.
+        :return:        Dicionário nome -> id, na ordem recebida.
+        """
+
+        names   = list(dict.fromkeys(names))
+        ids     = self.resolve(names)
+
+        missing = [ name for name in names if name not in ids ]
+        if missing:
+            self.model.objects.bulk_create(
+                [ self.model(**{ self.field: name }) for name in missing ],
+                ignore_conflicts=True
+            )
+            ids.update(self.resolve(missing))
+
+        return { name: ids[name] for name in names if name in ids }
+
+    def store(self, ids: dict):
+        """
+        Grava ids no cache do processo.
+
+        :param ids: Dicionário nome -> id.
+        """
+
+        for name, id_ in ids.items():
+            self.cache.set(name, id_)
+
+    def forget(self, names):
+        """
+        Descarta nomes do cache do processo.
+
+        :param names:   Nomes a descartar.
+        """
+
+        for name in names:
+            self.cache.delete(name)
+
+    def retry_stale(self, names: list, write):
+        """
+        Executa uma gravação que usa os ids dos nomes e, se ela falhar por integridade (um id em
+        cache de um registro removido em outro worker), descarta os nomes e executa de novo, uma vez.
+
+        A gravação deve resolver os ids e rodar em um bloco atômico próprio, para que a transação
+        externa (se houver) continue utilizável depois da falha.
+
+        :param names:   Nomes (já normalizados) cujos ids a gravação usa.
+        :param write:   Função sem argumentos que resolve os ids e grava.
+        :return:        Retorno da gravação.
+        """
+
+        try:
+            return write()
+
+        except IntegrityError:
+            self.forget(names)
+            return write()
+
+    def clear(self):
+        """ Limpa o cache do processo. """
+
+        self.cache.clear()
+
+    # end: methods
+
+
+# Caches compartilhados por todos os fluxos de criação e ingestão
+forum_cache     = DimensionCache(Forum, 'forum_name')
+email_cache     = DimensionCache(Email, 'email')
+keyword_cache   = DimensionCache(Keyword, 'word')
+
+DIMENSION_CACHES = {
+    Forum   : forum_cache,
+    Email   : email_cache,
+    Keyword : keyword_cache,
+}
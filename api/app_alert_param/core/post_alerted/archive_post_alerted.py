@@ -0,0 +1,351 @@
+"""
+Arquivo para implementação do arquivamento dos posts alertados antigos e da leitura dos arquivados.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import os
+import gzip
+import heapq
+import hashlib
+import datetime
+import itertools
+
+import orjson
+
+from asgiref.sync               import sync_to_async
+from django.conf                import settings
+from django.db                  import transaction
+from django.db.models           import Count, QuerySet
+from django.db.models.functions import TruncMonth
+from django.utils               import timezone
+from rest_framework             import status
+from rest_framework.request     import Request
+from rest_framework.response    import Response
+
+from core.renderers.orjson_renderer             import ORJSONRenderer
+from core.response_utils.response_builder       import ResponseBuilder
+from core.response_utils.response_messages      import ResponseMessages
+from core.response_utils.response_error_code    import ResponseErrorCode
+
+from app_alert_param.models import PostAlerted, PostAlertedArchive
+from app_alert_param.core.post_alerted.get_data_post_alerted    import GetDataPostAlerted
+from app_alert_param.core.post_alerted.partition_post_alerted   import PartitionPostAlerted
+
+
+class ArchiveError(ValueError):
+    """ Erro nos parâmetros da leitura dos posts arquivados. """
+
+
+class ArchivePostAlerted:
+    """
+    Arquivamento dos posts alertados antigos em arquivos JSONL.gz em ARCHIVE_DIR, um por alerta e
+    mês (`<alert_id>/<AAAA-MM>_<data e hora>.jsonl.gz`), com um post por linha no mesmo formato das
+    listagens. Cada arquivo é registrado no manifesto (PostAlertedArchive), indexado por alerta e
+    período, e só então os posts e seus vínculos de palavras-chave são removidos do banco.
+
+    A listagem por alerta lê os arquivados com `?archived=true` (opcionalmente com `date_from` e
+    `date_to`), em streaming, sem devolvê-los ao banco.
+    """
+
+    ARCHIVED_QUERY_PARAM    = 'archived'
+    DATE_FROM_QUERY_PARAM   = 'date_from'
+    DATE_TO_QUERY_PARAM     = 'date_to'
+
+    # Parâmetros das listagens do banco que não se aplicam aos arquivados
+    UNSUPPORTED_QUERY_PARAMS = ('cursor', 'page_size', 'fields', 'layout')
+
+    # Posts removidos do banco por DELETE, depois de gravado o arquivo
+    DELETE_CHUNK_SIZE = 5000
+
+    # ini: methods
+
+    @staticmethod
+    def _get_full_path(path: str) -> str:
+        """ Retorna o caminho absoluto de um arquivo do manifesto (relativo a ARCHIVE_DIR). """
+
+        return os.path.join(settings.ARCHIVE_DIR, path)
+
+    @classmethod
+    def get_groups(cls, before: datetime.date) -> QuerySet:
+        """
+        Retorna os grupos (alerta, mês) com posts anteriores à data.
+
+        :param before:  Data de corte (posts com `date` anterior são arquivados).
+        :return:        QuerySet de tuplas (id do alerta, primeiro dia do mês, quantidade de posts).
+        """
+
+        return (
+            PostAlerted.objects
+                .filter(date__lt=before)
+                .annotate(month=TruncMonth('date'))
+                .values_list('alert_id', 'month')
+                .annotate(posts=Count('id'))
+                .order_by('alert_id', 'month')
+        )
+
+    @classmethod
+    def archive(cls, before: datetime.date) -> tuple:
+        """
+        Arquiva os posts alertados anteriores à data, um arquivo por alerta e mês.
+
+        :param before:  Data de corte (posts com `date` anterior são arquivados).
+        :return:        Tupla (posts arquivados, arquivos gravados).
+        """
+
+        posts = files = 0
+        for alert_id, month, _ in cls.get_groups(before):
+            archived = cls._archive_group(alert_id, month, before)
+            if archived:
+                posts += archived
+                files += 1
+
+        return posts, files
+
+    @classmethod
+    def _archive_group(cls, alert_id: int, month: datetime.date, before: datetime.date) -> int:
+        """
+        Grava os posts de um alerta em um mês, registra o arquivo no manifesto e remove os posts do banco.
+
+        Os posts são removidos pelos ids gravados: um post do mesmo período criado durante a
+        gravação fica no banco e vai para o arquivo da próxima execução.
+
+        :param alert_id:    Id do alerta.
+        :param month:       Primeiro dia do mês.
+        :param before:      Data de corte.
+        :return:            Quantidade de posts arquivados.
+        """
+
+        fieldset    = GetDataPostAlerted.fieldset
+        fields      = list(fieldset.fields)
+        plan        = fieldset.get_plan(fields)
+
+        end         = min(PartitionPostAlerted.get_month(month, 1), before)
+        queryset    = PostAlerted.objects.filter(alert_id=alert_id, date__gte=month, date__lt=end).order_by('date', 'id')
+
+        path        = os.path.join(str(alert_id), f'{month:%Y-%m}_{timezone.now():%Y%m%d%H%M%S%f}.jsonl.gz')
+        full_path   = cls._get_full_path(path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+
+        ids, dates = list(), list()
+        try:
+            with open(f'{full_path}.tmp', 'wb') as file:
+                with gzip.GzipFile(fileobj=file, mode='wb') as archive:
+                    for row in fieldset.get_queryset(queryset, fields).iterator(chunk_size=GetDataPostAlerted.STREAM_CHUNK_SIZE):
+                        archive.write(ORJSONRenderer.dumps(fieldset.get_row(row, plan)) + b'\n')
+                        ids.append(row['id'])
+                        dates.append(row['date'])
+
+                file.flush()
+                os.fsync(file.fileno())
+
+        except BaseException:
+            os.remove(f'{full_path}.tmp')
+            raise
+
+        if not ids:
+            os.remove(f'{full_path}.tmp')
+            return 0
+
+        os.replace(f'{full_path}.tmp', full_path)
+
+        sha256 = hashlib.sha256()
+        with open(full_path, 'rb') as file:
+            for block in iter(lambda: file.read(1024 * 1024), b''):
+                sha256.update(block)
+
+        try:
+            with transaction.atomic():
+                PostAlertedArchive.objects.create(
+                    alert_id    = alert_id,
+                    date_start  = min(dates),
+                    date_end    = max(dates),
+                    path        = path,
+                    posts       = len(ids),
+                    size        = os.path.getsize(full_path),
+                    sha256      = sha256.hexdigest(),
+                )
+
+                for index in range(0, len(ids), cls.DELETE_CHUNK_SIZE):
+                    PostAlerted.objects.filter(id__in=ids[index:index + cls.DELETE_CHUNK_SIZE]).delete()
+
+        # Sem registro no manifesto, o arquivo não seria lido; os posts seguem no banco
+        except BaseException:
+            os.remove(full_path)
+            raise
+
+        return len(ids)
+
+    @classmethod
+    def is_requested(cls, request: Request) -> bool:
+        """ Indica se a requisição pediu os posts arquivados (`?archived=true`). """
+
+        return request.query_params.get(cls.ARCHIVED_QUERY_PARAM, '').lower() in ('1', 'true')
+
+    @classmethod
+    def get_date_range(cls, request: Request) -> tuple:
+        """
+        Valida os parâmetros da leitura dos arquivados.
+
+        :param request: Requisição HTTP.
+        :return:        Tupla (data inicial ou None, data final ou None).
+        """
+
+        unsupported = [ param for param in cls.UNSUPPORTED_QUERY_PARAMS if param in request.query_params ]
+        if unsupported:
+            raise ArchiveError(f'{", ".join(unsupported)} não se aplica(m) aos posts arquivados.')
+
+        dates = list()
+        for param in (cls.DATE_FROM_QUERY_PARAM, cls.DATE_TO_QUERY_PARAM):
+            value = request.query_params.get(param)
+            try:
+                dates.append(datetime.date.fromisoformat(value) if value else None)
+            except ValueError:
+                raise ArchiveError(f'{param} deve estar no formato AAAA-MM-DD.')
+
+        return tuple(dates)
+
+    @staticmethod
+    def get_archives(alert_id: int, date_from: datetime.date, date_to: datetime.date) -> QuerySet:
+        """
+        Retorna, pelo manifesto, os arquivos de um alerta que cobrem o período.
+
+        :param alert_id:    Id do alerta.
+        :param date_from:   Data inicial (ou None).
+        :param date_to:     Data final (ou None).
+        :return:            QuerySet dos arquivos, em ordem de data.
+        """
+
+        archives = PostAlertedArchive.objects.filter(alert_id=alert_id)
+        if date_from:
+            archives = archives.filter(date_end__gte=date_from)
+        if date_to:
+            archives = archives.filter(date_start__lte=date_to)
+
+        return archives.order_by('date_start', 'id')
+
+    @classmethod
+    def check_archives(cls, archives: list):
+        """
+        Verifica se os arquivos do manifesto existem, antes de iniciar o streaming (depois do início,
+        um erro não pode mais mudar o status da resposta).
+
+        :param archives:    Arquivos do manifesto.
+        """
+
+        missing = [ archive.path for archive in archives if not os.path.isfile(cls._get_full_path(archive.path)) ]
+        if missing:
+            raise FileNotFoundError(f'Arquivos do manifesto não encontrados em {settings.ARCHIVE_DIR}: {", ".join(missing)}')
+
+    @classmethod
+    def read_archive(cls, archive: PostAlertedArchive, date_from: datetime.date, date_to: datetime.date) -> list:
+        """
+        Lê os posts de um arquivo que estão no período.
+
+        :param archive:     Arquivo do manifesto.
+        :param date_from:   Data inicial (ou None).
+        :param date_to:     Data final (ou None).
+        :return:            Posts do arquivo, em ordem de (date, id).
+        """
+
+        start   = date_from.isoformat() if date_from else ''
+        end     = date_to.isoformat() if date_to else '9999-12-31'
+
+        with gzip.open(cls._get_full_path(archive.path), 'rb') as file:
+            posts = [ orjson.loads(line) for line in file ]
+
+        return [ post for post in posts if start <= post['date'] <= end ]
+
+    @classmethod
+    def read_month(cls, archives: list, date_from: datetime.date, date_to: datetime.date) -> list:
+        """
+        Lê os arquivos de um mesmo mês, intercalando os posts em ordem de (date, id).
+
+        Um mês pode ter mais de um arquivo, quando posts com datas antigas chegam depois do arquivamento.
+        """
+
+        return list(heapq.merge(
+            *( cls.read_archive(archive, date_from, date_to) for archive in archives ),
+            key=lambda post: (post['date'], post['id'])
+        ))
+
+    @classmethod
+    def iter_posts(cls, archives: list, date_from: datetime.date, date_to: datetime.date):
+        """ Gera os posts arquivados, mês a mês, em ordem de (date, id). """
+
+        for _, month in itertools.groupby(archives, key=lambda archive: archive.date_start.replace(day=1)):
+            yield from cls.read_month(list(month), date_from, date_to)
+
+    @classmethod
+    async def aiter_posts(cls, archives: list, date_from: datetime.date, date_to: datetime.date):
+        """ Versão assíncrona do iter_posts: cada mês é lido em uma thread, sem bloquear o event loop. """
+
+        for _, month in itertools.groupby(archives, key=lambda archive: archive.date_start.replace(day=1)):
+            for post in await sync_to_async(cls.read_month)(list(month), date_from, date_to):
+                yield post
+
+    @staticmethod
+    def _build_error_response(err: Exception) -> Response:
+        """ Monta a resposta de erro da listagem dos arquivados. """
+
+        if isinstance(err, ArchiveError):
+            return ResponseBuilder.build_response(
+                ResponseMessages.ERROR_INVALID_ARCHIVED,
+                error={
+                    'code': ResponseErrorCode.ERROR_INVALID_ARCHIVED[0],
+                    'message': ResponseErrorCode.ERROR_INVALID_ARCHIVED[1],
+                    'error': f'{str(err)}'
+                },
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return ResponseBuilder.build_response(
+            ResponseMessages.ERROR_LIST_POSTS_ALERTED,
+            error={
+                'code': ResponseErrorCode.ERROR_LIST_POSTS_ALERTED_BY_ALERT[0],
+                'message': ResponseErrorCode.ERROR_LIST_POSTS_ALERTED_BY_ALERT[1],
+                'error': f'{type(err)}'
+            },
+            http_status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+    @classmethod
+    def list_by_alert(cls, request: Request, alert_id: int) -> Response:
+        """
+        Lista, em streaming, os posts arquivados de um alerta.
+
+        :param request:     Requisição HTTP.
+        :param alert_id:    ID do alerta.
+        :return:            Resposta HTTP contendo os posts arquivados do alerta.
+        """
+
+        try:
+            date_from, date_to  = cls.get_date_range(request)
+            archives            = list(cls.get_archives(alert_id, date_from, date_to))
+            cls.check_archives(archives)
+
+        except Exception as err:
+            return cls._build_error_response(err)
+
+        return ResponseBuilder.build_streaming_response(
+            ResponseMessages.LIST_POSTS_ALERTED, cls.iter_posts(archives, date_from, date_to)
+        )
+
+    @classmethod
+    async def alist_by_alert(cls, request: Request, alert_id: int) -> Response:
+        """ Versão assíncrona do list_by_alert. """
+
+        try:
+            date_from, date_to  = cls.get_date_range(request)
+            archives            = [ archive async for archive in cls.get_archives(alert_id, date_from, date_to) ]
+            await sync_to_async(cls.check_archives)(archives)
+
+        except Exception as err:
+            return cls._build_error_response(err)
+
+        return ResponseBuilder.build_streaming_response(
+            ResponseMessages.LIST_POSTS_ALERTED, cls.aiter_posts(archives, date_from, date_to)
+        )
+
+    # end: methods
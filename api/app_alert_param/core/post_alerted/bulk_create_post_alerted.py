@@ -0,0 +1,359 @@
+"""
+Módulo para classe de criação em lote de registros de posts alertados.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+from django.db                  import IntegrityError, transaction
+from rest_framework             import status
+from rest_framework.request     import Request
+from rest_framework.response    import Response
+
+from core.metrics.metrics                    import count_posts_ingested
+from core.response_utils.response_builder    import ResponseBuilder
+from core.response_utils.response_messages   import ResponseMessages
+from core.response_utils.response_error_code import ResponseErrorCode
+
+from app_alert_param.core.dimension.dimension_cache          import forum_cache, keyword_cache
+from app_alert_param.core.post_alerted.create_post_alerted  import CreatePostAlerted
+
+from app_alert_param.models import (
+    Alert,
+    Forum,
+    Keyword,
+    PostAlerted,
+)
+
+
+class BulkCreatePostAlerted:
+    """ Classe para criação em lote de registros de posts alertados. """
+
+    # Quantidade de linhas por INSERT no bulk_create
+    BATCH_SIZE = 1000
+
+    # Campos NOT NULL que chegam ao INSERT sem conversão que rejeite nulos
+    REQUIRED_FIELDS = ( 'id_post', 'title', 'description', 'date' )
+
+    # Campos de texto: outros tipos (ex.: dict, list) não são aceitos pelo driver do banco
+    TEXT_FIELDS = ( 'title', 'description' )
+
+    # ini: methods
+
+    @staticmethod
+    def get_item_error(index: int, error_code: tuple, err: Exception, **extra) -> dict:
+        """
+        Monta o resultado de erro de um item do lote.
+
+        :param index:       int - Posição do item no lote.
+        :param error_code:  tuple - Código de erro (ResponseErrorCode).
+        :param err:         Exception - Exceção que originou o erro.
+        :return:            dict - Resultado do item.
+        """
+
+        return {
+            'index'     : index,
+            'status'    : 'error',
+            'error'     : {
+                'code'      : error_code[0],
+                'message'   : error_code[1],
+                **extra,
+                'error'     : f'{type(err)}',
+            },
+        }
+
+    @classmethod
+    def get_post_fields(cls, data: dict) -> dict:
+        """
+        Valida os campos de um item do lote, com as mesmas regras do CreatePostAlerted.create.
+
+        Os campos que só seriam validados pelo banco são convertidos aqui, para que um item
+        inválido não derrube o INSERT do lote inteiro: o `id_post` precisa caber no inteiro do
+        banco e título e descrição precisam ser texto. Campos obrigatórios nulos são tratados
+        como não informados (KeyError).
+
+        :param data:    dict - Dados do post alertado.
+        :return:        dict - Campos do post alertado.
+        """
+
+        fields = CreatePostAlerted.get_post_fields(data)
+
+        id_post = PostAlerted._meta.get_field('id_post')
+        fields['id_post']   = id_post.to_python(fields['id_post'])
+        fields['date']      = PostAlerted._meta.get_field('date').to_python(fields['date'])
+
+        for name in cls.REQUIRED_FIELDS:
+            if fields[name] is None:
+                raise KeyError(name)
+
+        # Limites do IntegerField no banco (ValidationError fora do intervalo)
+        id_post.run_validators(fields['id_post'])
+
+        for name in cls.TEXT_FIELDS:
+            if not isinstance(fields[name], str):
+                raise TypeError(f'O campo {name} deve ser texto.')
+
+        max_length = PostAlerted._meta.get_field('title').max_length
+        if len(fields['title']) > max_length:
+            raise ValueError(f'Título ultrapassa {max_length} caracteres.')
+
+        return fields
+
+    @classmethod
+    def get_to_create(cls, valid: list, results: list, offset: int) -> tuple:
+        """
+        Resolve alertas, fóruns e palavras-chave dos itens válidos e separa os que podem ser inseridos.
+
+        Alertas são resolvidos com uma consulta, fóruns e palavras-chave pelo cache de ids (uma
+        consulta por tabela apenas para os nomes fora do cache). Os itens com alerta, fórum ou
+        palavra-chave inexistente recebem o erro em `results`.
+
+        :param valid:   list - Tuplas (índice, campos) dos itens válidos.
+        :param results: list - Resultado de cada item do lote.
+        :param offset:  int - Deslocamento somado ao índice de cada item nos resultados.
+        :return:        tuple - (tuplas (índice, campos) a inserir, fórum -> id, palavra-chave -> id).
+        """
+
+        alert_ids = set(
+            Alert.objects.filter(id__in={ fields['alert'] for _, fields in valid })
+            .values_list('id', flat=True)
+        )
+        forums      = forum_cache.resolve(fields['forum'] for _, fields in valid)
+        keywords    = keyword_cache.resolve(
+            keyword for _, fields in valid for keyword in fields['keywords_found']
+        )
+
+        to_create = list()
+        for index, fields in valid:
+            if fields['alert'] not in alert_ids:
+                results[index] = cls.get_item_error(
+                    offset + index, ResponseErrorCode.ERROR_ALERT_NOT_FOUND, Alert.DoesNotExist()
+                )
+                continue
+
+            if fields['forum'] not in forums:
+                results[index] = cls.get_item_error(
+                    offset + index, ResponseErrorCode.ERROR_FORUM_NOT_FOUND, Forum.DoesNotExist()
+                )
+                continue
+
+            missing_keywords = [ keyword for keyword in fields['keywords_found'] if keyword not in keywords ]
+            if missing_keywords:
+                results[index] = cls.get_item_error(
+                    offset + index, ResponseErrorCode.ERROR_ADD_KEYWORD, Keyword.DoesNotExist(),
+                    missing=missing_keywords
+                )
+                continue
+
+            to_create.append(( index, fields ))
+
+        return to_create, forums, keywords
+
+    @classmethod
+    def insert_posts_alerted(cls, to_create: list, forums: dict, keywords: dict) -> list:
+        """
+        Insere os posts com bulk_create e a tabela de palavras-chave encontradas em um único INSERT.
+
+        :param to_create:   list - Tuplas (índice, campos) a inserir.
+        :param forums:      dict - Fórum -> id.
+        :param keywords:    dict - Palavra-chave -> id.
+        :return:            list - Posts alertados criados, na ordem de `to_create`.
+        """
+
+        with transaction.atomic():
+            posts_alerted = PostAlerted.objects.bulk_create(
+                [
+                    PostAlerted(
+                        id_post     = fields['id_post'],
+                        title       = fields['title'],
+                        description = fields['description'],
+                        alert_id    = fields['alert'],
+                        forum_id    = forums[fields['forum']],
+                        relevance   = fields['relevance'],
+                        date        = fields['date'],
+                    )
+                    for _, fields in to_create
+                ],
+                batch_size=cls.BATCH_SIZE
+            )
+
+            KeywordFound = PostAlerted.keywords_found.through
+            KeywordFound.objects.bulk_create(
+                [
+                    KeywordFound(postalerted_id=post_alerted.id, keyword_id=keywords[keyword])
+                    for post_alerted, (_, fields) in zip(posts_alerted, to_create)
+                    for keyword in dict.fromkeys(fields['keywords_found'])
+                ],
+                batch_size=cls.BATCH_SIZE
+            )
+
+        return posts_alerted
+
+    @classmethod
+    def insert_each(cls, to_create: list, forums: dict, keywords: dict, results: list, offset: int) -> tuple:
+        """
+        Insere os posts um a um, cada um em sua transação (savepoint, dentro de outra transação),
+        depois de o INSERT do lote falhar por um item que a validação não rejeitou. Só os itens que
+        o banco rejeitar recebem o erro em `results`.
+
+        :param to_create:   list - Tuplas (índice, campos) a inserir.
+        :param forums:      dict - Fórum -> id.
+        :param keywords:    dict - Palavra-chave -> id.
+        :param results:     list - Resultado de cada item do lote.
+        :param offset:      int - Deslocamento somado ao índice de cada item nos resultados.
+        :return:            tuple - (tuplas (índice, campos) inseridas, posts alertados criados).
+        """
+
+        created         = list()
+        posts_alerted   = list()
+        for index, fields in to_create:
+            try:
+                posts_alerted += cls.insert_posts_alerted([ ( index, fields ) ], forums, keywords)
+                created.append(( index, fields ))
+
+            except Exception as err:
+                results[index] = cls.get_item_error(
+                    offset + index, ResponseErrorCode.ERROR_CREATE_POST_ALERTED, err
+                )
+
+        return created, posts_alerted
+
+    @classmethod
+    def create_posts_alerted(cls, posts: list, offset: int = 0) -> list:
+        """
+        Valida, resolve e insere um lote de posts alertados.
+
+        Se o INSERT falhar por integridade (um id em cache de fórum ou palavra-chave removido em
+        outro worker, ou um alerta removido no meio do lote), os nomes do lote são descartados do
+        cache e o lote é resolvido e inserido de novo, uma vez. Se falhar por outro erro do banco,
+        os posts são inseridos um a um e só os rejeitados recebem o erro (insert_each).
+
+        :param posts:   list - Lista de dicionários com os dados dos posts.
+        :param offset:  int - Deslocamento somado ao índice de cada item nos resultados.
+        :return:        list - Resultado de cada item, na ordem do lote.
+        """
+
+        results = [ None ] * len(posts)
+        valid   = list()
+
+        for index, data in enumerate(posts):
+            try:
+                valid.append(( index, cls.get_post_fields(data) ))
+
+            except KeyError as err:
+                results[index] = cls.get_item_error(
+                    offset + index, ResponseErrorCode.ERROR_MISSING_FIELDS, err, missing=f'{err}'
+                )
+
+            except Exception as err:
+                results[index] = cls.get_item_error(
+                    offset + index, ResponseErrorCode.ERROR_GET_REQUEST, err
+                )
+
+        for retry in (True, False):
+            to_create, forums, keywords = cls.get_to_create(valid, results, offset)
+            if not to_create:
+                return results
+
+            try:
+                posts_alerted = cls.insert_posts_alerted(to_create, forums, keywords)
+                break
+
+            except IntegrityError as err:
+                if retry:
+                    forum_cache.forget(forums)
+                    keyword_cache.forget(keywords)
+                    continue
+
+                error = err
+
+            except Exception:
+                to_create, posts_alerted = cls.insert_each(to_create, forums, keywords, results, offset)
+                break
+
+            for index, _ in to_create:
+                results[index] = cls.get_item_error(
+                    offset + index, ResponseErrorCode.ERROR_CREATE_POST_ALERTED, error
+                )
+            return results
+
+        count_posts_ingested('batch', len(posts_alerted))
+
+        for post_alerted, (index, fields) in zip(posts_alerted, to_create):
+            results[index] = {
+                'index'     : offset + index,
+                'status'    : 'success',
+                'data'      : {
+                    'id'            : post_alerted.id,
+
+                    'alert'         : fields['alert'],
+                    'keywords_found': list(dict.fromkeys(fields['keywords_found'])),
+                    'forum'         : fields['forum'],
+                    'relevance'     : fields['relevance'],
+
+                    'id_post'       : fields['id_post'],
+                    'title'         : fields['title'],
+                    'description'   : fields['description'],
+                    'date'          : fields['date'],
+                },
+            }
+
+        return results
+
+    @classmethod
+    def create(cls, request: Request) -> Response:
+        """
+        Método para criação em lote de registros de posts alertados.
+
+        :param request: Request - Requisição HTTP, com uma lista de posts no corpo.
+        :return:        Response - Resposta HTTP com o resultado de cada item do lote.
+        """
+
+        try:
+            posts = request.data
+
+        except Exception as err:
+            return ResponseBuilder.build_response(
+                ResponseMessages.ERROR_EMPTY_BODY,
+
+                error={
+                    'code'      : ResponseErrorCode.ERROR_EMPTY_BODY[0],
+                    'message'   : ResponseErrorCode.ERROR_EMPTY_BODY[1],
+                    'error'     : f'{type(err)}',
+                },
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if type(posts) != list or not posts:
+            return ResponseBuilder.build_response(
+                ResponseMessages.ERROR_GET_REQUEST,
+
+                error={
+                    'code'      : ResponseErrorCode.ERROR_INVALID_BULK_BODY[0],
+                    'message'   : ResponseErrorCode.ERROR_INVALID_BULK_BODY[1],
+                },
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        results = cls.create_posts_alerted(posts)
+        created = sum(1 for result in results if result['status'] == 'success')
+
+        if created == len(results):
+            http_status = status.HTTP_201_CREATED
+        elif created:
+            http_status = status.HTTP_207_MULTI_STATUS
+        else:
+            http_status = status.HTTP_400_BAD_REQUEST
+
+        return ResponseBuilder.build_response(
+            ResponseMessages.SUCCESS_BULK_POST_ALERTED if created else ResponseMessages.ERROR_BULK_POST_ALERTED,
+
+            data={
+                'created'   : created,
+                'failed'    : len(results) - created,
+                'results'   : results,
+            },
+            http_status=http_status
+        )
+
+    # end: methods
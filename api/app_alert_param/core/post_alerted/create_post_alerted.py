@@ -5,18 +5,21 @@ Módulo para classe de criação de registro de post alertado.
 :created at:    2025-02-10
 """
 
+from django.db                  import transaction
 from rest_framework             import status
 from rest_framework.request     import Request
 from rest_framework.response    import Response
 
+from core.metrics.metrics                    import count_posts_ingested
 from core.response_utils.response_builder    import ResponseBuilder
 from core.response_utils.response_messages   import ResponseMessages
 from core.response_utils.response_error_code import ResponseErrorCode
 
+from app_alert_param.core.dimension.dimension_cache import forum_cache, keyword_cache
+
 from app_alert_param.models import (
     Alert,
     Forum,
-    Keyword,
     PostAlerted,
 )
 
@@ -35,14 +38,73 @@ class CreatePostAlerted:
         :param keywords_found:  list - Lista de palavras-chave encontradas.
         """
 
-        for keyword in keywords_found:
-            try:
-                keyword_obj = Keyword.objects.get(word=str(keyword).upper())
-                post_alerted.keywords_found.add(keyword_obj)
+        keywords = [ str(keyword).upper() for keyword in keywords_found ]
+
+        def add():
+            keyword_ids = keyword_cache.resolve(keywords)
+
+            missing = [ keyword for keyword in keywords if keyword not in keyword_ids ]
+            if missing:
+                raise ValueError(f'Erro ao adicionar palavras-chave {missing}.')
+
+            with transaction.atomic():
+                post_alerted.keywords_found.add(*keyword_ids.values())
+
+        keyword_cache.retry_stale(keywords, add)
+
+    @staticmethod
+    def create_post(fields: dict, alert: Alert) -> PostAlerted:
+        """
+        Cria o post alertado, resolvendo o fórum pelo cache de ids.
+
+        :param fields:  dict - Campos do post alertado (get_post_fields).
+        :param alert:   Alert - Alerta do post.
+        :return:        PostAlerted - Post alertado criado.
+        """
+
+        forum_id = forum_cache.resolve([ fields['forum'] ]).get(fields['forum'])
+        if forum_id is None:
+            raise Forum.DoesNotExist(f"Fórum {fields['forum']} não encontrado.")
+
+        with transaction.atomic():
+            return PostAlerted.objects.create(
+                id_post     = fields['id_post'],
+                title       = fields['title'],
+                description = fields['description'],
+                alert       = alert,
+                forum       = Forum(id=forum_id, forum_name=fields['forum']),
+                relevance   = fields['relevance'],
+                date        = fields['date'],
+            )
+
+    @staticmethod
+    def get_post_fields(data: dict) -> dict:
+        """
+        Extrai e normaliza os campos de um post alertado a partir dos dados da requisição.
+
+        :param data:    dict - Dados do post alertado.
+        :return:        dict - Campos do post alertado, com fórum e palavras-chave em maiúsculo.
+        """
+
+        if type(data['keywords_found']) == list:
+            keywords_found = data['keywords_found']
+        else:
+            keywords_found = [data['keywords_found']]
+
+        return {
+            'keywords_found': [ str(keyword).upper() for keyword in keywords_found ],
+
+            'date'          : data['date'],
+            'title'         : data['title'],
+            'id_post'       : data['id_post'],
+            'description'   : data['description'],
+
+            'relevance'     : float(data['relevance']),
+
+            'alert'         : int(data['alert']),
+            'forum'         : data['forum'].upper(),
+        }
 
-            except:
-                raise ValueError(f'Erro ao adicionar palavras-chave {keyword}.')
-            
     @staticmethod
     def get_response_data(post_alerted: PostAlerted) -> dict:
         """
@@ -92,20 +154,12 @@ class CreatePostAlerted:
             )
 
         try:
-            if type(data['keywords_found']) == list:
-                keywords_found = data['keywords_found']
-            else:
-                keywords_found = [data['keywords_found']]
-
-            date            = data['date']
-            title           = data['title']
-            id_post         = data['id_post']
-            description     = data['description']
+            fields          = CreatePostAlerted.get_post_fields(data)
+            keywords_found  = fields['keywords_found']
 
-            relevance       = float(data['relevance'])
-
-            alert           = Alert.objects.get(id=int(data['alert']))
-            forum           = Forum.objects.get(forum_name=data['forum'].upper())
+            alert           = Alert.objects.get(id=fields['alert'])
+            if forum_cache.resolve([ fields['forum'] ]).get(fields['forum']) is None:
+                raise Forum.DoesNotExist(f"Fórum {fields['forum']} não encontrado.")
 
         except KeyError as err:
             return ResponseBuilder.build_response(
@@ -135,19 +189,13 @@ class CreatePostAlerted:
             )
 
         try:
-            post_alerted = PostAlerted.objects.create(
-                id_post=id_post,
-                title=title,
-                description=description,
-                alert=alert,
-                forum=forum,
-                relevance=relevance,
-                date=date
+            post_alerted = forum_cache.retry_stale(
+                [ fields['forum'] ], lambda: CreatePostAlerted.create_post(fields, alert)
             )
 
             post_alerted.keywords_found.set([])
 
-        except:
+        except Exception as err:
             return ResponseBuilder.build_response(
                 ResponseMessages.ERROR_CREATE_POST_ALERTED,
 
@@ -178,6 +226,8 @@ class CreatePostAlerted:
                 http_status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+        count_posts_ingested('single', 1)
+
         return ResponseBuilder.build_response(
             ResponseMessages.SUCCESS_CREATE_POST_ALERTED,
 
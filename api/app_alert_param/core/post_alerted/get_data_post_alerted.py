@@ -5,101 +5,382 @@ Arquivo para implementação dos métodos para recuperar informações de post a
 :created at:    2025-07-18
 """
 
-from rest_framework             import status
-from rest_framework.request     import Request
-from rest_framework.response    import Response
+from django.db.models                       import OuterRef, QuerySet
+from django.contrib.postgres.expressions    import ArraySubquery
+from rest_framework                         import status, serializers
+from rest_framework.request                 import Request
+from rest_framework.response                import Response
 
-from core.response_utils.response_builder    import ResponseBuilder
-from core.response_utils.response_messages   import ResponseMessages
-from core.response_utils.response_error_code import ResponseErrorCode
+from core.pagination.keyset_pagination        import KeysetPagination, PaginationError
+from core.response_utils.conditional_response import ConditionalResponse
+from core.response_utils.response_builder     import ResponseBuilder
+from core.response_utils.response_messages    import ResponseMessages
+from core.response_utils.response_error_code  import ResponseErrorCode
+from core.response_utils.sparse_fieldset      import SparseFieldset, SparseFieldsetError
 
-from app_alert_param.models         import PostAlerted
+from app_alert_param.models         import Forum, Keyword, PostAlerted
 from app_alert_param.serializers    import PostAlertedSerializer
 
 
 class GetDataPostAlerted:
     """ Classe responsável por obter os dados de posts alertados. """
 
+    # Paginação por cursor (opcional) das listagens, do post mais antigo para o mais recente
+    pagination = KeysetPagination(ordering=('date', 'id'))
+
+    # Tabelas cujos dados aparecem nas listagens, consideradas na ETag
+    RELATED_MODELS = (Forum, Keyword)
+
+    # Quantidade de posts buscados por consulta (bloco pela chave), no modo streaming
+    STREAM_CHUNK_SIZE = 2000
+
+    # Campos de `?fields=` e do formato colunar (`?layout=columnar`), na ordem do serializer
+    fieldset = SparseFieldset(
+        fields={
+            'id'            : 'id',
+            'created_at'    : 'created_at',
+            'updated_at'    : 'updated_at',
+            'id_post'       : 'id_post',
+            'title'         : 'title',
+            'description'   : 'description',
+            'relevance'     : 'relevance',
+            'date'          : 'date',
+            'alert'         : 'alert_id',
+            'forum'         : 'forum__forum_name',
+            'keywords_found': ArraySubquery(
+                PostAlerted.keywords_found.through.objects
+                    .filter(postalerted_id=OuterRef('pk'))
+                    .order_by('id')
+                    .values('keyword__word')
+            ),
+        },
+        converters={
+            'created_at'    : serializers.DateTimeField().to_representation,
+            'updated_at'    : serializers.DateTimeField().to_representation,
+        },
+        required=pagination.ordering,
+    )
+
     # ini: methods
 
     @staticmethod
-    def _get_data_post_alerted(request: Request, posts_alerted: PostAlerted) -> list:
+    def _with_related(posts_alerted: QuerySet) -> QuerySet:
+        """
+        Carrega fórum e palavras-chave encontradas junto com os posts, evitando consultas por post.
+
+        :param posts_alerted:   QuerySet contendo os posts alertados.
+        :return:                QuerySet com os relacionamentos carregados.
+        """
+
+        return posts_alerted.select_related('forum').prefetch_related('keywords_found')
+
+    @staticmethod
+    def _get_post_alerted_data(request: Request, post_alerted: PostAlerted) -> dict:
+        """
+        Retorna os dados de um post alertado.
+
+        :param request:         Requisição HTTP.
+        :param post_alerted:    Post alertado.
+        :return:                Dados do post alertado.
+        """
+
+        post_alerted_data = PostAlertedSerializer(post_alerted, context={'request': request}).data
+        post_alerted_data['keywords_found'] = [ keyword.word for keyword in post_alerted.keywords_found.all() ]
+        post_alerted_data['forum'] = post_alerted.forum.forum_name
+        return post_alerted_data
+
+    @classmethod
+    def _get_data_post_alerted(cls, request: Request, posts_alerted: PostAlerted, plan: list = None, columnar: bool = False):
         """
         Retorna os dados dos posts alertados.
 
+        :param request:         Requisição HTTP.
+        :param posts_alerted:   QuerySet contendo os posts alertados (linhas do `.values()`, com `plan`).
+        :param plan:            Campos pedidos em `?fields=` (SparseFieldset.get_plan), se houver.
+        :param columnar:        Retorna uma lista por campo em vez de um objeto por post.
+        :return:                Lista contendo os dados dos posts alertados (dicionário, no formato colunar).
+        """
+
+        if columnar:
+            return cls.fieldset.get_columns(posts_alerted, plan)
+
+        if plan is not None:
+            return [ cls.fieldset.get_row(row, plan) for row in posts_alerted ]
+
+        return [ cls._get_post_alerted_data(request, post_alerted) for post_alerted in posts_alerted ]
+
+    @classmethod
+    def _iter_data_post_alerted(cls, request: Request, posts_alerted: QuerySet, plan: list = None):
+        """
+        Gera os dados de cada post alertado, lendo o queryset em blocos pela chave (date, id).
+
         :param request:         Requisição HTTP.
         :param posts_alerted:   QuerySet contendo os posts alertados.
-        :return:                Lista contendo os dados dos posts alertados.
+        :param plan:            Campos pedidos em `?fields=` (SparseFieldset.get_plan), se houver.
+        :return:                Gerador com os dados de cada post alertado.
         """
 
-        data = list()
-        for post_alerted in posts_alerted:
-            post_alerted_data = PostAlertedSerializer(post_alerted, context={'request': request}).data
-            post_alerted_data['keywords_found'] = [ keyword.word for keyword in post_alerted.keywords_found.all() ]
-            post_alerted_data['forum'] = post_alerted.forum.forum_name
-            data.append(post_alerted_data)
-        return data
-    
+        for post_alerted in cls.pagination.iter_chunks(posts_alerted, cls.STREAM_CHUNK_SIZE):
+            if plan is not None:
+                yield cls.fieldset.get_row(post_alerted, plan)
+            else:
+                yield cls._get_post_alerted_data(request, post_alerted)
+
     @classmethod
-    def list(cls, request: Request) -> Response:
+    def _get_sparse_queryset(cls, request: Request, posts_alerted: QuerySet) -> tuple:
         """
-        Método para listar os posts alertados.
+        Prepara o queryset da listagem conforme os parâmetros `fields` e `layout`.
 
-        :param request: Requisição HTTP.
-        :return:        Resposta HTTP contendo os posts alertados.
+        :param request:         Requisição HTTP.
+        :param posts_alerted:   QuerySet dos posts alertados a listar.
+        :return:                Tupla (queryset, campos pedidos ou None, se é colunar).
         """
 
-        posts_alerted = PostAlerted.objects.all()
+        if not cls.fieldset.is_requested(request):
+            return cls._with_related(posts_alerted), None, False
+
+        fields      = cls.fieldset.get_fields(request)
+        columnar    = cls.fieldset.is_columnar(request)
+
+        if columnar and ResponseBuilder.is_stream_requested(request):
+            raise SparseFieldsetError('layout=columnar não pode ser combinado com stream.')
+
+        return cls.fieldset.get_queryset(posts_alerted, fields), cls.fieldset.get_plan(fields), columnar
+
+    @classmethod
+    def _build_list_response(
+            cls,
+            request: Request,
+            posts_alerted: QuerySet,
+            error_code: tuple,
+            conditional: bool = True
+        ) -> Response:
+        """
+        Monta a resposta das listagens de posts alertados, paginada por cursor ou em streaming quando solicitado.
+
+        :param request:         Requisição HTTP.
+        :param posts_alerted:   QuerySet dos posts alertados a listar.
+        :param error_code:      Código de erro (ResponseErrorCode) em caso de falha na listagem.
+        :param conditional:     Emite ETag e responde `If-None-Match` com 304. Desativado nas listagens
+                                sem filtro, em que calcular a versão exigiria ler a tabela inteira.
+        :return:                Resposta HTTP contendo os posts alertados.
+        """
+
+        pagination = None
 
         try:
-            data = cls._get_data_post_alerted(request, posts_alerted)
+            etag = None
+            if conditional:
+                etag = ConditionalResponse.get_etag(
+                    request, ConditionalResponse.get_version(posts_alerted, cls.RELATED_MODELS)
+                )
+                if ConditionalResponse.is_not_modified(request, etag):
+                    return ConditionalResponse.build_not_modified(etag)
+
+            posts_alerted, plan, columnar = cls._get_sparse_queryset(request, posts_alerted)
+
+            if cls.pagination.is_requested(request):
+                posts_alerted, pagination = cls.pagination.paginate_queryset(posts_alerted, request)
+
+            elif ResponseBuilder.is_stream_requested(request):
+                response = ResponseBuilder.build_streaming_response(
+                    ResponseMessages.LIST_POSTS_ALERTED,
+                    cls._iter_data_post_alerted(request, posts_alerted, plan)
+                )
+                if etag:
+                    response['ETag'] = etag
+                return response
+
+            data = cls._get_data_post_alerted(request, posts_alerted, plan, columnar)
+
+        except SparseFieldsetError as err:
+            return ResponseBuilder.build_response(
+                ResponseMessages.ERROR_INVALID_FIELDS,
+                error={
+                    'code': ResponseErrorCode.ERROR_INVALID_FIELDS[0],
+                    'message': ResponseErrorCode.ERROR_INVALID_FIELDS[1],
+                    'error': f'{str(err)}'
+                },
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        except PaginationError as err:
+            return ResponseBuilder.build_response(
+                ResponseMessages.ERROR_INVALID_PAGINATION,
+                error={
+                    'code': ResponseErrorCode.ERROR_INVALID_PAGINATION[0],
+                    'message': ResponseErrorCode.ERROR_INVALID_PAGINATION[1],
+                    'error': f'{str(err)}'
+                },
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
 
         except Exception as err:
             return ResponseBuilder.build_response(
                 ResponseMessages.ERROR_LIST_POSTS_ALERTED,
                 error={
-                    'code': ResponseErrorCode.ERROR_LIST_POSTS_ALERTED[0],
-                    'message': ResponseErrorCode.ERROR_LIST_POSTS_ALERTED[1],
+                    'code': error_code[0],
+                    'message': error_code[1],
                     'error': f'{type(err)}'
                 },
                 http_status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
-        
-        return ResponseBuilder.build_response(
+
+        response = ResponseBuilder.build_response(
             ResponseMessages.LIST_POSTS_ALERTED,
-            data=data
+            data=data,
+            pagination=pagination
         )
+        if etag:
+            response['ETag'] = etag
+
+        return response
     
     @classmethod
-    def list_by_alert(cls, request: Request, alert_id: int) -> Response:
+    async def _aiter_data_post_alerted(cls, request: Request, posts_alerted: QuerySet, plan: list = None):
         """
-        Método para listar os posts alertados por um alerta específico.
+        Versão assíncrona do _iter_data_post_alerted: lê o queryset em blocos pela chave (date, id).
 
-        :param request:     Requisição HTTP.
-        :param alert_id:    ID do alerta cujos posts alertados serão filtrados.
-        :return:            Resposta HTTP contendo os posts alertados do alerta.
+        :param request:         Requisição HTTP.
+        :param posts_alerted:   QuerySet contendo os posts alertados.
+        :param plan:            Campos pedidos em `?fields=` (SparseFieldset.get_plan), se houver.
+        :return:                Gerador assíncrono com os dados de cada post alertado.
         """
 
-        posts_alerted = PostAlerted.objects.filter(alert_id=alert_id)
-        data = list()
+        async for post_alerted in cls.pagination.aiter_chunks(posts_alerted, cls.STREAM_CHUNK_SIZE):
+            if plan is not None:
+                yield cls.fieldset.get_row(post_alerted, plan)
+            else:
+                yield cls._get_post_alerted_data(request, post_alerted)
+
+    @classmethod
+    async def _abuild_list_response(
+            cls,
+            request: Request,
+            posts_alerted: QuerySet,
+            error_code: tuple,
+            conditional: bool = True
+        ) -> Response:
+        """
+        Versão assíncrona do _build_list_response (mesmos parâmetros), usando o ORM assíncrono.
+
+        :return:    Resposta HTTP contendo os posts alertados.
+        """
+
+        pagination = None
 
         try:
-            data = cls._get_data_post_alerted(request, posts_alerted)
+            etag = None
+            if conditional:
+                etag = ConditionalResponse.get_etag(
+                    request, await ConditionalResponse.aget_version(posts_alerted, cls.RELATED_MODELS)
+                )
+                if ConditionalResponse.is_not_modified(request, etag):
+                    return ConditionalResponse.build_not_modified(etag)
+
+            posts_alerted, plan, columnar = cls._get_sparse_queryset(request, posts_alerted)
+
+            if cls.pagination.is_requested(request):
+                posts_alerted, pagination = await cls.pagination.apaginate_queryset(posts_alerted, request)
+
+            elif ResponseBuilder.is_stream_requested(request):
+                response = ResponseBuilder.build_streaming_response(
+                    ResponseMessages.LIST_POSTS_ALERTED,
+                    cls._aiter_data_post_alerted(request, posts_alerted, plan)
+                )
+                if etag:
+                    response['ETag'] = etag
+                return response
+
+            else:
+                posts_alerted = [ post_alerted async for post_alerted in posts_alerted ]
+
+            data = cls._get_data_post_alerted(request, posts_alerted, plan, columnar)
+
+        except SparseFieldsetError as err:
+            return ResponseBuilder.build_response(
+                ResponseMessages.ERROR_INVALID_FIELDS,
+                error={
+                    'code': ResponseErrorCode.ERROR_INVALID_FIELDS[0],
+                    'message': ResponseErrorCode.ERROR_INVALID_FIELDS[1],
+                    'error': f'{str(err)}'
+                },
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        except PaginationError as err:
+            return ResponseBuilder.build_response(
+                ResponseMessages.ERROR_INVALID_PAGINATION,
+                error={
+                    'code': ResponseErrorCode.ERROR_INVALID_PAGINATION[0],
+                    'message': ResponseErrorCode.ERROR_INVALID_PAGINATION[1],
+                    'error': f'{str(err)}'
+                },
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
 
         except Exception as err:
             return ResponseBuilder.build_response(
                 ResponseMessages.ERROR_LIST_POSTS_ALERTED,
                 error={
-                    'code': ResponseErrorCode.ERROR_LIST_POSTS_ALERTED_BY_ALERT[0],
-                    'message': ResponseErrorCode.ERROR_LIST_POSTS_ALERTED_BY_ALERT[1],
+                    'code': error_code[0],
+                    'message': error_code[1],
                     'error': f'{type(err)}'
                 },
                 http_status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-        return ResponseBuilder.build_response(
+        response = ResponseBuilder.build_response(
             ResponseMessages.LIST_POSTS_ALERTED,
-            data=data
+            data=data,
+            pagination=pagination
+        )
+        if etag:
+            response['ETag'] = etag
+
+        return response
+
+    @classmethod
+    def list(cls, request: Request) -> Response:
+        """
+        Método para listar os posts alertados.
+
+        :param request: Requisição HTTP.
+        :return:        Resposta HTTP contendo os posts alertados.
+        """
+
+        posts_alerted = PostAlerted.objects.all()
+        return cls._build_list_response(request, posts_alerted, ResponseErrorCode.ERROR_LIST_POSTS_ALERTED, conditional=False)
+    
+    @classmethod
+    def list_by_alert(cls, request: Request, alert_id: int) -> Response:
+        """
+        Método para listar os posts alertados por um alerta específico.
+
+        :param request:     Requisição HTTP.
+        :param alert_id:    ID do alerta cujos posts alertados serão filtrados.
+        :return:            Resposta HTTP contendo os posts alertados do alerta.
+        """
+
+        posts_alerted = PostAlerted.objects.filter(alert_id=alert_id)
+        return cls._build_list_response(request, posts_alerted, ResponseErrorCode.ERROR_LIST_POSTS_ALERTED_BY_ALERT)
+
+    @classmethod
+    async def alist(cls, request: Request) -> Response:
+        """ Versão assíncrona do list. """
+
+        posts_alerted = PostAlerted.objects.all()
+        return await cls._abuild_list_response(
+            request, posts_alerted, ResponseErrorCode.ERROR_LIST_POSTS_ALERTED, conditional=False
+        )
+
+    @classmethod
+    async def alist_by_alert(cls, request: Request, alert_id: int) -> Response:
+        """ Versão assíncrona do list_by_alert. """
+
+        posts_alerted = PostAlerted.objects.filter(alert_id=alert_id)
+        return await cls._abuild_list_response(
+            request, posts_alerted, ResponseErrorCode.ERROR_LIST_POSTS_ALERTED_BY_ALERT
         )
 
     # end: methods
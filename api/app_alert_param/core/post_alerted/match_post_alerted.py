@@ -0,0 +1,248 @@
+"""
+Módulo para classe de verificação de posts contra as palavras-chave dos alertas ativos.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import threading
+
+from django.db.models           import Count, Max
+from rest_framework             import status
+from rest_framework.request     import Request
+from rest_framework.response    import Response
+
+from core.matching.aho_corasick              import AhoCorasick
+from core.response_utils.response_builder    import ResponseBuilder
+from core.response_utils.response_messages   import ResponseMessages
+from core.response_utils.response_error_code import ResponseErrorCode
+
+from app_alert_param.core.alert.update_alert import UpdateAlert
+
+from app_alert_param.models import (
+    Alert,
+    Forum,
+    Keyword,
+)
+
+
+class KeywordMatcher:
+    """
+    Matcher compilado com as palavras-chave de todos os alertas ativos.
+
+    As palavras-chave de todos os alertas formam um único autômato de Aho-Corasick, então cada
+    post é percorrido uma única vez, independente da quantidade de alertas e palavras-chave.
+    """
+
+    def __init__(self, alerts: list):
+        """
+        Compila o matcher.
+
+        :param alerts:  Lista de alertas ativos, anotados por UpdateAlert.annotate_ntn_fields.
+        """
+
+        self.alerts             = dict()
+        self.alerts_by_keyword  = dict()
+
+        for alert in alerts:
+            self.alerts[alert.id] = {
+                'forums'        : frozenset(alert.forums_names),
+                'is_relevant'   : alert.is_relevant,
+            }
+
+            for keyword in alert.keywords_names:
+                self.alerts_by_keyword.setdefault(keyword, list()).append(alert.id)
+
+        self.automaton = AhoCorasick(self.alerts_by_keyword.keys())
+
+    # ini: methods
+
+    def match(self, title: str, description: str, forum: str, relevance: float) -> list:
+        """
+        Verifica quais alertas um post aciona.
+
+        Um alerta é acionado quando alguma de suas palavras-chave aparece (como palavra inteira)
+        no título ou na descrição, o fórum do post está entre os fóruns do alerta (alertas sem
+        fóruns aceitam qualquer fórum) e a relevância do post é maior ou igual à do alerta.
+
+        :param title:       Título do post.
+        :param description: Descrição do post.
+        :param forum:       Nome do fórum do post.
+        :param relevance:   Relevância do post.
+        :return:            Lista com o id de cada alerta acionado e as palavras-chave encontradas.
+        """
+
+        found = self.automaton.find(f'{title}\n{description}'.upper())
+
+        keywords_by_alert = dict()
+        for keyword in sorted(found):
+            for alert_id in self.alerts_by_keyword[keyword]:
+                keywords_by_alert.setdefault(alert_id, list()).append(keyword)
+
+        forum = str(forum).upper()
+
+        matches = list()
+        for alert_id, keywords in sorted(keywords_by_alert.items()):
+            alert = self.alerts[alert_id]
+
+            if alert['forums'] and forum not in alert['forums']:
+                continue
+            if relevance < alert['is_relevant']:
+                continue
+
+            matches.append({
+                'alert'         : alert_id,
+                'keywords_found': keywords,
+            })
+
+        return matches
+
+    # end: methods
+
+
+class MatchPostAlerted:
+    """
+    Classe para verificar posts contra as palavras-chave dos alertas ativos.
+
+    O matcher é mantido em cache no processo e recompilado quando a configuração muda. A mudança
+    é detectada por uma assinatura barata (quantidade e maior `updated_at` de alertas, fóruns e
+    palavras-chave), o que também cobre alterações feitas por outros workers. Mudanças nos
+    ManyToMany do alerta atualizam seu `updated_at` (ver app_alert_param.signals).
+    """
+
+    _lock           = threading.Lock()
+    _matcher        = None
+    _fingerprint    = None
+
+    # ini: methods
+
+    @staticmethod
+    def get_fingerprint() -> tuple:
+        """
+        Retorna a assinatura atual da configuração dos alertas.
+
+        :return:    Tupla com quantidade e maior `updated_at` de alertas, fóruns e palavras-chave.
+        """
+
+        return tuple(
+            tuple(model.objects.aggregate(count=Count('id'), updated_at=Max('updated_at')).values())
+            for model in (Alert, Forum, Keyword)
+        )
+
+    @classmethod
+    def get_matcher(cls) -> KeywordMatcher:
+        """
+        Retorna o matcher em cache, recompilando-o se a configuração dos alertas mudou.
+
+        :return:    Matcher das palavras-chave dos alertas ativos.
+        """
+
+        fingerprint = cls.get_fingerprint()
+
+        with cls._lock:
+            if cls._matcher is None or cls._fingerprint != fingerprint:
+                alerts = UpdateAlert.annotate_ntn_fields(Alert.objects.filter(is_active=True))
+
+                cls._matcher        = KeywordMatcher(list(alerts))
+                cls._fingerprint    = fingerprint
+
+            return cls._matcher
+
+    @classmethod
+    def match(cls, request: Request) -> Response:
+        """
+        Método para verificar quais alertas um lote de posts aciona.
+
+        :param request: Request - Requisição HTTP, com uma lista de posts (title, description, forum, relevance).
+        :return:        Response - Resposta HTTP com os alertas acionados por cada post.
+        """
+
+        try:
+            posts = request.data
+
+        except Exception as err:
+            return ResponseBuilder.build_response(
+                ResponseMessages.ERROR_EMPTY_BODY,
+
+                error={
+                    'code'      : ResponseErrorCode.ERROR_EMPTY_BODY[0],
+                    'message'   : ResponseErrorCode.ERROR_EMPTY_BODY[1],
+                    'error'     : f'{type(err)}',
+                },
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if type(posts) != list or not posts:
+            return ResponseBuilder.build_response(
+                ResponseMessages.ERROR_GET_REQUEST,
+
+                error={
+                    'code'      : ResponseErrorCode.ERROR_INVALID_BULK_BODY[0],
+                    'message'   : ResponseErrorCode.ERROR_INVALID_BULK_BODY[1],
+                },
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            matcher = cls.get_matcher()
+
+        except Exception as err:
+            return ResponseBuilder.build_response(
+                ResponseMessages.ERROR_MATCH_POSTS,
+
+                error={
+                    'code'      : ResponseErrorCode.ERROR_BUILD_MATCHER[0],
+                    'message'   : ResponseErrorCode.ERROR_BUILD_MATCHER[1],
+                    'error'     : f'{type(err)}',
+                },
+                http_status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        results = list()
+        for index, post in enumerate(posts):
+            try:
+                matches = matcher.match(
+                    title       = post['title'],
+                    description = post['description'],
+                    forum       = post['forum'],
+                    relevance   = float(post['relevance']),
+                )
+
+            except KeyError as err:
+                results.append({
+                    'index'     : index,
+                    'status'    : 'error',
+                    'error'     : {
+                        'code'      : ResponseErrorCode.ERROR_MISSING_FIELDS[0],
+                        'message'   : ResponseErrorCode.ERROR_MISSING_FIELDS[1],
+                        'missing'   : f'{err}',
+                        'error'     : f'{type(err)}',
+                    },
+                })
+                continue
+
+            except Exception as err:
+                results.append({
+                    'index'     : index,
+                    'status'    : 'error',
+                    'error'     : {
+                        'code'      : ResponseErrorCode.ERROR_GET_REQUEST[0],
+                        'message'   : ResponseErrorCode.ERROR_GET_REQUEST[1],
+                        'error'     : f'{type(err)}',
+                    },
+                })
+                continue
+
+            results.append({
+                'index'     : index,
+                'status'    : 'success',
+                'matches'   : matches,
+            })
+
+        return ResponseBuilder.build_response(
+            ResponseMessages.MATCH_POSTS,
+
+            data=results
+        )
+
+    # end: methods
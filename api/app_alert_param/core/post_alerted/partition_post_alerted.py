@@ -0,0 +1,368 @@
+"""
+Arquivo para implementação do particionamento, por mês de `date`, da tabela de posts alertados.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import re
+import datetime
+
+from django.db      import connection, transaction
+from django.utils   import timezone
+
+from app_alert_param.models import PostAlerted
+
+
+class PartitionError(Exception):
+    """ Erro ao particionar a tabela de posts alertados ou ao manter suas partições. """
+
+
+class PartitionPostAlerted:
+    """
+    Particionamento declarativo (RANGE) da tabela de posts alertados pela coluna `date`, uma
+    partição por mês (`post_alerted_p2026_10`), mais uma partição padrão (`post_alerted_default`)
+    para as datas sem partição própria.
+
+    O model e o ManyToMany `keywords_found` continuam os mesmos. No banco particionado:
+    - a chave primária passa a ser (id, date), já que toda chave única precisa conter a coluna de
+      particionamento; o `id` continua vindo de uma sequência e segue único na prática;
+    - a tabela do ManyToMany perde a FK para `post_alerted` (o Postgres não aceita FK apontando só
+      para `id` em uma tabela particionada); a remoção em cascata continua feita pelo Django;
+    - remover um mês inteiro é um DETACH da partição, sem DELETE nem VACUUM da tabela.
+    """
+
+    SCHEMA      = PostAlerted._meta.db_table.split('"."')[0]
+    TABLE       = PostAlerted._meta.db_table.split('"."')[-1]
+    THROUGH     = PostAlerted.keywords_found.through._meta.db_table.split('"."')[-1]
+    SEQUENCE    = f'{TABLE}_id_seq'
+
+    DEFAULT_PARTITION   = f'{TABLE}_default'
+    UNPARTITIONED_TABLE = f'{TABLE}_unpartitioned'
+    DETACHED_SUFFIX     = '_detached'
+
+    # Partições mensais (post_alerted_p2026_10) e a padrão
+    PARTITION_PATTERN = re.compile(rf'^{TABLE}_(p\d{{4}}_\d{{2}}|default)$')
+
+    # Limites de uma partição, em pg_get_expr(relpartbound): FOR VALUES FROM ('2026-10-01') TO ('2026-11-01')
+    BOUND_PATTERN = re.compile(r"FROM \('(\d{4}-\d{2}-\d{2})'\) TO \('(\d{4}-\d{2}-\d{2})'\)")
+
+    # ini: methods
+
+    @classmethod
+    def _quote(cls, name: str) -> str:
+        """ Retorna o nome qualificado (schema e tabela) de uma tabela do schema dos posts. """
+
+        return f'"{cls.SCHEMA}"."{name}"'
+
+    @staticmethod
+    def get_month(day: datetime.date, months: int = 0) -> datetime.date:
+        """
+        Retorna o primeiro dia do mês da data, deslocado de `months` meses.
+
+        :param day:     Data de referência.
+        :param months:  Meses a somar (ou subtrair, se negativo).
+        :return:        Primeiro dia do mês.
+        """
+
+        index = day.year * 12 + day.month - 1 + months
+
+        return datetime.date(index // 12, index % 12 + 1, 1)
+
+    @classmethod
+    def get_partition_name(cls, month: datetime.date) -> str:
+        """ Retorna o nome da partição do mês. """
+
+        return f'{cls.TABLE}_p{month:%Y_%m}'
+
+    @classmethod
+    def is_partition_name(cls, name: str) -> bool:
+        """ Indica se o nome é de uma partição da tabela de posts alertados (ex.: em um plano de EXPLAIN). """
+
+        return cls.PARTITION_PATTERN.match(name) is not None
+
+    @classmethod
+    def is_partitioned(cls, cursor) -> bool:
+        """ Indica se a tabela de posts alertados já é particionada. """
+
+        cursor.execute(
+            'SELECT c.relkind FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace '
+            'WHERE n.nspname = %s AND c.relname = %s',
+            [ cls.SCHEMA, cls.TABLE ]
+        )
+        row = cursor.fetchone()
+
+        return row is not None and row[0] == 'p'
+
+    @classmethod
+    def get_partitions(cls, cursor) -> list:
+        """
+        Retorna as partições da tabela, em ordem de data.
+
+        :param cursor:  Cursor do banco.
+        :return:        Lista de tuplas (nome, início, fim); início e fim são None na partição padrão.
+        """
+
+        cursor.execute(
+            'SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) FROM pg_inherits i '
+            'JOIN pg_class c ON c.oid = i.inhrelid WHERE i.inhparent = %s::regclass',
+            [ cls._quote(cls.TABLE) ]
+        )
+
+        partitions = list()
+        for name, bound in cursor.fetchall():
+            match = cls.BOUND_PATTERN.search(bound)
+            if match is None:
+                partitions.append((name, None, None))
+            else:
+                partitions.append((name, *( datetime.date.fromisoformat(value) for value in match.groups() )))
+
+        return sorted(partitions, key=lambda partition: (partition[1] is not None, partition[1]))
+
+    @classmethod
+    def table_exists(cls, cursor, name: str) -> bool:
+        """ Indica se existe uma tabela com o nome no schema dos posts. """
+
+        cursor.execute('SELECT to_regclass(%s)', [ cls._quote(name) ])
+
+        return cursor.fetchone()[0] is not None
+
+    @classmethod
+    def get_detached_name(cls, cursor, name: str) -> str:
+        """
+        Retorna um nome livre para a partição desanexada (`post_alerted_p2025_01_detached`, ou com um
+        número, se o mês já tiver sido desanexado antes), liberando o nome da partição para o mês.
+
+        :param cursor:  Cursor do banco.
+        :param name:    Nome da partição.
+        :return:        Nome da tabela desanexada.
+        """
+
+        detached = f'{name}{cls.DETACHED_SUFFIX}'
+
+        index = 2
+        while cls.table_exists(cursor, detached):
+            detached = f'{name}{cls.DETACHED_SUFFIX}_{index}'
+            index += 1
+
+        return detached
+
+    @classmethod
+    def _create_partition(cls, cursor, month: datetime.date, has_default: bool):
+        """
+        Cria a partição do mês, movendo para ela as linhas desse mês que estiverem na partição padrão.
+
+        A tabela é criada fora da tabela particionada e anexada depois (ATTACH PARTITION), o que
+        funciona mesmo com linhas do mês na partição padrão; os índices e a chave primária da tabela
+        particionada são criados na partição ao anexar.
+
+        :param cursor:      Cursor do banco.
+        :param month:       Primeiro dia do mês.
+        :param has_default: Se existe a partição padrão.
+        """
+
+        name    = cls._quote(cls.get_partition_name(month))
+        bounds  = [ month, cls.get_month(month, 1) ]
+
+        if cls.table_exists(cursor, cls.get_partition_name(month)):
+            raise PartitionError(f'A tabela {name} já existe e não é uma partição de {cls.TABLE}.')
+
+        cursor.execute(f'CREATE TABLE {name} (LIKE {cls._quote(cls.TABLE)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+
+        if has_default:
+            cursor.execute(
+                f'WITH moved AS ('
+                f'DELETE FROM {cls._quote(cls.DEFAULT_PARTITION)} WHERE date >= %s AND date < %s RETURNING *'
+                f') INSERT INTO {name} SELECT * FROM moved',
+                bounds
+            )
+
+        cursor.execute(f'ALTER TABLE {cls._quote(cls.TABLE)} ATTACH PARTITION {name} FOR VALUES FROM (%s) TO (%s)', bounds)
+
+    @classmethod
+    def ensure_partitions(cls, months_ahead: int) -> tuple:
+        """
+        Cria as partições que faltam, do mês atual até `months_ahead` meses à frente, e as dos meses
+        que tiverem posts na partição padrão (ex.: posts com data antiga).
+
+        Os meses cujo nome de partição já é usado por uma tabela comum (ex.: uma partição desanexada
+        antes de elas serem renomeadas) são ignorados: seus posts continuam na partição padrão e os
+        demais meses são criados normalmente.
+
+        :param months_ahead:    Meses futuros com partição garantida.
+        :return:                Tupla (nomes das partições criadas, nomes das tabelas que impediram a criação).
+        """
+
+        first = cls.get_month(timezone.localdate())
+        last  = cls.get_month(timezone.localdate(), months_ahead)
+
+        created = list()
+        skipped = list()
+        with transaction.atomic(), connection.cursor() as cursor:
+            if not cls.is_partitioned(cursor):
+                raise PartitionError(f'A tabela {cls.TABLE} não é particionada; converta-a antes.')
+
+            partitions  = cls.get_partitions(cursor)
+            existing    = { partition[1] for partition in partitions }
+            has_default = any(partition[1] is None for partition in partitions)
+
+            months = set()
+            month  = first
+            while month <= last:
+                months.add(month)
+                month = cls.get_month(month, 1)
+
+            if has_default:
+                cursor.execute(
+                    f"SELECT DISTINCT date_trunc('month', date)::date FROM {cls._quote(cls.DEFAULT_PARTITION)}"
+                )
+                months.update(row[0] for row in cursor.fetchall())
+
+            for month in sorted(months - existing):
+                name = cls.get_partition_name(month)
+                if cls.table_exists(cursor, name):
+                    skipped.append(name)
+                    continue
+
+                cls._create_partition(cursor, month, has_default)
+                created.append(name)
+
+        return created, skipped
+
+    @classmethod
+    def convert(cls, months_ahead: int) -> int:
+        """
+        Converte a tabela comum de posts alertados em uma tabela particionada, em uma transação.
+
+        Copia todas as linhas para as partições mensais (do mês mais antigo até `months_ahead`
+        meses à frente) e recria índices, FKs e a sequência do `id`. A tabela fica bloqueada
+        durante a cópia.
+
+        :param months_ahead:    Meses futuros com partição criada.
+        :return:                Quantidade de posts copiados.
+        """
+
+        table = cls._quote(cls.TABLE)
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            if cls.is_partitioned(cursor):
+                raise PartitionError(f'A tabela {cls.TABLE} já é particionada.')
+
+            cursor.execute(f'LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE')
+
+            cursor.execute(
+                "SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'p'", [ table ]
+            )
+            primary_key = cursor.fetchone()[0]
+
+            cursor.execute(
+                'SELECT indexdef FROM pg_indexes WHERE schemaname = %s AND tablename = %s AND indexname <> %s',
+                [ cls.SCHEMA, cls.TABLE, primary_key ]
+            )
+            indexes = [ row[0] for row in cursor.fetchall() ]
+
+            cursor.execute(
+                "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+                "WHERE conrelid = %s::regclass AND contype = 'f'",
+                [ table ]
+            )
+            foreign_keys = cursor.fetchall()
+
+            # FKs de outras tabelas para post_alerted(id): só a do ManyToMany keywords_found
+            cursor.execute(
+                "SELECT conrelid::regclass, conname FROM pg_constraint "
+                "WHERE confrelid = %s::regclass AND contype = 'f'",
+                [ table ]
+            )
+            for referencing, name in cursor.fetchall():
+                cursor.execute(f'ALTER TABLE {referencing} DROP CONSTRAINT "{name}"')
+
+            cursor.execute(f'SELECT min(date), max(id) FROM {table}')
+            first_date, max_id = cursor.fetchone()
+
+            cursor.execute(f'ALTER TABLE {table} RENAME TO "{cls.UNPARTITIONED_TABLE}"')
+            cursor.execute(f'ALTER TABLE {cls._quote(cls.UNPARTITIONED_TABLE)} ALTER COLUMN id DROP IDENTITY IF EXISTS')
+            cursor.execute(
+                f'CREATE TABLE {table} (LIKE {cls._quote(cls.UNPARTITIONED_TABLE)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+                f'PARTITION BY RANGE (date)'
+            )
+
+            # Até o Postgres 16, tabelas particionadas não aceitam coluna identity
+            sequence = cls._quote(cls.SEQUENCE)
+            cursor.execute(f'CREATE SEQUENCE {sequence} OWNED BY {table}.id')
+            cursor.execute('SELECT setval(%s, %s, %s)', [ sequence, max_id or 1, max_id is not None ])
+            cursor.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{sequence}')")
+
+            cursor.execute(f'CREATE TABLE {cls._quote(cls.DEFAULT_PARTITION)} PARTITION OF {table} DEFAULT')
+
+            month = cls.get_month(first_date or timezone.localdate())
+            last  = cls.get_month(timezone.localdate(), months_ahead)
+            while month <= last:
+                cls._create_partition(cursor, month, has_default=False)
+                month = cls.get_month(month, 1)
+
+            cursor.execute(f'INSERT INTO {table} SELECT * FROM {cls._quote(cls.UNPARTITIONED_TABLE)}')
+            copied = cursor.rowcount
+
+            cursor.execute(f'DROP TABLE {cls._quote(cls.UNPARTITIONED_TABLE)}')
+
+            # Índices depois da cópia, já com os nomes originais (a tabela antiga foi removida)
+            cursor.execute(f'ALTER TABLE {table} ADD CONSTRAINT "{primary_key}" PRIMARY KEY (id, date)')
+            for index in indexes:
+                cursor.execute(index)
+            for name, definition in foreign_keys:
+                cursor.execute(f'ALTER TABLE {table} ADD CONSTRAINT "{name}" {definition}')
+
+        return copied
+
+    @classmethod
+    def detach_before(cls, month: datetime.date, drop: bool = False) -> list:
+        """
+        Desanexa as partições mensais anteriores ao mês informado.
+
+        O DETACH não lê nem reescreve as linhas: a partição vira uma tabela comum, fora das consultas
+        da API (para arquivar ou consultar à parte), renomeada com o sufixo `_detached` para que o
+        nome da partição do mês fique livre. A tabela desanexada perde as FKs para alertas e fóruns,
+        que impediriam a remoção desses registros. Com `drop`, a tabela e os vínculos de
+        palavras-chave dos seus posts são removidos.
+
+        :param month:   Primeiro mês mantido.
+        :param drop:    Remove as partições desanexadas.
+        :return:        Nomes das tabelas desanexadas (ou das partições removidas, com `drop`).
+        """
+
+        detached = list()
+        with transaction.atomic(), connection.cursor() as cursor:
+            if not cls.is_partitioned(cursor):
+                raise PartitionError(f'A tabela {cls.TABLE} não é particionada.')
+
+            for name, _, end in cls.get_partitions(cursor):
+                if end is None or end > month:
+                    continue
+
+                cursor.execute(f'ALTER TABLE {cls._quote(cls.TABLE)} DETACH PARTITION {cls._quote(name)}')
+
+                if drop:
+                    cursor.execute(
+                        f'DELETE FROM {cls._quote(cls.THROUGH)} WHERE postalerted_id IN (SELECT id FROM {cls._quote(name)})'
+                    )
+                    cursor.execute(f'DROP TABLE {cls._quote(name)}')
+
+                    detached.append(name)
+                    continue
+
+                cursor.execute(
+                    "SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'f'",
+                    [ cls._quote(name) ]
+                )
+                for constraint, in cursor.fetchall():
+                    cursor.execute(f'ALTER TABLE {cls._quote(name)} DROP CONSTRAINT "{constraint}"')
+
+                detached_name = cls.get_detached_name(cursor, name)
+                cursor.execute(f'ALTER TABLE {cls._quote(name)} RENAME TO "{detached_name}"')
+
+                detached.append(detached_name)
+
+        return detached
+
+    # end: methods
@@ -0,0 +1,180 @@
+"""
+Módulo para classe de ingestão de posts alertados via stream NDJSON.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+from types                      import GeneratorType
+
+from rest_framework             import status
+from rest_framework.request     import Request
+from rest_framework.response    import Response
+
+from core.parsers.ndjson_parser              import NDJSONParser
+from core.response_utils.response_builder    import ResponseBuilder
+from core.response_utils.response_messages   import ResponseMessages
+from core.response_utils.response_error_code import ResponseErrorCode
+
+from app_alert_param.core.post_alerted.bulk_create_post_alerted import BulkCreatePostAlerted
+
+
+class StreamCreatePostAlerted:
+    """
+    Classe para ingestão de posts alertados enviados como NDJSON (um post por linha).
+
+    O corpo é lido de forma incremental e cada bloco de CHUNK_SIZE posts é validado e gravado
+    em sua própria transação, com as mesmas regras do CreatePostAlerted.create. Assim a memória
+    do servidor não cresce com o tamanho do upload e os registros já ficam disponíveis no banco
+    antes do fim do envio. O corpo pode vir com Content-Length ou em partes (Transfer-Encoding:
+    chunked), quando o produtor não sabe o tamanho do envio.
+    """
+
+    # Quantidade de posts gravados por transação
+    CHUNK_SIZE = 500
+
+    # Quantidade máxima de erros detalhados na resposta
+    MAX_ERRORS = 1000
+
+    # ini: methods
+
+    @classmethod
+    def create(cls, request: Request) -> Response:
+        """
+        Método para ingestão de posts alertados via stream NDJSON.
+
+        :param request: Request - Requisição HTTP com corpo application/x-ndjson.
+        :return:        Response - Resposta HTTP com o resumo da ingestão.
+        """
+
+        if NDJSONParser.is_chunked(request) and not NDJSONParser.can_read_chunked(request):
+            return ResponseBuilder.build_response(
+                ResponseMessages.ERROR_LENGTH_REQUIRED,
+
+                error={
+                    'code'      : ResponseErrorCode.ERROR_LENGTH_REQUIRED[0],
+                    'message'   : ResponseErrorCode.ERROR_LENGTH_REQUIRED[1],
+                },
+                http_status=status.HTTP_411_LENGTH_REQUIRED
+            )
+
+        try:
+            posts = NDJSONParser.get_data(request)
+
+        except Exception as err:
+            return ResponseBuilder.build_response(
+                ResponseMessages.ERROR_GET_REQUEST,
+
+                error={
+                    'code'      : ResponseErrorCode.ERROR_GET_REQUEST[0],
+                    'message'   : ResponseErrorCode.ERROR_GET_REQUEST[1],
+                    'error'     : f'{type(err)} - {str(err)}',
+                },
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if not isinstance(posts, GeneratorType):
+            return ResponseBuilder.build_response(
+                ResponseMessages.ERROR_EMPTY_BODY,
+
+                error={
+                    'code'      : ResponseErrorCode.ERROR_EMPTY_BODY[0],
+                    'message'   : ResponseErrorCode.ERROR_EMPTY_BODY[1],
+                },
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        summary = {
+            'received'          : 0,
+            'created'           : 0,
+            'failed'            : 0,
+            'errors'            : list(),
+            'errors_truncated'  : False,
+        }
+
+        chunk   = list()
+        indexes = list()
+
+        for index, post in enumerate(posts):
+            summary['received'] += 1
+
+            if isinstance(post, Exception):
+                cls.add_results(summary, [
+                    BulkCreatePostAlerted.get_item_error(
+                        index, ResponseErrorCode.ERROR_GET_REQUEST, post, detail=f'{post.detail}'
+                    )
+                ])
+                continue
+
+            chunk.append(post)
+            indexes.append(index)
+
+            if len(chunk) >= cls.CHUNK_SIZE:
+                cls.create_chunk(summary, chunk, indexes)
+                chunk, indexes = list(), list()
+
+        if chunk:
+            cls.create_chunk(summary, chunk, indexes)
+
+        if not summary['received']:
+            return ResponseBuilder.build_response(
+                ResponseMessages.ERROR_EMPTY_BODY,
+
+                error={
+                    'code'      : ResponseErrorCode.ERROR_EMPTY_BODY[0],
+                    'message'   : ResponseErrorCode.ERROR_EMPTY_BODY[1],
+                },
+                http_status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if not summary['failed']:
+            http_status = status.HTTP_201_CREATED
+        elif summary['created']:
+            http_status = status.HTTP_207_MULTI_STATUS
+        else:
+            http_status = status.HTTP_400_BAD_REQUEST
+
+        return ResponseBuilder.build_response(
+            ResponseMessages.SUCCESS_BULK_POST_ALERTED if summary['created'] else ResponseMessages.ERROR_BULK_POST_ALERTED,
+
+            data=summary,
+            http_status=http_status
+        )
+
+    @classmethod
+    def create_chunk(cls, summary: dict, chunk: list, indexes: list):
+        """
+        Grava um bloco de posts e acumula o resultado no resumo da ingestão.
+
+        :param summary: dict - Resumo da ingestão.
+        :param chunk:   list - Posts do bloco.
+        :param indexes: list - Posição de cada post do bloco no stream.
+        """
+
+        results = BulkCreatePostAlerted.create_posts_alerted(chunk)
+        for result, index in zip(results, indexes):
+            result['index'] = index
+
+        cls.add_results(summary, results)
+
+    @classmethod
+    def add_results(cls, summary: dict, results: list):
+        """
+        Acumula resultados de itens no resumo, mantendo apenas os detalhes dos erros.
+
+        :param summary: dict - Resumo da ingestão.
+        :param results: list - Resultados dos itens.
+        """
+
+        for result in results:
+            if result['status'] == 'success':
+                summary['created'] += 1
+                continue
+
+            summary['failed'] += 1
+            if len(summary['errors']) < cls.MAX_ERRORS:
+                summary['errors'].append(result)
+            else:
+                summary['errors_truncated'] = True
+
+    # end: methods
@@ -0,0 +1,186 @@
+"""
+Módulo para verificar, via EXPLAIN, os planos das consultas de cada endpoint.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import re
+
+from django.db              import connection
+from django.utils           import timezone
+from django.test.utils      import CaptureQueriesContext
+from rest_framework.test    import APIClient
+
+from app_alert_param.core.post_alerted.partition_post_alerted import PartitionPostAlerted
+
+from app_alert_param.models import (
+    Alert,
+    Email,
+    Forum,
+    Keyword,
+    PostAlerted,
+)
+
+
+class CheckQueryPlan:
+    """
+    Executa os endpoints de leitura e de manutenção dos alertas contra uma massa de dados semeada,
+    roda `EXPLAIN` em cada consulta executada e aponta os `Seq Scan` nas tabelas grandes (alertas,
+    posts alertados e seus ManyToMany). Usada pelos testes e pelo comando `check_query_plans`.
+
+    As consultas são explicadas com `enable_seqscan = off`: o planner só escolhe um Seq Scan quando
+    não existe índice utilizável, então a verificação independe do volume de dados do banco.
+
+    As listagens completas sem paginação (`alert/` e `post_alerted/`) leem a tabela inteira por
+    definição e não são verificadas; suas versões paginadas são.
+    """
+
+    BASE_URL = '/api/v1'
+
+    # Tabelas grandes (nome sem o schema)
+    LARGE_TABLES = tuple(
+        model._meta.db_table.split('"."')[-1]
+        for model in (
+            Alert,
+            PostAlerted,
+            Alert.forums.through,
+            Alert.emails.through,
+            Alert.keywords.through,
+            PostAlerted.keywords_found.through,
+        )
+    )
+
+    # ini: methods
+
+    @staticmethod
+    def seed() -> tuple:
+        """
+        Semeia uma massa de dados mínima para os endpoints retornarem registros.
+
+        :return:    Tupla (alerta, id do usuário do alerta).
+        """
+
+        today   = timezone.localdate()
+        forum   = Forum.objects.create(forum_name='CHECK_QUERY_PLANS')
+        keyword = Keyword.objects.create(word='CHECK_QUERY_PLANS')
+        email   = Email.objects.create(email='check_query_plans@example.com')
+
+        alerts = list()
+        for index in range(3):
+            alert = Alert.objects.create(
+                name            = f'check_query_plans_{index}',
+                id_user         = -1,
+                start_date      = today,
+                final_date      = today + timezone.timedelta(days=30),
+                qte_frequency   = 1,
+                type_frequency  = 'days',
+                last_run        = today,
+                run             = today,
+            )
+            alert.forums.add(forum)
+            alert.emails.add(email)
+            alert.keywords.add(keyword)
+            alerts.append(alert)
+
+            for id_post in range(3):
+                post_alerted = PostAlerted.objects.create(
+                    id_post     = id_post,
+                    title       = f'check_query_plans_{id_post}',
+                    description = '',
+                    alert       = alert,
+                    forum       = forum,
+                    relevance   = 1.0,
+                    date        = today,
+                )
+                post_alerted.keywords_found.add(keyword)
+
+        return alerts[0], alerts[0].id_user
+
+    @staticmethod
+    def disable_seqscan():
+        """ Desativa o Seq Scan no planner até o fim da transação atual. """
+
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+
+    @classmethod
+    def get_requests(cls, alert: Alert, id_user: int) -> list:
+        """
+        Lista as requisições verificadas.
+
+        :param alert:   Alerta semeado.
+        :param id_user: Usuário do alerta semeado.
+        :return:        Lista de tuplas (método HTTP, url, corpo).
+        """
+
+        return [
+            ('get',     f'{cls.BASE_URL}/alert/?page_size=1',                           None),
+            ('get',     f'{cls.BASE_URL}/alert/{alert.id}/',                            None),
+            ('get',     f'{cls.BASE_URL}/alert/user/{id_user}/',                        None),
+            ('get',     f'{cls.BASE_URL}/alert/user/{id_user}/?page_size=1',            None),
+            ('get',     f'{cls.BASE_URL}/alert/active/user/{id_user}/',                 None),
+            ('get',     f'{cls.BASE_URL}/alert/active/user/{id_user}/?page_size=1',     None),
+            ('get',     f'{cls.BASE_URL}/alert/run/today/',                             None),
+            ('post',    f'{cls.BASE_URL}/alert/claim/',                                 {}),
+            ('post',    f'{cls.BASE_URL}/alert/run/advance/',                           {}),
+            ('post',    f'{cls.BASE_URL}/alert/run/advance/',                           {'ids': [alert.id]}),
+            ('get',     f'{cls.BASE_URL}/alert/{alert.id}/update/run/',                 None),
+            ('get',     f'{cls.BASE_URL}/post_alerted/?page_size=1',                    None),
+            ('get',     f'{cls.BASE_URL}/post_alerted/alert/{alert.id}/',               None),
+            ('get',     f'{cls.BASE_URL}/post_alerted/alert/{alert.id}/?page_size=1',   None),
+        ]
+
+    @classmethod
+    def get_seq_scans(cls, sql: str) -> tuple:
+        """
+        Roda EXPLAIN na consulta e retorna as tabelas grandes lidas por Seq Scan.
+
+        :param sql: Consulta executada.
+        :return:    Tupla (tabelas lidas por Seq Scan, plano).
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN {sql}')
+            plan = '\n'.join(row[0] for row in cursor.fetchall())
+
+        # Partições de post_alerted (tabela particionada) contam como a própria tabela
+        tables = {
+            PartitionPostAlerted.TABLE if PartitionPostAlerted.is_partition_name(table) else table
+            for table in re.findall(r'Seq Scan on (\w+)', plan)
+        }
+        seq_scans = sorted(tables & set(cls.LARGE_TABLES))
+
+        return seq_scans, plan
+
+    @classmethod
+    def check_request(cls, client: APIClient, method: str, url: str, data: dict) -> tuple:
+        """
+        Executa uma requisição (seguindo o cursor da próxima página, se houver) e explica suas consultas.
+
+        :param client:  Cliente de testes autenticado.
+        :param method:  Método HTTP.
+        :param url:     URL da requisição.
+        :param data:    Corpo da requisição.
+        :return:        Tupla (status HTTP, lista de tuplas (consulta, tabelas lidas por Seq Scan, plano)).
+        """
+
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(client, method)(url, data, format='json')
+
+            pagination = response.json().get('pagination') if response.status_code == 200 else None
+            if pagination and pagination['next']:
+                getattr(client, method)(f'{url}&cursor={pagination["next"]}', data, format='json')
+
+        plans = list()
+        for query in context.captured_queries:
+            sql = query['sql']
+            if not sql.lstrip().upper().startswith(('SELECT', 'UPDATE', 'DELETE', 'WITH')):
+                continue
+
+            seq_scans, plan = cls.get_seq_scans(sql)
+            plans.append(( sql, seq_scans, plan ))
+
+        return response.status_code, plans
+
+    # end: methods
@@ -0,0 +1,34 @@
+"""
+Comando para avançar, em lote, o próximo dia a rodar dos alertas.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+from django.core.management.base import BaseCommand
+
+from app_alert_param.core.alert.advance_alert import AdvanceAlert
+
+
+class Command(BaseCommand):
+    """
+    Avança `last_run`/`run` dos alertas informados, ou de todos os alertas ativos com `run <= hoje`,
+    em um único UPDATE, desativando os que já chegaram à data final.
+
+    Uso: python manage.py advance_alerts [--ids 1 2 3] [--lease <token>]
+    """
+
+    help = 'Avança, em um único UPDATE, o próximo dia a rodar dos alertas que devem rodar.'
+
+    # ini: methods
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ids', nargs='+', type=int, help='Ids dos alertas a avançar.')
+        parser.add_argument('--lease', help='Token de reserva; avança apenas os alertas dessa reserva.')
+
+    def handle(self, *args, **options):
+        updated = AdvanceAlert.advance(options['ids'], options['lease'])
+
+        self.stdout.write(self.style.SUCCESS(f'{updated} alerta(s) atualizado(s).'))
+
+    # end: methods
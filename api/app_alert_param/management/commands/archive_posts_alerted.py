@@ -0,0 +1,56 @@
+"""
+Comando para arquivar, em arquivos JSONL.gz, os posts alertados antigos.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import datetime
+
+from django.conf                    import settings
+from django.utils                   import timezone
+from django.core.management.base    import BaseCommand, CommandError
+
+from app_alert_param.core.post_alerted.archive_post_alerted import ArchivePostAlerted
+
+
+class Command(BaseCommand):
+    """
+    Move os posts alertados com `date` mais antiga que `--days` dias (padrão: ARCHIVE_AFTER_DAYS),
+    com suas palavras-chave, para arquivos JSONL.gz em ARCHIVE_DIR, um por alerta e mês, registrados
+    no manifesto (PostAlertedArchive). Os arquivados continuam disponíveis em
+    `GET /api/v1/post_alerted/alert/<id>/?archived=true`.
+
+    Uso: python manage.py archive_posts_alerted [--days 365] [--dry-run]
+    """
+
+    help = 'Arquiva em JSONL.gz os posts alertados antigos e os remove do banco.'
+
+    # ini: methods
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.ARCHIVE_AFTER_DAYS, help='Idade mínima (dias) dos posts arquivados.')
+        parser.add_argument('--dry-run', action='store_true', help='Apenas lista os grupos (alerta, mês) a arquivar.')
+
+    def handle(self, *args, **options):
+        if options['days'] < 1:
+            raise CommandError('--days deve ser maior que zero.')
+
+        before = timezone.localdate() - datetime.timedelta(days=options['days'])
+
+        if options['dry_run']:
+            total = 0
+            for alert_id, month, posts in ArchivePostAlerted.get_groups(before):
+                self.stdout.write(f'alerta {alert_id}, {month:%Y-%m}: {posts} post(s)')
+                total += posts
+
+            self.stdout.write(self.style.SUCCESS(f'{total} post(s) anteriores a {before} seriam arquivados.'))
+            return
+
+        posts, files = ArchivePostAlerted.archive(before)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{posts} post(s) anteriores a {before} arquivado(s) em {files} arquivo(s) em {settings.ARCHIVE_DIR}.'
+        ))
+
+    # end: methods
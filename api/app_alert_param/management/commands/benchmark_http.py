@@ -0,0 +1,200 @@
+"""
+Comando para medir vazão e latência das leituras sob requisições concorrentes.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import json
+import time
+import base64
+import itertools
+import threading
+import statistics
+import http.client
+
+from urllib.parse                   import urlsplit
+from concurrent.futures             import ThreadPoolExecutor
+from django.core.management.base    import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """
+    Dispara requisições concorrentes contra uma API em execução e mede vazão (req/s) e latência
+    (p50, p95, p99) de cada endpoint, para cada nível de concorrência.
+
+    Serve para comparar os modos de deploy: rode uma vez com o servidor WSGI (gunicorn com
+    threads) salvando o resultado em `--output`, e outra com o servidor ASGI (uvicorn, com
+    ASYNC_READ_VIEWS=True) passando o primeiro resultado em `--compare`.
+
+    O throttling de leituras (THROTTLE_RATE_READ) deve ser alto o bastante para não limitar o teste.
+
+    Uso: python manage.py benchmark_http --url http://localhost:8000 --api-key <chave>
+         [--path /api/v1/alert/user/1/ ...] [--concurrency 8 32 128] [--requests 2000]
+         [--label wsgi] [--output resultado.json] [--compare outro_resultado.json]
+    """
+
+    help = 'Mede vazão e latência das leituras da API sob requisições concorrentes.'
+
+    DEFAULT_PATHS = [
+        '/api/v1/alert/?page_size=100',
+        '/api/v1/alert/run/today/',
+        '/api/v1/post_alerted/?page_size=100',
+    ]
+
+    # ini: methods
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://localhost:8000', help='URL base da API.')
+        parser.add_argument('--path', action='append', dest='paths', help='Endpoint a medir (pode repetir).')
+        parser.add_argument('--concurrency', type=int, nargs='+', default=[8, 32, 128], help='Níveis de concorrência.')
+        parser.add_argument('--requests', type=int, default=2000, help='Requisições por endpoint e nível.')
+        parser.add_argument('--timeout', type=float, default=30.0, help='Timeout de cada requisição (s).')
+        parser.add_argument('--api-key', help='Chave de API (Authorization: Api-Key ...).')
+        parser.add_argument('--basic', help='Credenciais Basic no formato usuario:senha.')
+        parser.add_argument('--label', default='', help='Rótulo do resultado (ex.: wsgi, asgi).')
+        parser.add_argument('--output', help='Arquivo JSON para salvar o resultado.')
+        parser.add_argument('--compare', help='Resultado JSON anterior para comparar.')
+
+    @staticmethod
+    def get_headers(options: dict) -> dict:
+        """
+        Monta os cabeçalhos de autenticação.
+
+        :param options: Opções do comando.
+        :return:        Cabeçalhos das requisições.
+        """
+
+        if options['api_key']:
+            return { 'Authorization': f'Api-Key {options["api_key"]}' }
+
+        if options['basic']:
+            return { 'Authorization': f'Basic {base64.b64encode(options["basic"].encode()).decode()}' }
+
+        raise CommandError('Informe --api-key ou --basic.')
+
+    @staticmethod
+    def run_level(url: str, path: str, headers: dict, concurrency: int, total: int, timeout: float) -> dict:
+        """
+        Executa `total` requisições a um endpoint com `concurrency` clientes simultâneos.
+
+        Cada cliente mantém sua conexão aberta (keep-alive), como um proxy reverso faria.
+
+        :return:    Resultado do nível (vazão, latências e status).
+        """
+
+        target      = urlsplit(url)
+        connection  = http.client.HTTPSConnection if target.scheme == 'https' else http.client.HTTPConnection
+        counter     = itertools.count()
+        lock        = threading.Lock()
+        latencies   = list()
+        statuses    = dict()
+        errors      = 0
+
+        def client():
+            nonlocal errors
+            conn = connection(target.netloc, timeout=timeout)
+
+            while next(counter) < total:
+                start = time.perf_counter()
+                try:
+                    conn.request('GET', path, headers=headers)
+                    response = conn.getresponse()
+                    response.read()
+                    status = response.status
+
+                except (OSError, http.client.HTTPException):
+                    conn.close()
+                    conn = connection(target.netloc, timeout=timeout)
+                    status = None
+
+                elapsed = time.perf_counter() - start
+
+                with lock:
+                    if status is None:
+                        errors += 1
+                    else:
+                        latencies.append(elapsed)
+                        statuses[status] = statuses.get(status, 0) + 1
+
+            conn.close()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for _ in range(concurrency):
+                executor.submit(client)
+        duration = time.perf_counter() - start
+
+        quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [ 0.0 ] * 99
+
+        return {
+            'path'          : path,
+            'concurrency'   : concurrency,
+            'requests'      : total,
+            'errors'        : errors,
+            'statuses'      : { str(status): count for status, count in sorted(statuses.items()) },
+            'duration_s'    : round(duration, 3),
+            'throughput'    : round(len(latencies) / duration, 1),
+            'p50_ms'        : round(quantiles[49] * 1000, 2),
+            'p95_ms'        : round(quantiles[94] * 1000, 2),
+            'p99_ms'        : round(quantiles[98] * 1000, 2),
+            'max_ms'        : round(max(latencies, default=0.0) * 1000, 2),
+        }
+
+    def write_comparison(self, results: list, previous: dict):
+        """
+        Exibe a variação de vazão e do p99 em relação a um resultado anterior.
+
+        :param results:     Resultados desta execução.
+        :param previous:    Resultado anterior (conteúdo do `--output` de outra execução).
+        """
+
+        before = { (result['path'], result['concurrency']): result for result in previous['results'] }
+
+        self.stdout.write(f'\nComparação com {previous.get("label") or "resultado anterior"}:')
+        for result in results:
+            old = before.get((result['path'], result['concurrency']))
+            if not old or not old['throughput'] or not old['p99_ms']:
+                continue
+
+            self.stdout.write(
+                f'{result["path"]} c={result["concurrency"]}: '
+                f'vazão {result["throughput"] / old["throughput"]:.2f}x '
+                f'({old["throughput"]} -> {result["throughput"]} req/s), '
+                f'p99 {result["p99_ms"] / old["p99_ms"]:.2f}x '
+                f'({old["p99_ms"]} -> {result["p99_ms"]} ms)'
+            )
+
+    def handle(self, *args, **options):
+        headers = self.get_headers(options)
+        paths   = options['paths'] or self.DEFAULT_PATHS
+
+        results = list()
+        for path in paths:
+            for concurrency in options['concurrency']:
+                result = self.run_level(
+                    options['url'], path, headers, concurrency, options['requests'], options['timeout']
+                )
+                results.append(result)
+
+                self.stdout.write(
+                    f'{path} c={concurrency}: {result["throughput"]} req/s, '
+                    f'p50 {result["p50_ms"]} ms, p95 {result["p95_ms"]} ms, p99 {result["p99_ms"]} ms, '
+                    f'status {result["statuses"]}, erros {result["errors"]}'
+                )
+
+        output = {
+            'label'     : options['label'],
+            'url'       : options['url'],
+            'results'   : results,
+        }
+
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                json.dump(output, file, indent=4)
+
+        if options['compare']:
+            with open(options['compare']) as file:
+                self.write_comparison(results, json.load(file))
+
+    # end: methods
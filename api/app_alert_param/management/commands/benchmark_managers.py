@@ -0,0 +1,395 @@
+"""
+Comando para medir tempo e quantidade de consultas de cada entrada dos managers.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import json
+import time
+import statistics
+import subprocess
+
+from django.db                      import connection, transaction
+from django.utils                   import timezone
+from django.contrib.auth.models     import User
+from django.core.management.base    import BaseCommand, CommandError
+from django.test                    import TestCase
+from django.test.utils              import CaptureQueriesContext
+from rest_framework.parsers         import JSONParser
+from rest_framework.request         import Request
+from rest_framework.settings        import api_settings
+from rest_framework.test            import APIRequestFactory
+
+from app_alert_param.core.alert.alert_cache             import AlertCache
+from app_alert_param.manager.alert_manager              import AlertManager
+from app_alert_param.manager.post_alerted_manager       import PostAlertedManager
+
+from app_alert_param.models import (
+    Alert,
+    Email,
+    Forum,
+    Keyword,
+    PostAlerted,
+)
+
+
+class Command(BaseCommand):
+    """
+    Semeia uma massa sintética de alertas, palavras-chave, fóruns, e-mails e posts alertados na
+    escala escolhida, dentro de uma transação (desfeita ao final), e mede cada entrada dos managers:
+    tempo (mínimo, mediana, média e máximo, incluindo a renderização do JSON) e quantidade de
+    consultas. O cache de alertas é invalidado antes de cada execução, então as listagens medem
+    sempre o caminho do banco. Os callbacks de `on_commit` rodam ao fim de cada execução e os
+    savepoints não são contados, como se cada execução rodasse na própria transação.
+
+    O resultado pode ser salvo em JSON (`--output`) e comparado com o de outro commit (`--compare`).
+    O comando falha se alguma entrada passar do seu orçamento de consultas (QUERY_BUDGETS), que
+    não depende da escala: todas as entradas fazem um número constante de consultas.
+
+    Uso: python manage.py benchmark_managers [--scale 1k|100k|1m] [--iterations 5]
+         [--output resultado.json] [--compare resultado_anterior.json]
+    """
+
+    help = 'Mede tempo e consultas de cada entrada dos managers sobre uma massa sintética.'
+
+    # Comandos de savepoint não contam como consultas: só existem porque a massa fica em uma
+    # transação externa; em produção, os `atomic` das entradas abrem a própria transação
+    SAVEPOINT_COMMANDS = ( 'SAVEPOINT', 'RELEASE SAVEPOINT', 'ROLLBACK TO SAVEPOINT' )
+
+    # Volume de cada tabela por escala (a escala é a quantidade de posts alertados)
+    SCALES = {
+        '1k'    : { 'posts': 1_000,     'alerts': 100,      'keywords': 200,    'forums': 20,   'emails': 50     },
+        '100k'  : { 'posts': 100_000,   'alerts': 2_000,    'keywords': 2_000,  'forums': 100,  'emails': 500    },
+        '1m'    : { 'posts': 1_000_000, 'alerts': 10_000,   'keywords': 10_000, 'forums': 500,  'emails': 2_000  },
+    }
+
+    # Máximo de consultas por entrada
+    QUERY_BUDGETS = {
+        'alert.create'                          : 16,
+        'alert.list'                            : 1,
+        'alert.list.page'                       : 1,
+        'alert.list_by_user'                    : 2,
+        'alert.list_active_alerts_run_today'    : 2,
+        # Relê o alerta com a linha bloqueada (SELECT ... FOR UPDATE) antes de avançar, por causa da reserva
+        'alert.update_run'                      : 8,
+        'alert.update_keywords'                 : 17,
+        'alert.update_forums'                   : 17,
+        'alert.update_emails'                   : 17,
+        'post_alerted.create'                   : 8,
+        'post_alerted.list.page'                : 2,
+        'post_alerted.list_by_alert'            : 3,
+    }
+
+    # Registros por INSERT na semeadura
+    BATCH_SIZE = 10_000
+
+    # Palavras-chave e fóruns por alerta (mais um e-mail) e palavras-chave encontradas por post
+    ALERT_KEYWORDS          = 5
+    ALERT_FORUMS            = 2
+    POST_KEYWORDS           = 2
+
+    # ini: methods
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', choices=self.SCALES.keys(), default='1k', help='Escala da massa de dados.')
+        parser.add_argument('--iterations', type=int, default=5, help='Execuções medidas por entrada.')
+        parser.add_argument('--output', help='Arquivo JSON para salvar o resultado.')
+        parser.add_argument('--compare', help='Resultado JSON anterior para comparar.')
+
+    def seed(self, scale: dict):
+        """
+        Semeia a massa de dados da escala.
+
+        :param scale:   Volume de cada tabela (SCALES).
+        """
+
+        today = timezone.localdate()
+
+        keywords = Keyword.objects.bulk_create(
+            [ Keyword(word=f'BENCHMARK_{index}') for index in range(scale['keywords']) ],
+            batch_size=self.BATCH_SIZE
+        )
+        forums = Forum.objects.bulk_create(
+            [ Forum(forum_name=f'BENCHMARK_{index}') for index in range(scale['forums']) ],
+            batch_size=self.BATCH_SIZE
+        )
+        emails = Email.objects.bulk_create(
+            [ Email(email=f'benchmark_{index}@example.com') for index in range(scale['emails']) ],
+            batch_size=self.BATCH_SIZE
+        )
+
+        # Um usuário a cada 10 alertas; um em cada 7 alertas roda hoje
+        alerts = Alert.objects.bulk_create(
+            [
+                Alert(
+                    name            = f'benchmark_{index}',
+                    id_user         = -1 - index % max(scale['alerts'] // 10, 1),
+                    start_date      = today,
+                    final_date      = today + timezone.timedelta(days=365),
+                    qte_frequency   = 1,
+                    type_frequency  = 'weeks',
+                    last_run        = today,
+                    run             = today + timezone.timedelta(days=index % 7),
+                )
+                for index in range(scale['alerts'])
+            ],
+            batch_size=self.BATCH_SIZE
+        )
+
+        Alert.keywords.through.objects.bulk_create(
+            [
+                Alert.keywords.through(alert_id=alert.id, keyword_id=keywords[(index + offset) % len(keywords)].id)
+                for index, alert in enumerate(alerts)
+                for offset in range(self.ALERT_KEYWORDS)
+            ],
+            batch_size=self.BATCH_SIZE
+        )
+        Alert.forums.through.objects.bulk_create(
+            [
+                Alert.forums.through(alert_id=alert.id, forum_id=forums[(index + offset) % len(forums)].id)
+                for index, alert in enumerate(alerts)
+                for offset in range(self.ALERT_FORUMS)
+            ],
+            batch_size=self.BATCH_SIZE
+        )
+        Alert.emails.through.objects.bulk_create(
+            [
+                Alert.emails.through(alert_id=alert.id, email_id=emails[index % len(emails)].id)
+                for index, alert in enumerate(alerts)
+            ],
+            batch_size=self.BATCH_SIZE
+        )
+
+        # Posts em lotes, para não montar todos os objetos de uma vez
+        for start in range(0, scale['posts'], self.BATCH_SIZE):
+            posts = PostAlerted.objects.bulk_create([
+                PostAlerted(
+                    id_post     = index,
+                    title       = f'benchmark_{index}',
+                    description = 'benchmark ' * 20,
+                    alert_id    = alerts[index % len(alerts)].id,
+                    forum_id    = forums[index % len(forums)].id,
+                    relevance   = (index % 100) / 100,
+                    date        = today - timezone.timedelta(days=index % 365),
+                )
+                for index in range(start, min(start + self.BATCH_SIZE, scale['posts']))
+            ])
+
+            PostAlerted.keywords_found.through.objects.bulk_create([
+                PostAlerted.keywords_found.through(
+                    postalerted_id  = post.id,
+                    keyword_id      = keywords[(post.id_post + offset) % len(keywords)].id
+                )
+                for post in posts
+                for offset in range(self.POST_KEYWORDS)
+            ])
+
+    def build_request(self, method: str, path: str, data: dict = None) -> Request:
+        """
+        Monta uma requisição do DRF, como a recebida pelas views.
+
+        :param method:  Método HTTP.
+        :param path:    Caminho (com query string).
+        :param data:    Corpo JSON.
+        :return:        Requisição.
+        """
+
+        request         = Request(getattr(self.factory, method)(path, data, format='json'), parsers=[ JSONParser() ])
+        request.user    = self.user
+
+        return request
+
+    def get_cases(self) -> dict:
+        """
+        Monta as entradas medidas.
+
+        :return:    Dicionário nome -> função que recebe o número da execução e chama o manager.
+        """
+
+        today       = timezone.localdate()
+        alert       = Alert.objects.filter(name__startswith='benchmark_').order_by('id').first()
+        keywords    = [ keyword.word for keyword in alert.keywords.all() ]
+        forums      = [ forum.forum_name for forum in alert.forums.all() ]
+        emails      = [ email.email for email in alert.emails.all() ]
+
+        # Cada execução das atualizações troca um elemento, para sempre haver diferença a gravar
+        def update(field: str, current: list, new_name):
+            return lambda index: getattr(AlertManager, f'update_{field}')(
+                self.build_request('put', f'/api/v1/alert/{alert.id}/{field}/', { field: current[:-1] + [ new_name(index) ] }),
+                alert
+            )
+
+        return {
+            'alert.create': lambda index: AlertManager.create(self.build_request('post', '/api/v1/alert/', {
+                'name'          : f'benchmark_create_{index}',
+                'keywords'      : keywords,
+                'forums'        : forums,
+                'emails'        : emails,
+                'id_user'       : alert.id_user,
+                'start_date'    : str(today),
+                'final_date'    : str(today + timezone.timedelta(days=30)),
+                'qte_frequency' : 1,
+                'type_frequency': 'days',
+                'is_relevant'   : 0.5,
+            })),
+            'alert.list': lambda index: AlertManager.list(
+                self.build_request('get', '/api/v1/alert/')
+            ),
+            'alert.list.page': lambda index: AlertManager.list(
+                self.build_request('get', '/api/v1/alert/?page_size=100')
+            ),
+            'alert.list_by_user': lambda index: AlertManager.list_by_user(
+                self.build_request('get', f'/api/v1/alert/user/{alert.id_user}/'), alert.id_user
+            ),
+            'alert.list_active_alerts_run_today': lambda index: AlertManager.list_active_alerts_run_today(
+                self.build_request('get', '/api/v1/alert/run/today/')
+            ),
+            'alert.update_run': lambda index: AlertManager.update_run(
+                self.build_request('get', f'/api/v1/alert/{alert.id}/update/run/'), alert
+            ),
+            'alert.update_keywords' : update('keywords', keywords, lambda index: f'BENCHMARK_UPDATE_{index}'),
+            'alert.update_forums'   : update('forums', forums, lambda index: f'BENCHMARK_UPDATE_{index}'),
+            'alert.update_emails'   : update('emails', emails, lambda index: f'benchmark_update_{index}@example.com'),
+            'post_alerted.create': lambda index: PostAlertedManager.create(self.build_request('post', '/api/v1/post_alerted/', {
+                'id_post'       : index,
+                'title'         : f'benchmark_create_{index}',
+                'description'   : 'benchmark',
+                'alert'         : alert.id,
+                'forum'         : forums[0],
+                'keywords_found': keywords[:self.POST_KEYWORDS],
+                'relevance'     : 0.5,
+                'date'          : str(today),
+            })),
+            'post_alerted.list.page': lambda index: PostAlertedManager.list(
+                self.build_request('get', '/api/v1/post_alerted/?page_size=100')
+            ),
+            'post_alerted.list_by_alert': lambda index: PostAlertedManager.list_by_alert(
+                self.build_request('get', f'/api/v1/post_alerted/alert/{alert.id}/'), alert.id
+            ),
+        }
+
+    def run_case(self, case, iterations: int) -> dict:
+        """
+        Executa uma entrada (uma execução de aquecimento e `iterations` medidas).
+
+        :param case:        Função que chama o manager.
+        :param iterations:  Execuções medidas.
+        :return:            Tempos (ms), consultas e status da última execução.
+        """
+
+        renderer    = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+        timings     = list()
+
+        for index in range(iterations + 1):
+            AlertCache.invalidate_all()
+
+            # A massa fica em uma transação nunca confirmada: os callbacks de on_commit (ex.: o cache
+            # de ids de fóruns e palavras-chave) rodam ao fim de cada execução, como após o commit
+            with CaptureQueriesContext(connection) as context, TestCase.captureOnCommitCallbacks(execute=True):
+                start       = time.perf_counter()
+                response    = case(index)
+                renderer.render(response.data)
+                elapsed     = time.perf_counter() - start
+
+            if index:
+                timings.append(elapsed * 1000)
+
+        return {
+            'status'    : response.status_code,
+            'queries'   : sum(
+                1 for query in context.captured_queries if not query['sql'].startswith(self.SAVEPOINT_COMMANDS)
+            ),
+            'min_ms'    : round(min(timings), 2),
+            'median_ms' : round(statistics.median(timings), 2),
+            'mean_ms'   : round(statistics.mean(timings), 2),
+            'max_ms'    : round(max(timings), 2),
+        }
+
+    @staticmethod
+    def get_commit() -> str:
+        """ Retorna o commit atual do repositório, se disponível. """
+
+        try:
+            return subprocess.run(
+                [ 'git', 'rev-parse', '--short', 'HEAD' ], capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def write_comparison(self, results: dict, previous: dict):
+        """
+        Exibe a variação da mediana e das consultas em relação a um resultado anterior.
+
+        :param results:     Resultados desta execução.
+        :param previous:    Resultado anterior (conteúdo do `--output` de outra execução).
+        """
+
+        self.stdout.write(f'\nComparação com {previous.get("commit") or "resultado anterior"} (escala {previous["scale"]}):')
+        for name, result in results.items():
+            old = previous['results'].get(name)
+            if not old:
+                continue
+
+            line = (
+                f'{name}: mediana {result["median_ms"] / old["median_ms"]:.2f}x '
+                f'({old["median_ms"]} -> {result["median_ms"]} ms), '
+                f'consultas {old["queries"]} -> {result["queries"]}'
+            )
+            self.stdout.write(self.style.ERROR(line) if result['queries'] > old['queries'] else line)
+
+    def handle(self, *args, **options):
+        scale = self.SCALES[options['scale']]
+
+        self.factory    = APIRequestFactory()
+        self.user       = User(username='benchmark_managers', is_staff=True, is_superuser=True)
+
+        results = dict()
+        with transaction.atomic():
+            start = time.perf_counter()
+            self.seed(scale)
+            self.stdout.write(f'Massa {options["scale"]} semeada em {time.perf_counter() - start:.1f} s: {scale}')
+
+            for name, case in self.get_cases().items():
+                results[name] = self.run_case(case, options['iterations'])
+
+                result = results[name]
+                self.stdout.write(
+                    f'{name}: mediana {result["median_ms"]} ms (min {result["min_ms"]}, max {result["max_ms"]}), '
+                    f'{result["queries"]} consultas, status {result["status"]}'
+                )
+
+            transaction.set_rollback(True)
+
+        # Descarta o que foi para o cache a partir da massa de dados desfeita
+        AlertCache.invalidate_all()
+
+        output = {
+            'commit'        : self.get_commit(),
+            'scale'         : options['scale'],
+            'iterations'    : options['iterations'],
+            'created_at'    : timezone.now().isoformat(),
+            'results'       : results,
+        }
+
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                json.dump(output, file, indent=4)
+
+        if options['compare']:
+            with open(options['compare']) as file:
+                self.write_comparison(results, json.load(file))
+
+        over_budget = [
+            f'{name} ({result["queries"]} > {self.QUERY_BUDGETS[name]})'
+            for name, result in results.items()
+            if result['queries'] > self.QUERY_BUDGETS[name]
+        ]
+        if over_budget:
+            raise CommandError(f'Consultas acima do orçamento: {", ".join(over_budget)}.')
+
+        failed = [ name for name, result in results.items() if result['status'] >= 400 ]
+        if failed:
+            raise CommandError(f'Entradas com erro: {", ".join(failed)}.')
+
+    # end: methods
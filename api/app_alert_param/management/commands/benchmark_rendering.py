@@ -0,0 +1,137 @@
+"""
+Comando para comparar a renderização JSON (json x orjson) e a compressão das respostas.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import json
+import time
+import zlib
+import statistics
+
+import brotli
+import orjson
+
+from django.conf                    import settings
+from django.contrib.auth.models     import User
+from django.core.management.base    import BaseCommand, CommandError
+from rest_framework.test            import APIClient
+from rest_framework.renderers       import JSONRenderer
+
+from core.renderers.orjson_renderer import ORJSONRenderer
+
+
+class Command(BaseCommand):
+    """
+    Busca as respostas de listagens reais (dados do banco atual) e mede, para cada uma:
+
+    - tempo de renderização com o JSONRenderer do DRF (`json`) e com o ORJSONRenderer;
+    - tempo de decodificação do corpo com `json.loads` e `orjson.loads` (lado do parser);
+    - bytes trafegados sem compressão, com gzip e com brotli, e o tempo de cada compressão,
+      com os níveis configurados (COMPRESSION_GZIP_LEVEL e COMPRESSION_BROTLI_QUALITY).
+
+    Rode em um banco com volume parecido com o de produção: o ganho cresce com o tamanho das listas.
+
+    Uso: python manage.py benchmark_rendering [--path /api/v1/alert/?page_size=1000 ...]
+         [--iterations 20] [--output resultado.json]
+    """
+
+    help = 'Compara a renderização JSON (json x orjson) e a compressão das respostas.'
+
+    DEFAULT_PATHS = [
+        '/api/v1/alert/?page_size=1000',
+        '/api/v1/alert/run/today/',
+        '/api/v1/post_alerted/?page_size=1000',
+    ]
+
+    # ini: methods
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', action='append', dest='paths', help='Listagem a medir (pode repetir).')
+        parser.add_argument('--iterations', type=int, default=20, help='Execuções medidas de cada etapa.')
+        parser.add_argument('--output', help='Arquivo JSON para salvar o resultado.')
+
+    @staticmethod
+    def measure(function, iterations: int):
+        """
+        Executa a função `iterations` vezes.
+
+        :param function:    Função sem argumentos.
+        :param iterations:  Execuções medidas.
+        :return:            Tupla (mediana em ms, resultado da última execução).
+        """
+
+        timings = list()
+        for _ in range(iterations):
+            start   = time.perf_counter()
+            result  = function()
+            timings.append(time.perf_counter() - start)
+
+        return round(statistics.median(timings) * 1000, 3), result
+
+    def benchmark(self, path: str, data, iterations: int) -> dict:
+        """
+        Mede renderização, decodificação e compressão de uma resposta.
+
+        :param path:        Endpoint da resposta.
+        :param data:        Dados da resposta (antes de renderizar).
+        :param iterations:  Execuções medidas de cada etapa.
+        :return:            Resultado da resposta.
+        """
+
+        json_ms, json_body      = self.measure(lambda: JSONRenderer().render(data), iterations)
+        orjson_ms, orjson_body  = self.measure(lambda: ORJSONRenderer().render(data), iterations)
+
+        json_loads_ms, _    = self.measure(lambda: json.loads(orjson_body), iterations)
+        orjson_loads_ms, _  = self.measure(lambda: orjson.loads(orjson_body), iterations)
+
+        gzip_ms, gzip_body = self.measure(
+            lambda: zlib.compress(orjson_body, settings.COMPRESSION_GZIP_LEVEL, wbits=31), iterations
+        )
+        brotli_ms, brotli_body = self.measure(
+            lambda: brotli.compress(orjson_body, quality=settings.COMPRESSION_BROTLI_QUALITY), iterations
+        )
+
+        return {
+            'path'              : path,
+            'render_json_ms'    : json_ms,
+            'render_orjson_ms'  : orjson_ms,
+            'parse_json_ms'     : json_loads_ms,
+            'parse_orjson_ms'   : orjson_loads_ms,
+            'bytes_json'        : len(json_body),
+            'bytes_orjson'      : len(orjson_body),
+            'bytes_gzip'        : len(gzip_body),
+            'bytes_brotli'      : len(brotli_body),
+            'gzip_ms'           : gzip_ms,
+            'brotli_ms'         : brotli_ms,
+        }
+
+    def handle(self, *args, **options):
+        client = APIClient()
+        client.force_authenticate(User(username='benchmark_rendering', is_staff=True, is_superuser=True))
+
+        results = list()
+        for path in options['paths'] or self.DEFAULT_PATHS:
+            response = client.get(path)
+            if response.status_code >= 400 or not hasattr(response, 'data'):
+                raise CommandError(f'GET {path} retornou {response.status_code} sem dados para renderizar.')
+
+            result = self.benchmark(path, response.data, options['iterations'])
+            results.append(result)
+
+            self.stdout.write(
+                f'{path}:\n'
+                f'  renderização: json {result["render_json_ms"]} ms, orjson {result["render_orjson_ms"]} ms '
+                f'({result["render_json_ms"] / max(result["render_orjson_ms"], 0.001):.1f}x)\n'
+                f'  decodificação: json {result["parse_json_ms"]} ms, orjson {result["parse_orjson_ms"]} ms\n'
+                f'  bytes: json {result["bytes_json"]}, orjson {result["bytes_orjson"]}, '
+                f'gzip {result["bytes_gzip"]} ({result["gzip_ms"]} ms), '
+                f'brotli {result["bytes_brotli"]} ({result["brotli_ms"]} ms)'
+            )
+
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                json.dump({ 'results': results }, file, indent=4)
+
+    # end: methods
@@ -0,0 +1,83 @@
+"""
+Comando para verificar, via EXPLAIN, os planos das consultas de cada endpoint.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+from django.db                      import transaction
+from django.contrib.auth.models     import User
+from django.core.management.base    import BaseCommand, CommandError
+from rest_framework.test            import APIClient
+
+from app_alert_param.core.alert.alert_cache                import AlertCache
+from app_alert_param.core.query_plan.check_query_plan      import CheckQueryPlan
+
+
+class Command(BaseCommand):
+    """
+    Verifica os planos das consultas dos endpoints (CheckQueryPlan) contra o banco configurado, com a
+    massa de dados semeada dentro de uma transação (desfeita ao final), e falha se aparecer um
+    `Seq Scan` em uma das tabelas grandes. A mesma verificação roda nos testes
+    (app_alert_param.tests.test_query_plans), contra o banco de testes.
+
+    Uso: python manage.py check_query_plans [--verbose-plans]
+    """
+
+    help = 'Verifica, via EXPLAIN, se as consultas dos endpoints usam índices nas tabelas grandes.'
+
+    # ini: methods
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verbose-plans', action='store_true', help='Exibe o plano de todas as consultas.')
+
+    def check_request(self, client: APIClient, method: str, url: str, data: dict, verbose_plans: bool) -> list:
+        """
+        Executa uma requisição e verifica suas consultas.
+
+        :return:    Lista de falhas (url, consulta, tabelas, plano).
+        """
+
+        status_code, plans = CheckQueryPlan.check_request(client, method, url, data)
+
+        if status_code >= 400:
+            raise CommandError(f'{method.upper()} {url} retornou {status_code}.')
+
+        failures = list()
+        for sql, seq_scans, plan in plans:
+            if seq_scans:
+                failures.append((url, sql, seq_scans, plan))
+            elif verbose_plans:
+                self.stdout.write(f'{method.upper()} {url}\n{sql}\n{plan}\n')
+
+        status = self.style.ERROR('SEQ SCAN') if failures else self.style.SUCCESS('OK')
+        self.stdout.write(f'{status} {method.upper()} {url} ({len(plans)} consultas)')
+
+        return failures
+
+    def handle(self, *args, **options):
+        client = APIClient()
+        client.force_authenticate(User(username='check_query_plans', is_staff=True, is_superuser=True))
+
+        failures = list()
+        with transaction.atomic():
+            alert, id_user = CheckQueryPlan.seed()
+            CheckQueryPlan.disable_seqscan()
+
+            for method, url, data in CheckQueryPlan.get_requests(alert, id_user):
+                failures += self.check_request(client, method, url, data, options['verbose_plans'])
+
+            transaction.set_rollback(True)
+
+        # Descarta o que foi para o cache a partir da massa de dados desfeita
+        AlertCache.invalidate_all()
+
+        for url, sql, seq_scans, plan in failures:
+            self.stderr.write(f'\n{url} - Seq Scan em {", ".join(seq_scans)}:\n{sql}\n{plan}')
+
+        if failures:
+            raise CommandError(f'{len(failures)} consulta(s) com Seq Scan em tabelas grandes.')
+
+        self.stdout.write(self.style.SUCCESS('Nenhum Seq Scan em tabelas grandes.'))
+
+    # end: methods
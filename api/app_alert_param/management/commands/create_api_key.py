@@ -0,0 +1,45 @@
+"""
+Comando para criar uma chave de API para um serviço.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+from django.contrib.auth            import get_user_model
+from django.core.management.base    import BaseCommand, CommandError
+
+from app_alert_param.models         import ApiKey
+from app_alert_param.authentication import ApiKeyAuthentication
+
+
+class Command(BaseCommand):
+    """
+    Cria uma chave de API em nome de um usuário existente e exibe a chave uma única vez
+    (apenas o digest do segredo é gravado).
+
+    Uso: python manage.py create_api_key <nome> <username>
+    """
+
+    help = 'Cria uma chave de API para um serviço, em nome de um usuário existente.'
+
+    # ini: methods
+
+    def add_arguments(self, parser):
+        parser.add_argument('name', help='Nome do serviço dono da chave.')
+        parser.add_argument('username', help='Usuário em nome do qual o serviço acessa a API.')
+
+    def handle(self, *args, **options):
+        user = get_user_model()._default_manager.filter(username=options['username']).first()
+        if user is None:
+            raise CommandError(f'Usuário {options["username"]} não encontrado.')
+
+        if ApiKey.objects.filter(name=options['name']).exists():
+            raise CommandError(f'Já existe uma chave de API com o nome {options["name"]}.')
+
+        prefix, key, digest = ApiKeyAuthentication.generate_key()
+        ApiKey.objects.create(name=options['name'], user=user, prefix=prefix, digest=digest)
+
+        self.stdout.write(self.style.SUCCESS(f'Chave de API criada para {options["name"]}:'))
+        self.stdout.write(key)
+
+    # end: methods
@@ -0,0 +1,77 @@
+"""
+Comando para particionar, por mês, a tabela de posts alertados e manter suas partições.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app_alert_param.core.post_alerted.partition_post_alerted import PartitionPostAlerted, PartitionError
+
+
+class Command(BaseCommand):
+    """
+    Mantém a tabela de posts alertados particionada por mês de `date`.
+
+    - `--convert`: converte a tabela comum em particionada, copiando os posts (uma vez, com a
+      tabela bloqueada durante a cópia);
+    - sem opções: cria as partições do mês atual e dos `--months` meses seguintes que faltarem,
+      e as dos meses com posts na partição padrão (agendar, por exemplo, diariamente);
+    - `--detach-before AAAA-MM`: desanexa as partições anteriores ao mês, renomeando-as com o sufixo
+      `_detached` (e as remove, com `--drop`).
+
+    Uso: python manage.py partition_posts_alerted [--convert] [--months 3]
+         [--detach-before 2025-01 [--drop]]
+    """
+
+    help = 'Particiona por mês a tabela de posts alertados e cria ou desanexa suas partições.'
+
+    # ini: methods
+
+    def add_arguments(self, parser):
+        parser.add_argument('--convert', action='store_true', help='Converte a tabela comum em particionada.')
+        parser.add_argument('--months', type=int, default=3, help='Meses futuros com partição garantida.')
+        parser.add_argument('--detach-before', help='Desanexa as partições anteriores ao mês (AAAA-MM).')
+        parser.add_argument('--drop', action='store_true', help='Remove as partições desanexadas.')
+
+    def handle(self, *args, **options):
+        if options['drop'] and not options['detach_before']:
+            raise CommandError('--drop exige --detach-before.')
+
+        month = None
+        if options['detach_before']:
+            try:
+                month = datetime.datetime.strptime(options['detach_before'], '%Y-%m').date()
+            except ValueError:
+                raise CommandError('--detach-before deve estar no formato AAAA-MM.')
+
+        try:
+            if options['convert']:
+                copied = PartitionPostAlerted.convert(options['months'])
+                self.stdout.write(self.style.SUCCESS(f'Tabela convertida; {copied} post(s) copiado(s).'))
+
+            else:
+                created, skipped = PartitionPostAlerted.ensure_partitions(options['months'])
+                self.stdout.write(self.style.SUCCESS(
+                    f'{len(created)} partição(ões) criada(s){": " + ", ".join(created) if created else "."}'
+                ))
+                if skipped:
+                    self.stderr.write(self.style.WARNING(
+                        f'{len(skipped)} partição(ões) não criada(s), o nome já é usado por uma tabela comum '
+                        f'(renomeie-a; os posts do mês seguem na partição padrão): {", ".join(skipped)}'
+                    ))
+
+            if month is not None:
+                detached = PartitionPostAlerted.detach_before(month, options['drop'])
+                action   = 'removida(s)' if options['drop'] else 'desanexada(s)'
+                self.stdout.write(self.style.SUCCESS(
+                    f'{len(detached)} partição(ões) {action}{": " + ", ".join(detached) if detached else "."}'
+                ))
+
+        except PartitionError as err:
+            raise CommandError(str(err))
+
+    # end: methods
@@ -8,8 +8,10 @@ Orquestrador para endpoints relacionados ao viewset de Parametros de Alerta.
 from rest_framework.request     import Request
 from rest_framework.response    import Response
 
-from app_alert_param.core.alert.create_alert import CreateAlert
-from app_alert_param.core.alert.update_alert import UpdateAlert
+from app_alert_param.core.alert.create_alert  import CreateAlert
+from app_alert_param.core.alert.update_alert  import UpdateAlert
+from app_alert_param.core.alert.lease_alert   import LeaseAlert
+from app_alert_param.core.alert.advance_alert import AdvanceAlert
 
 from app_alert_param.models import Alert
 
@@ -55,6 +57,18 @@ class AlertManager:
 
         return UpdateAlert.deactivate(request, alert)
     
+    @staticmethod
+    def retrieve(request: Request, alert_id: str) -> Response:
+        """ Método para retornar um alerta, lendo do cache quando possível. """
+
+        return UpdateAlert.retrieve(request, alert_id)
+
+    @staticmethod
+    def cache_stats(request: Request) -> Response:
+        """ Método para retornar os contadores do cache de alertas. """
+
+        return UpdateAlert.cache_stats(request)
+
     @staticmethod
     def list(request: Request) -> Response:
         """ Sobrescreve o método list para incluir campos adicionais nos relacionamentos ManyToMany. """
@@ -79,4 +93,40 @@ class AlertManager:
 
         return UpdateAlert.list_active_alerts_run_today(request)
 
+    @staticmethod
+    async def alist(request: Request) -> Response:
+        """ Versão assíncrona do list (ASYNC_READ_VIEWS). """
+
+        return await UpdateAlert.alist(request)
+
+    @staticmethod
+    async def alist_by_user(request: Request, user_id: str) -> Response:
+        """ Versão assíncrona do list_by_user (ASYNC_READ_VIEWS). """
+
+        return await UpdateAlert.alist_by_user(request, user_id)
+
+    @staticmethod
+    async def alist_active_by_user(request: Request, user_id: str) -> Response:
+        """ Versão assíncrona do list_active_by_user (ASYNC_READ_VIEWS). """
+
+        return await UpdateAlert.alist_active_by_user(request, user_id)
+
+    @staticmethod
+    async def alist_active_alerts_run_today(request: Request) -> Response:
+        """ Versão assíncrona do list_active_alerts_run_today (ASYNC_READ_VIEWS). """
+
+        return await UpdateAlert.alist_active_alerts_run_today(request)
+
+    @staticmethod
+    def claim(request: Request) -> Response:
+        """ Método para reservar alertas que devem rodar para um worker do gerador. """
+
+        return LeaseAlert.claim(request)
+
+    @staticmethod
+    def advance_run(request: Request) -> Response:
+        """ Método para avançar, em lote, o próximo dia a rodar dos alertas. """
+
+        return AdvanceAlert.advance_run(request)
+
     # end: methods
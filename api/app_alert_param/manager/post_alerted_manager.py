@@ -8,8 +8,12 @@ Orquestrador para endpoints relacionados ao viewset de Posts Alertados.
 from rest_framework.request     import Request
 from rest_framework.response    import Response
 
-from app_alert_param.core.post_alerted.create_post_alerted      import CreatePostAlerted
-from app_alert_param.core.post_alerted.get_data_post_alerted    import GetDataPostAlerted
+from app_alert_param.core.post_alerted.create_post_alerted          import CreatePostAlerted
+from app_alert_param.core.post_alerted.bulk_create_post_alerted     import BulkCreatePostAlerted
+from app_alert_param.core.post_alerted.stream_create_post_alerted   import StreamCreatePostAlerted
+from app_alert_param.core.post_alerted.get_data_post_alerted        import GetDataPostAlerted
+from app_alert_param.core.post_alerted.match_post_alerted           import MatchPostAlerted
+from app_alert_param.core.post_alerted.archive_post_alerted         import ArchivePostAlerted
 
 
 class PostAlertedManager:
@@ -22,6 +26,18 @@ class PostAlertedManager:
         """ Método para criar um novo post alertado. """
 
         return CreatePostAlerted.create(request)
+
+    @staticmethod
+    def bulk_create(request: Request) -> Response:
+        """ Método para criar um lote de posts alertados. """
+
+        return BulkCreatePostAlerted.create(request)
+
+    @staticmethod
+    def stream_create(request: Request) -> Response:
+        """ Método para criar posts alertados a partir de um stream NDJSON. """
+
+        return StreamCreatePostAlerted.create(request)
     
     @staticmethod
     def list(request: Request) -> Response:
@@ -31,8 +47,32 @@ class PostAlertedManager:
     
     @staticmethod
     def list_by_alert(request: Request, alert_id: int) -> Response:
-        """ Método para listar os posts alertados associados a um determinado alerta. """
+        """ Método para listar os posts alertados associados a um determinado alerta (ou os arquivados, com `?archived=true`). """
+
+        if ArchivePostAlerted.is_requested(request):
+            return ArchivePostAlerted.list_by_alert(request, alert_id)
 
         return GetDataPostAlerted.list_by_alert(request, alert_id)
 
+    @staticmethod
+    async def alist(request: Request) -> Response:
+        """ Versão assíncrona do list (ASYNC_READ_VIEWS). """
+
+        return await GetDataPostAlerted.alist(request)
+
+    @staticmethod
+    async def alist_by_alert(request: Request, alert_id: int) -> Response:
+        """ Versão assíncrona do list_by_alert (ASYNC_READ_VIEWS). """
+
+        if ArchivePostAlerted.is_requested(request):
+            return await ArchivePostAlerted.alist_by_alert(request, alert_id)
+
+        return await GetDataPostAlerted.alist_by_alert(request, alert_id)
+
+    @staticmethod
+    def match(request: Request) -> Response:
+        """ Método para verificar quais alertas ativos um lote de posts aciona. """
+
+        return MatchPostAlerted.match(request)
+
     # end: methods
@@ -6,6 +6,7 @@ Models para parametrização de alertas gerados no sistema de identificação de
 """
 
 from django.db              import models
+from django.conf            import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
 
 from core.model.base import Base
@@ -84,6 +85,8 @@ class Alert(Base):
     )
     last_run        = models.DateField()
     run             = models.DateField()
+    leased_until    = models.DateTimeField(null=True, blank=True)
+    lease_token     = models.CharField(max_length=36, null=True, blank=True)
 
     class Meta:
         """ Meta informações para a classe Alert. """
@@ -92,12 +95,27 @@ class Alert(Base):
         verbose_name        = 'Alert'
         verbose_name_plural = 'Alerts'
 
+        indexes = [
+            # Alertas que devem rodar: run/today, claim e run/advance (ordenados por run, id)
+            models.Index(
+                fields      = ['run', 'id'],
+                condition   = models.Q(is_active=True),
+                name        = 'alert_active_run_idx',
+            ),
+            # Alertas do usuário (todos ou apenas ativos), paginados por id
+            models.Index(fields=['id_user', 'is_active', 'id'], name='alert_user_active_idx'),
+        ]
+
     def __str__(self):
         return f'{self.name} ({self.id})'
 
 
 class PostAlerted(Base):
-    """ Model para armazenar alertas gerados pelo sistema. """
+    """
+    Model para armazenar alertas gerados pelo sistema.
+
+    No banco, a tabela pode ser particionada por mês de `date` (comando `partition_posts_alerted`).
+    """
 
     id_post         = models.IntegerField()
     title           = models.CharField(max_length=100)
@@ -115,5 +133,60 @@ class PostAlerted(Base):
         verbose_name        = 'Post Alerted'
         verbose_name_plural = 'Posts Alerted'
 
+        indexes = [
+            # Posts alertados de um alerta, ordenados e paginados por (date, id)
+            models.Index(fields=['alert', 'date', 'id'], name='post_alerted_alert_date_idx'),
+            # Todos os posts alertados, ordenados e paginados por (date, id)
+            models.Index(fields=['date', 'id'], name='post_alerted_date_idx'),
+        ]
+
     def __str__(self):
         return f'{self.title} ({self.id})'
+
+
+class PostAlertedArchive(Base):
+    """ Model para o manifesto dos arquivos de posts alertados arquivados (comando `archive_posts_alerted`). """
+
+    # Sem FK no banco: o manifesto dos arquivos continua existindo depois que o alerta é removido
+    alert       = models.ForeignKey(Alert, on_delete=models.DO_NOTHING, db_constraint=False)
+    date_start  = models.DateField()
+    date_end    = models.DateField()
+    path        = models.CharField(max_length=255)
+    posts       = models.IntegerField()
+    size        = models.BigIntegerField()
+    sha256      = models.CharField(max_length=64)
+
+    class Meta:
+        """ Meta informações para a classe PostAlertedArchive. """
+
+        db_table            = f'{SCHEMA_NAME}post_alerted_archive'
+        verbose_name        = 'Post Alerted Archive'
+        verbose_name_plural = 'Posts Alerted Archives'
+
+        indexes = [
+            # Arquivos de um alerta que cobrem um período
+            models.Index(fields=['alert', 'date_start', 'date_end'], name='post_alerted_archive_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.path} ({self.id})'
+
+
+class ApiKey(Base):
+    """ Model para armazenar as chaves de API dos serviços (ex.: gerador de alertas). """
+
+    name        = models.CharField(max_length=100, unique=True)
+    user        = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    prefix      = models.CharField(max_length=16, unique=True)
+    digest      = models.CharField(max_length=64)
+    is_active   = models.BooleanField(default=True)
+
+    class Meta:
+        """ Meta informações para a classe ApiKey. """
+
+        db_table            = f'{SCHEMA_NAME}api_key'
+        verbose_name        = 'API Key'
+        verbose_name_plural = 'API Keys'
+
+    def __str__(self):
+        return f'{self.name} ({self.id})'
@@ -53,7 +53,7 @@ class AlertSerializer(serializers.ModelSerializer):
         """ Meta opções do serializer. """
 
         model = Alert
-        fields = '__all__'
+        exclude = ('leased_until', 'lease_token')
         extra_kwargs = {
             'id'            : { 'read_only': True },
             'created_at'    : { 'read_only': True },
@@ -64,6 +64,42 @@ class AlertSerializer(serializers.ModelSerializer):
         }
 
 
+class AlertListSerializer(AlertSerializer):
+    """
+    Serializer de listagem para o model Alert.
+
+    Lê os nomes de fóruns, e-mails e palavras-chave das anotações feitas no queryset
+    (UpdateAlert.annotate_ntn_fields), sem consultas extras por alerta.
+    """
+
+    forums      = serializers.ListField(source='forums_names'   , child=serializers.CharField(), read_only=True)
+    emails      = serializers.ListField(source='emails_names'   , child=serializers.CharField(), read_only=True)
+    keywords    = serializers.ListField(source='keywords_names' , child=serializers.CharField(), read_only=True)
+
+    class Meta(AlertSerializer.Meta):
+        """ Meta opções do serializer, na mesma ordem de campos do AlertSerializer. """
+
+        exclude = None
+        fields  = (
+            'id',
+            'created_at',
+            'updated_at',
+            'name',
+            'is_active',
+            'id_user',
+            'start_date',
+            'final_date',
+            'qte_frequency',
+            'type_frequency',
+            'is_relevant',
+            'last_run',
+            'run',
+            'forums',
+            'emails',
+            'keywords',
+        )
+
+
 class PostAlertedSerializer(serializers.ModelSerializer):
     """ Serializer para o model PostAlerted. """
 
@@ -0,0 +1,112 @@
+"""
+Sinais do aplicativo app_alert_param.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+from django.db                  import connections
+from django.dispatch            import receiver
+from django.utils               import timezone
+from django.db.models.signals   import m2m_changed, post_init, post_save, post_delete, pre_migrate
+
+from app_alert_param.core.alert.alert_cache           import AlertCache
+from app_alert_param.core.dimension.dimension_cache   import DIMENSION_CACHES
+
+from app_alert_param.models import Alert, Email, Forum, Keyword, PostAlerted
+
+
+# Schemas do banco, criados também em db/init-scripts/create_schemas.sql
+SCHEMAS = ( 'django', 'alert_param' )
+
+# Model dono e campo ManyToMany correspondentes a cada tabela intermediária
+NTN_FIELDS = {
+    Alert.forums.through                : (Alert, 'forums'),
+    Alert.emails.through                : (Alert, 'emails'),
+    Alert.keywords.through              : (Alert, 'keywords'),
+    PostAlerted.keywords_found.through  : (PostAlerted, 'keywords_found'),
+}
+
+@receiver(m2m_changed, sender=Alert.forums.through)
+@receiver(m2m_changed, sender=Alert.emails.through)
+@receiver(m2m_changed, sender=Alert.keywords.through)
+@receiver(m2m_changed, sender=PostAlerted.keywords_found.through)
+def touch_on_ntn_change(sender, instance, action: str, reverse: bool, pk_set: set, **kwargs):
+    """
+    Atualiza o `updated_at` dos alertas (ou posts alertados) cujos ManyToMany mudaram.
+
+    Alterações em ManyToMany não passam pelo save() do registro; com isso o `updated_at`
+    continua refletindo qualquer mudança no registro, e pode ser usado para detectar
+    alterações (ex.: recompilar o matcher de palavras-chave, ETag das listagens).
+    """
+
+    model, field = NTN_FIELDS[sender]
+
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            model.objects.filter(pk=instance.pk).update(updated_at=timezone.now())
+
+            if model is Alert:
+                AlertCache.invalidate_alert(instance.pk, instance.id_user)
+
+    elif action in ('post_add', 'post_remove') and pk_set:
+        model.objects.filter(pk__in=pk_set).update(updated_at=timezone.now())
+
+        if model is Alert:
+            for alert_id, user_id in Alert.objects.filter(pk__in=pk_set).values_list('id', 'id_user'):
+                AlertCache.invalidate_alert(alert_id, user_id)
+
+    elif action == 'pre_clear':
+        model.objects.filter(**{ field: instance }).update(updated_at=timezone.now())
+
+        if model is Alert:
+            AlertCache.invalidate_all()
+
+
+@receiver(post_init, sender=Alert)
+def remember_alert_user(sender, instance: Alert, **kwargs):
+    """ Guarda o usuário com que o alerta foi carregado, para invalidar também suas listagens se ele mudar. """
+
+    instance._loaded_id_user = instance.__dict__.get('id_user')
+
+
+@receiver(post_save, sender=Alert)
+@receiver(post_delete, sender=Alert)
+def invalidate_alert_cache(sender, instance: Alert, **kwargs):
+    """ Invalida o cache do alerta salvo ou removido (detalhe, listagens do usuário e de hoje). """
+
+    AlertCache.invalidate_alert(instance.pk, instance.id_user, instance._loaded_id_user)
+    instance._loaded_id_user = instance.id_user
+
+
+@receiver(post_save, sender=Forum)
+@receiver(post_save, sender=Email)
+@receiver(post_save, sender=Keyword)
+@receiver(post_delete, sender=Forum)
+@receiver(post_delete, sender=Email)
+@receiver(post_delete, sender=Keyword)
+def invalidate_alert_cache_on_dimension_change(sender, instance, created: bool = False, **kwargs):
+    """
+    Invalida todo o cache de alertas e o cache de ids do processo quando um fórum, e-mail ou
+    palavra-chave existente muda (renomeado ou removido).
+    """
+
+    # Registros novos ainda não aparecem em nenhum alerta, e o cache de ids só guarda nomes existentes
+    if not created:
+        AlertCache.invalidate_all()
+        DIMENSION_CACHES[sender].clear()
+
+
+@receiver(pre_migrate)
+def create_schemas(sender, using: str, **kwargs):
+    """
+    Cria os schemas antes das migrações, em bancos que não passaram pelos scripts de
+    inicialização (ex.: o banco criado por `manage.py test`).
+    """
+
+    if sender.name != 'app_alert_param':
+        return
+
+    with connections[using].cursor() as cursor:
+        for schema in SCHEMAS:
+            cursor.execute(f'CREATE SCHEMA IF NOT EXISTS {schema}')
@@ -0,0 +1,98 @@
+"""
+Testes do número de consultas das listagens de alertas.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import datetime
+
+from django.core.cache          import cache
+from django.contrib.auth.models import User
+from rest_framework.test        import APITestCase
+
+from app_alert_param.models import Alert, Email, Forum, Keyword
+
+
+class AlertListQueriesTestCase(APITestCase):
+    """
+    As listagens anotam e-mails, palavras-chave e fóruns na consulta dos alertas
+    (UpdateAlert.annotate_ntn_fields), então o número de consultas não cresce com os alertas.
+    """
+
+    USER_ID = 7
+
+    # ini: methods
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+
+        cls.forums      = [ Forum.objects.create(forum_name=f'F{index}') for index in range(3) ]
+        cls.emails      = [ Email.objects.create(email=f'user{index}@example.com') for index in range(3) ]
+        cls.keywords    = [ Keyword.objects.create(word=f'KW{index}') for index in range(3) ]
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.user)
+
+    def create_alerts(self, count: int):
+        """
+        Cria alertas ativos do usuário, que rodam hoje, com vários relacionamentos cada.
+
+        :param count:   Quantidade de alertas.
+        """
+
+        today = datetime.date.today()
+
+        for index in range(count):
+            alert = Alert.objects.create(
+                name            = f'Alerta {index}',
+                id_user         = self.USER_ID,
+                start_date      = today,
+                final_date      = today + datetime.timedelta(days=30),
+                qte_frequency   = 1,
+                type_frequency  = 'day',
+                last_run        = today,
+                run             = today,
+            )
+            alert.forums.set(self.forums)
+            alert.emails.set(self.emails)
+            alert.keywords.set(self.keywords)
+
+    def assert_constant_queries(self, url: str, queries: int):
+        """
+        Confere o número de consultas da listagem com poucos e com muitos alertas.
+
+        :param url:     URL da listagem.
+        :param queries: Consultas esperadas, independentes da quantidade de alertas.
+        """
+
+        for count in (2, 20):
+            self.create_alerts(count - Alert.objects.count())
+            cache.clear()
+
+            with self.assertNumQueries(queries):
+                response = self.client.get(url)
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.data['data']), count)
+
+            alert = response.data['data'][0]
+            self.assertEqual(alert['forums'], [ forum.forum_name for forum in self.forums ])
+            self.assertEqual(alert['emails'], [ email.email for email in self.emails ])
+            self.assertEqual(alert['keywords'], [ keyword.word for keyword in self.keywords ])
+
+    def test_list_queries(self):
+        # Alertas (sem ETag na listagem geral)
+        self.assert_constant_queries('/api/v1/alert/', 1)
+
+    def test_list_by_user_queries(self):
+        # Versão da ETag + alertas
+        self.assert_constant_queries(f'/api/v1/alert/user/{self.USER_ID}/', 2)
+
+    def test_list_run_today_queries(self):
+        # Versão da ETag + alertas
+        self.assert_constant_queries('/api/v1/alert/run/today/', 2)
+
+    # end: methods
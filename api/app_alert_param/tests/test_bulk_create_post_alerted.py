@@ -0,0 +1,93 @@
+"""
+Testes da criação em lote de posts alertados.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import datetime
+
+from django.core.cache          import cache
+from django.contrib.auth.models import User
+from rest_framework.test        import APITestCase
+
+from app_alert_param.core.dimension.dimension_cache import forum_cache, keyword_cache
+from app_alert_param.models import Alert, Forum, Keyword, PostAlerted
+
+
+class BulkCreatePostAlertedTestCase(APITestCase):
+    """ Um item que o banco rejeitaria recebe o erro sozinho, sem derrubar os demais itens do lote. """
+
+    URL = '/api/v1/post_alerted/bulk/'
+
+    # ini: methods
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+
+        today = datetime.date.today()
+        cls.alert = Alert.objects.create(
+            name            = 'Alerta',
+            id_user         = 7,
+            start_date      = today,
+            final_date      = today + datetime.timedelta(days=30),
+            qte_frequency   = 1,
+            type_frequency  = 'days',
+            last_run        = today,
+            run             = today,
+        )
+        Forum.objects.create(forum_name='FORUM')
+        Keyword.objects.create(word='KW')
+
+    def setUp(self):
+        cache.clear()
+        forum_cache.clear()
+        keyword_cache.clear()
+        self.client.force_authenticate(self.user)
+
+    def get_post(self, id_post: int, **fields) -> dict:
+        return {
+            'id_post'           : id_post,
+            'title'             : f'Post {id_post}',
+            'description'       : '',
+            'alert'             : self.alert.id,
+            'forum'             : 'FORUM',
+            'keywords_found'    : [ 'KW' ],
+            'relevance'         : 0.5,
+            'date'              : str(datetime.date.today()),
+            **fields,
+        }
+
+    def assert_only_failed(self, bad_post: dict):
+        """
+        Envia o item inválido entre dois válidos e confere que só ele falhou.
+
+        :param bad_post:    Item inválido.
+        """
+
+        response = self.client.post(self.URL, [ self.get_post(1), bad_post, self.get_post(2) ], format='json')
+
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(response.data['data']['created'], 2)
+        self.assertEqual(
+            [ result['status'] for result in response.data['data']['results'] ], [ 'success', 'error', 'success' ]
+        )
+        self.assertEqual(
+            sorted(PostAlerted.objects.values_list('id_post', flat=True)), [ 1, 2 ]
+        )
+
+    def test_id_post_out_of_range(self):
+        self.assert_only_failed(self.get_post(2 ** 40))
+
+    def test_description_not_text(self):
+        self.assert_only_failed(self.get_post(3, description={ 'text': 'x' }))
+
+    def test_title_not_text(self):
+        self.assert_only_failed(self.get_post(3, title=[ 'x' ]))
+
+    def test_rejected_by_database(self):
+        # Passa pela validação, mas o banco não aceita NUL em texto: o lote é inserido item a item
+        self.assert_only_failed(self.get_post(3, description='a\x00b'))
+
+    # end: methods
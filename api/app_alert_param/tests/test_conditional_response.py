@@ -0,0 +1,65 @@
+"""
+Testes das respostas condicionais (ETag / If-None-Match) das listagens.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import datetime
+
+from django.core.cache          import cache
+from django.contrib.auth.models import User
+from rest_framework.test        import APITestCase
+
+from app_alert_param.models import Alert, Keyword
+
+
+class ConditionalResponseTestCase(APITestCase):
+    """ A ETag das listagens muda quando os dados exibidos mudam, inclusive por remoções em cascata. """
+
+    USER_ID = 7
+
+    # ini: methods
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+
+        today = datetime.date.today()
+        cls.alert = Alert.objects.create(
+            name            = 'Alerta',
+            id_user         = cls.USER_ID,
+            start_date      = today,
+            final_date      = today + datetime.timedelta(days=30),
+            qte_frequency   = 1,
+            type_frequency  = 'days',
+            last_run        = today,
+            run             = today,
+        )
+        cls.keywords = [ Keyword.objects.create(word=f'KW{index}') for index in range(3) ]
+        cls.alert.keywords.set(cls.keywords)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.user)
+
+    def get(self, etag: str = None):
+        headers = { 'HTTP_IF_NONE_MATCH': etag } if etag else dict()
+        return self.client.get(f'/api/v1/alert/user/{self.USER_ID}/', **headers)
+
+    def test_not_modified(self):
+        etag = self.get()['ETag']
+
+        self.assertEqual(self.get(etag).status_code, 304)
+
+    def test_delete_related(self):
+        etag = self.get()['ETag']
+
+        # Remove os vínculos em cascata, sem m2m_changed, e não é a palavra-chave mais recente
+        self.keywords[0].delete()
+
+        response = self.get(etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['data'][0]['keywords'], [ 'KW1', 'KW2' ])
+
+    # end: methods
@@ -0,0 +1,49 @@
+"""
+Testes dos planos das consultas dos endpoints (Seq Scan nas tabelas grandes).
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+from django.core.cache          import cache
+from django.contrib.auth.models import User
+from rest_framework.test        import APITestCase
+
+from app_alert_param.core.query_plan.check_query_plan import CheckQueryPlan
+
+
+class QueryPlansTestCase(APITestCase):
+    """
+    Cada consulta dos endpoints verificados (CheckQueryPlan.get_requests) deve usar índices nas
+    tabelas grandes: com `enable_seqscan = off`, um Seq Scan indica que não há índice utilizável.
+    """
+
+    # ini: methods
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+        cls.alert, cls.id_user = CheckQueryPlan.seed()
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.user)
+
+        # Vale até o fim da transação do teste
+        CheckQueryPlan.disable_seqscan()
+
+    def test_no_seq_scans(self):
+        # As requisições rodam em ordem: a reserva e os avanços alteram os alertas semeados
+        for method, url, data in CheckQueryPlan.get_requests(self.alert, self.id_user):
+            with self.subTest(method=method, url=url):
+                status_code, plans = CheckQueryPlan.check_request(self.client, method, url, data)
+
+                self.assertLess(status_code, 400)
+
+                failures = [
+                    f'Seq Scan em {", ".join(seq_scans)}:\n{sql}\n{plan}'
+                    for sql, seq_scans, plan in plans if seq_scans
+                ]
+                self.assertFalse(failures, '\n\n'.join(failures))
+
+    # end: methods
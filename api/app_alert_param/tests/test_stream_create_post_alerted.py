@@ -0,0 +1,94 @@
+"""
+Testes da ingestão de posts alertados via stream NDJSON.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import datetime
+
+import orjson
+
+from django.core.cache          import cache
+from django.contrib.auth.models import User
+from rest_framework.test        import APITestCase
+
+from app_alert_param.core.dimension.dimension_cache import forum_cache, keyword_cache
+from app_alert_param.models import Alert, Forum, Keyword, PostAlerted
+
+
+class StreamCreatePostAlertedTestCase(APITestCase):
+    """ O corpo NDJSON pode vir com Content-Length ou em partes (Transfer-Encoding: chunked). """
+
+    URL = '/api/v1/post_alerted/bulk/stream/'
+
+    # ini: methods
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+
+        today = datetime.date.today()
+        cls.alert = Alert.objects.create(
+            name            = 'Alerta',
+            id_user         = 7,
+            start_date      = today,
+            final_date      = today + datetime.timedelta(days=30),
+            qte_frequency   = 1,
+            type_frequency  = 'days',
+            last_run        = today,
+            run             = today,
+        )
+        Forum.objects.create(forum_name='FORUM')
+        Keyword.objects.create(word='KW')
+
+    def setUp(self):
+        cache.clear()
+        forum_cache.clear()
+        keyword_cache.clear()
+        self.client.force_authenticate(self.user)
+
+    def get_body(self, count: int) -> bytes:
+        return b''.join(
+            orjson.dumps({
+                'id_post'           : id_post,
+                'title'             : f'Post {id_post}',
+                'description'       : '',
+                'alert'             : self.alert.id,
+                'forum'             : 'FORUM',
+                'keywords_found'    : [ 'KW' ],
+                'relevance'         : 0.5,
+                'date'              : str(datetime.date.today()),
+            }) + b'\n'
+            for id_post in range(count)
+        )
+
+    def post(self, body: bytes, **extra):
+        return self.client.generic('POST', self.URL, body, 'application/x-ndjson', **extra)
+
+    def test_content_length(self):
+        response = self.post(self.get_body(3))
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(PostAlerted.objects.filter(alert=self.alert).count(), 3)
+
+    def test_chunked(self):
+        # Como o gunicorn: sem Content-Length e com o corpo já decodificado em wsgi.input
+        response = self.post(
+            self.get_body(3),
+            CONTENT_LENGTH          = '',
+            HTTP_TRANSFER_ENCODING  = 'chunked',
+            **{ 'wsgi.input_terminated': True },
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['data']['created'], 3)
+        self.assertEqual(PostAlerted.objects.filter(alert=self.alert).count(), 3)
+
+    def test_chunked_unsupported_server(self):
+        response = self.post(self.get_body(3), CONTENT_LENGTH='', HTTP_TRANSFER_ENCODING='chunked')
+
+        self.assertEqual(response.status_code, 411)
+        self.assertFalse(PostAlerted.objects.exists())
+
+    # end: methods
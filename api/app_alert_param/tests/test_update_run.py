@@ -0,0 +1,88 @@
+"""
+Testes do avanço do próximo dia a rodar de um alerta (update_run).
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import uuid
+import datetime
+
+from django.core.cache          import cache
+from django.utils               import timezone
+from django.contrib.auth.models import User
+from rest_framework.test        import APITestCase
+
+from app_alert_param.core.alert.advance_alert import AdvanceAlert
+from app_alert_param.models import Alert
+
+
+class UpdateRunTestCase(APITestCase):
+    """ Frequências em meses e anos avançam por calendário, como no avanço em lote (AdvanceAlert). """
+
+    # ini: methods
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.user)
+
+    def create_alert(self, run: datetime.date, type_frequency: str, **fields) -> Alert:
+        return Alert.objects.create(
+            name            = f'Alerta {type_frequency}',
+            id_user         = 7,
+            start_date      = run,
+            final_date      = run + datetime.timedelta(days=3650),
+            qte_frequency   = 1,
+            type_frequency  = type_frequency,
+            last_run        = run,
+            run             = run,
+            **fields,
+        )
+
+    def update_run(self, alert: Alert, lease: str = None):
+        query = f'?lease={lease}' if lease else ''
+        return self.client.get(f'/api/v1/alert/{alert.id}/update/run/{query}')
+
+    def test_months_with_lease(self):
+        lease = str(uuid.uuid4())
+        alert = self.create_alert(
+            datetime.date(2027, 1, 31), 'months',
+            lease_token     = lease,
+            leased_until    = timezone.now() + datetime.timedelta(minutes=10),
+        )
+
+        response = self.update_run(alert, lease)
+        self.assertEqual(response.status_code, 200)
+
+        alert.refresh_from_db()
+        self.assertEqual(alert.run, datetime.date(2027, 2, 28))
+        self.assertEqual(alert.last_run, datetime.date(2027, 1, 31))
+        self.assertIsNone(alert.lease_token)
+        self.assertIsNone(alert.leased_until)
+
+    def test_years(self):
+        alert = self.create_alert(datetime.date(2028, 2, 29), 'years')
+
+        self.assertEqual(self.update_run(alert).status_code, 200)
+
+        alert.refresh_from_db()
+        self.assertEqual(alert.run, datetime.date(2029, 2, 28))
+
+    def test_same_as_batch(self):
+        for type_frequency in AdvanceAlert.FREQUENCY_UNITS:
+            with self.subTest(type_frequency=type_frequency):
+                single  = self.create_alert(datetime.date(2027, 3, 31), type_frequency)
+                batch   = self.create_alert(datetime.date(2027, 3, 31), type_frequency)
+
+                self.assertEqual(self.update_run(single).status_code, 200)
+                AdvanceAlert.advance([ batch.id ])
+
+                single.refresh_from_db()
+                batch.refresh_from_db()
+                self.assertEqual(single.run, batch.run)
+
+    # end: methods
@@ -5,14 +5,23 @@ Endpoints para app (app_alert_param).
 :created at:    2025-07-18
 """
 
+from django.urls            import re_path
 from rest_framework.routers import SimpleRouter
 
+from core.views.async_api_view import read_write_view
+
 from app_alert_param.views import (
     AlertViewSet,
     ForumViewSet,
     EmailViewSet,
     KeywordViewSet,
     PostAlertedViewSet,
+    AsyncAlertListView,
+    AsyncAlertByUserListView,
+    AsyncActiveAlertByUserListView,
+    AsyncAlertRunTodayListView,
+    AsyncPostAlertedListView,
+    AsyncPostAlertedByAlertListView,
 )
 
 
@@ -32,3 +41,20 @@ app_alert_param_router.register( FORUMS         , ForumViewSet               )
 app_alert_param_router.register( EMAILS         , EmailViewSet               )
 app_alert_param_router.register( KEYWORDS       , KeywordViewSet             )
 app_alert_param_router.register( POST_ALERTED   , PostAlertedViewSet         )
+
+# Listagens assíncronas (ASYNC_READ_VIEWS), nas mesmas URLs das actions do roteador; devem ser
+# registradas antes dele. Nas URLs de listagem, as escritas (POST) continuam no ViewSet.
+async_read_urlpatterns = [
+    re_path(
+        rf'^{ALERTS}/$',
+        read_write_view(AsyncAlertListView.as_view(), AlertViewSet.as_view({ 'get': 'list', 'post': 'create' }))
+    ),
+    re_path( rf'^{ALERTS}/user/(?P<user_id>[^/.]+)/$'           , AsyncAlertByUserListView.as_view()          ),
+    re_path( rf'^{ALERTS}/active/user/(?P<user_id>[^/.]+)/$'    , AsyncActiveAlertByUserListView.as_view()    ),
+    re_path( rf'^{ALERTS}/run/today/$'                          , AsyncAlertRunTodayListView.as_view()        ),
+    re_path(
+        rf'^{POST_ALERTED}/$',
+        read_write_view(AsyncPostAlertedListView.as_view(), PostAlertedViewSet.as_view({ 'get': 'list', 'post': 'create' }))
+    ),
+    re_path( rf'^{POST_ALERTED}/alert/(?P<alert_id>[^/.]+)/$'   , AsyncPostAlertedByAlertListView.as_view()   ),
+]
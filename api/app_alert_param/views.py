@@ -9,6 +9,7 @@ from rest_framework.decorators  import action
 from rest_framework.request     import Request
 from rest_framework             import viewsets
 from rest_framework.response    import Response
+from rest_framework.permissions import IsAdminUser
 
 from app_alert_param.serializers import (
     AlertSerializer,
@@ -25,6 +26,9 @@ from app_alert_param.models import (
     PostAlerted,
 )
 
+from core.parsers.ndjson_parser     import NDJSONParser
+from core.views.async_api_view      import AsyncAPIView
+
 from app_alert_param.manager.alert_manager          import AlertManager
 from app_alert_param.manager.post_alerted_manager   import PostAlertedManager
 
@@ -80,23 +84,23 @@ class AlertViewSet(viewsets.ModelViewSet):
         alert = self.get_object()
         return AlertManager.update_run(request, alert)
 
-    @action(detail=True, methods=['put'], url_path='keywords')
+    @action(detail=True, methods=['put', 'patch'], url_path='keywords')
     def update_keywords(self, request: Request, pk=None, *args, **kwargs) -> Response:
-        """ Atualiza as palavras-chave de um alerta. """
+        """ Atualiza as palavras-chave de um alerta (PUT substitui; PATCH adiciona/remove). """
 
         alert = self.get_object()
         return AlertManager.update_keywords(request, alert)
 
-    @action(detail=True, methods=['put'], url_path='forums')
+    @action(detail=True, methods=['put', 'patch'], url_path='forums')
     def update_forums(self, request: Request, pk=None, *args, **kwargs) -> Response:
-        """ Atualiza os fóruns de um alerta. """
+        """ Atualiza os fóruns de um alerta (PUT substitui; PATCH adiciona/remove). """
 
         alert = self.get_object()
         return AlertManager.update_forums(request, alert)
 
-    @action(detail=True, methods=['put'], url_path='emails')
+    @action(detail=True, methods=['put', 'patch'], url_path='emails')
     def update_emails(self, request: Request, pk=None, *args, **kwargs) -> Response:
-        """ Atualiza os e-mails de um alerta. """
+        """ Atualiza os e-mails de um alerta (PUT substitui; PATCH adiciona/remove). """
 
         alert = self.get_object()
         return AlertManager.update_emails(request, alert)
@@ -108,11 +112,22 @@ class AlertViewSet(viewsets.ModelViewSet):
         alert = self.get_object()
         return AlertManager.deactivate(request, alert)
 
+    def retrieve(self, request: Request, pk=None, *args, **kwargs) -> Response:
+        """ Retorna um alerta, lendo do cache quando possível. """
+
+        return AlertManager.retrieve(request, pk)
+
     def list(self, request: Request, *args, **kwargs) -> Response:
         """ Sobrescreve o método list para incluir campos adicionais nos relacionamentos ManyToMany. """
 
         return AlertManager.list(request)
 
+    @action(detail=False, methods=['get'], url_path='cache/stats', permission_classes=[IsAdminUser])
+    def cache_stats(self, request: Request, *args, **kwargs) -> Response:
+        """ Retorna os acertos, faltas e invalidações do cache de alertas do worker (apenas staff). """
+
+        return AlertManager.cache_stats(request)
+
     @action(detail=False, methods=['get'], url_path='user/(?P<user_id>[^/.]+)')
     def list_by_user(self, request: Request, user_id=None, *args, **kwargs) -> Response:
         """ Retorna os alertas associados a um determinado user_id. """
@@ -131,6 +146,18 @@ class AlertViewSet(viewsets.ModelViewSet):
 
         return AlertManager.list_active_alerts_run_today(request)
 
+    @action(detail=False, methods=['post'], url_path='claim')
+    def claim(self, request: Request, *args, **kwargs) -> Response:
+        """ Reserva alertas ativos que devem rodar (run <= hoje) para um worker do gerador. """
+
+        return AlertManager.claim(request)
+
+    @action(detail=False, methods=['post'], url_path='run/advance')
+    def advance_run(self, request: Request, *args, **kwargs) -> Response:
+        """ Avança, em um único UPDATE, o próximo dia a rodar dos alertas informados ou de todos que devem rodar. """
+
+        return AlertManager.advance_run(request)
+
 
 class PostAlertedViewSet(viewsets.ModelViewSet):
     """ ViewSet para o modelo PostAlerted. """
@@ -138,11 +165,31 @@ class PostAlertedViewSet(viewsets.ModelViewSet):
     queryset = PostAlerted.objects.all()
     serializer_class = PostAlertedSerializer
 
+    # Escritas do gerador usam um bucket próprio, sem consumir o limite das leituras
+    throttle_scopes = {
+        'create'        : 'ingestion',
+        'bulk_create'   : 'ingestion',
+        'stream_create' : 'ingestion',
+        'match'         : 'ingestion',
+    }
+
     def create(self, request: Request, *args, **kwargs) -> Response:
         """ Cria um novo post alertado. """
 
         return PostAlertedManager.create(request)
 
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk_create(self, request: Request, *args, **kwargs) -> Response:
+        """ Cria um lote de posts alertados. """
+
+        return PostAlertedManager.bulk_create(request)
+
+    @action(detail=False, methods=['post'], url_path='bulk/stream', parser_classes=[NDJSONParser])
+    def stream_create(self, request: Request, *args, **kwargs) -> Response:
+        """ Cria posts alertados a partir de um stream NDJSON (um post por linha). """
+
+        return PostAlertedManager.stream_create(request)
+
     def list(self, request: Request, *args, **kwargs) -> Response:
         """ Sobrescreve o método list para incluir campos adicionais nos relacionamentos ManyToMany. """
 
@@ -153,3 +200,63 @@ class PostAlertedViewSet(viewsets.ModelViewSet):
         """ Retorna os posts alertados associados a um determinado alerta. """
 
         return PostAlertedManager.list_by_alert(request, alert_id)
+
+    @action(detail=False, methods=['post'], url_path='match')
+    def match(self, request: Request, *args, **kwargs) -> Response:
+        """ Retorna os alertas ativos (e palavras-chave encontradas) acionados por cada post de um lote. """
+
+        return PostAlertedManager.match(request)
+
+
+class AsyncAlertListView(AsyncAPIView):
+    """ Listagem assíncrona dos alertas (ASYNC_READ_VIEWS). """
+
+    queryset = Alert.objects.all()
+
+    async def get(self, request: Request, *args, **kwargs) -> Response:
+        return await AlertManager.alist(request)
+
+
+class AsyncAlertByUserListView(AsyncAPIView):
+    """ Listagem assíncrona dos alertas de um usuário (ASYNC_READ_VIEWS). """
+
+    queryset = Alert.objects.all()
+
+    async def get(self, request: Request, user_id=None, *args, **kwargs) -> Response:
+        return await AlertManager.alist_by_user(request, user_id)
+
+
+class AsyncActiveAlertByUserListView(AsyncAPIView):
+    """ Listagem assíncrona dos alertas ativos de um usuário (ASYNC_READ_VIEWS). """
+
+    queryset = Alert.objects.all()
+
+    async def get(self, request: Request, user_id=None, *args, **kwargs) -> Response:
+        return await AlertManager.alist_active_by_user(request, user_id)
+
+
+class AsyncAlertRunTodayListView(AsyncAPIView):
+    """ Listagem assíncrona dos alertas ativos que rodam hoje (ASYNC_READ_VIEWS). """
+
+    queryset = Alert.objects.all()
+
+    async def get(self, request: Request, *args, **kwargs) -> Response:
+        return await AlertManager.alist_active_alerts_run_today(request)
+
+
+class AsyncPostAlertedListView(AsyncAPIView):
+    """ Listagem assíncrona dos posts alertados (ASYNC_READ_VIEWS). """
+
+    queryset = PostAlerted.objects.all()
+
+    async def get(self, request: Request, *args, **kwargs) -> Response:
+        return await PostAlertedManager.alist(request)
+
+
+class AsyncPostAlertedByAlertListView(AsyncAPIView):
+    """ Listagem assíncrona dos posts alertados de um alerta (ASYNC_READ_VIEWS). """
+
+    queryset = PostAlerted.objects.all()
+
+    async def get(self, request: Request, alert_id=None, *args, **kwargs) -> Response:
+        return await PostAlertedManager.alist_by_alert(request, alert_id)
@@ -0,0 +1,71 @@
+"""
+Autenticação Basic com cache das credenciais já verificadas.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import os
+import hmac
+import hashlib
+
+from django.conf                    import settings
+from django.contrib.auth            import get_user_model
+from rest_framework.authentication  import BasicAuthentication
+
+from core.cache.ttl_cache     import TTLCache
+from core.metrics.metrics     import count_cache_requests
+
+
+class CachedBasicAuthentication(BasicAuthentication):
+    """
+    BasicAuthentication que evita repetir o hash PBKDF2 da senha a cada requisição.
+
+    Cada verificação bem-sucedida fica em um cache do processo (limitado em tamanho e com TTL),
+    indexado por um HMAC-SHA256 das credenciais com um salt aleatório do processo, de modo que
+    nem o usuário nem a senha ficam em memória. Em um acerto, o usuário é recarregado pela chave
+    primária e a entrada só é aceita se o hash de senha gravado no banco for o mesmo da
+    verificação original: trocar a senha (em qualquer worker) invalida a entrada na hora.
+    """
+
+    cache   = TTLCache(
+        maxsize = settings.AUTH_CACHE_MAX_SIZE,
+        ttl     = settings.AUTH_CACHE_TTL,
+    )
+    salt    = os.urandom(32)
+
+    # ini: methods
+
+    @classmethod
+    def get_cache_key(cls, userid: str, password: str) -> str:
+        """
+        Gera a chave do cache a partir das credenciais.
+
+        :param userid:      Usuário informado.
+        :param password:    Senha informada.
+        :return:            Digest das credenciais.
+        """
+
+        return hmac.new(cls.salt, f'{userid}\0{password}'.encode(), hashlib.sha256).hexdigest()
+
+    def authenticate_credentials(self, userid, password, request=None):
+        key     = self.get_cache_key(userid, password)
+        cached  = self.cache.get(key, None)
+
+        count_cache_requests('auth', int(cached is not None), int(cached is None))
+
+        if cached is not None:
+            user_id, password_hash = cached
+
+            user = get_user_model()._default_manager.filter(pk=user_id).first()
+            if user is not None and user.is_active and user.password == password_hash:
+                return (user, None)
+
+            self.cache.delete(key)
+
+        user, auth = super().authenticate_credentials(userid, password, request)
+        self.cache.set(key, (user.pk, user.password))
+
+        return (user, auth)
+
+    # end: methods
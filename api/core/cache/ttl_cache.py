@@ -0,0 +1,97 @@
+"""
+Cache em memória, limitado em tamanho e com tempo de expiração.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import time
+import threading
+
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    Cache LRU em memória do processo, seguro para threads.
+
+    Cada entrada expira `ttl` segundos após ser gravada; ao passar de `maxsize` entradas, as
+    menos usadas recentemente são descartadas.
+    """
+
+    # Valor retornado quando a chave não está no cache
+    MISSING = object()
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Inicializa o cache.
+
+        :param maxsize: Quantidade máxima de entradas.
+        :param ttl:     Tempo de vida de cada entrada, em segundos.
+        """
+
+        self.maxsize    = maxsize
+        self.ttl        = ttl
+
+        self._lock      = threading.Lock()
+        self._data      = OrderedDict()
+
+    # ini: methods
+
+    def get(self, key, default=MISSING):
+        """
+        Retorna o valor da chave, se presente e não expirado.
+
+        :param key:     Chave.
+        :param default: Valor retornado se a chave não estiver no cache.
+        :return:        Valor em cache ou `default`.
+        """
+
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """
+        Grava o valor da chave, descartando as entradas menos usadas se o cache estiver cheio.
+
+        :param key:     Chave.
+        :param value:   Valor.
+        """
+
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        """
+        Remove a chave do cache, se presente.
+
+        :param key: Chave.
+        """
+
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """ Remove todas as entradas do cache. """
+
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    # end: methods
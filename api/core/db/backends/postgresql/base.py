@@ -0,0 +1,46 @@
+"""
+Backend PostgreSQL com estatísticas das conexões persistentes.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import time
+
+from django.db.backends.postgresql import base
+
+from core.db.connection_stats import ConnectionStats
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    Backend padrão do Django para PostgreSQL, instrumentado para o ConnectionStats.
+
+    Mede o tempo de cada conexão nova e conta fechamentos e falhas no health check
+    (`CONN_HEALTH_CHECKS`), sem alterar o comportamento das conexões persistentes.
+    """
+
+    # ini: methods
+
+    def get_new_connection(self, conn_params):
+        start = time.perf_counter()
+        connection = super().get_new_connection(conn_params)
+        ConnectionStats.record_connect(time.perf_counter() - start)
+
+        return connection
+
+    def _close(self):
+        try:
+            super()._close()
+        finally:
+            if self.connection is not None:
+                ConnectionStats.record_close()
+
+    def is_usable(self):
+        usable = super().is_usable()
+        if not usable:
+            ConnectionStats.record_health_check_failure()
+
+        return usable
+
+    # end: methods
@@ -0,0 +1,119 @@
+"""
+Estatísticas das conexões com o banco de dados, por processo (worker).
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import os
+import threading
+
+from django.conf        import settings
+from django.core        import signals
+from django.db          import connections, DEFAULT_DB_ALIAS
+
+
+class ConnectionStats:
+    """
+    Contadores das conexões persistentes do processo atual.
+
+    Com `CONN_MAX_AGE > 0` cada thread do worker mantém sua própria conexão, reaproveitada entre
+    requisições até passar da idade máxima ou falhar no health check. Nenhuma thread espera por
+    conexão, então o tamanho efetivo do pool é `workers x threads` do gunicorn; os contadores
+    servem para confirmar o reaproveitamento e medir quanto custa abrir uma conexão nova.
+    """
+
+    _lock = threading.Lock()
+
+    opened                  = 0
+    closed                  = 0
+    connect_time_total      = 0.0
+    connect_time_max        = 0.0
+    connect_time_last       = 0.0
+    health_check_failures   = 0
+
+    requests                = 0
+    requests_in_flight      = 0
+    requests_reused         = 0
+
+    # ini: methods
+
+    @classmethod
+    def record_connect(cls, seconds: float):
+        """
+        Registra a abertura de uma conexão.
+
+        :param seconds: Tempo gasto para conectar (incluindo TLS e autenticação).
+        """
+
+        with cls._lock:
+            cls.opened              += 1
+            cls.connect_time_total  += seconds
+            cls.connect_time_last   = seconds
+            cls.connect_time_max    = max(cls.connect_time_max, seconds)
+
+    @classmethod
+    def record_close(cls):
+        """ Registra o fechamento de uma conexão. """
+
+        with cls._lock:
+            cls.closed += 1
+
+    @classmethod
+    def record_health_check_failure(cls):
+        """ Registra uma conexão descartada por falhar no health check. """
+
+        with cls._lock:
+            cls.health_check_failures += 1
+
+    @classmethod
+    def request_started(cls, **kwargs):
+        """ Conta a requisição e se ela encontrou uma conexão já aberta para reaproveitar. """
+
+        reused = connections[DEFAULT_DB_ALIAS].connection is not None
+
+        with cls._lock:
+            cls.requests            += 1
+            cls.requests_in_flight  += 1
+            cls.requests_reused     += int(reused)
+
+    @classmethod
+    def request_finished(cls, **kwargs):
+        """ Marca o fim de uma requisição. """
+
+        with cls._lock:
+            cls.requests_in_flight -= 1
+
+    @classmethod
+    def as_dict(cls) -> dict:
+        """
+        Retorna as estatísticas do processo atual.
+
+        :return:    Dicionário com configuração e contadores das conexões.
+        """
+
+        database = settings.DATABASES[DEFAULT_DB_ALIAS]
+
+        with cls._lock:
+            return {
+                'pid'                   : os.getpid(),
+                'conn_max_age'          : database.get('CONN_MAX_AGE'),
+                'conn_health_checks'    : database.get('CONN_HEALTH_CHECKS'),
+                'open'                  : cls.opened - cls.closed,
+                'opened'                : cls.opened,
+                'closed'                : cls.closed,
+                'health_check_failures' : cls.health_check_failures,
+                'connect_time_avg_ms'   : round(1000 * cls.connect_time_total / cls.opened, 3) if cls.opened else None,
+                'connect_time_max_ms'   : round(1000 * cls.connect_time_max, 3),
+                'connect_time_last_ms'  : round(1000 * cls.connect_time_last, 3),
+                'requests'              : cls.requests,
+                'requests_in_flight'    : cls.requests_in_flight,
+                'requests_reused'       : cls.requests_reused,
+            }
+
+    # end: methods
+
+
+# Conectados depois do close_old_connections do Django, que já descartou conexões velhas ou inválidas
+signals.request_started.connect(ConnectionStats.request_started)
+signals.request_finished.connect(ConnectionStats.request_finished)
@@ -0,0 +1,28 @@
+"""
+Views de diagnóstico do banco de dados.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+from rest_framework.views       import APIView
+from rest_framework.request     import Request
+from rest_framework.response    import Response
+from rest_framework.permissions import IsAdminUser
+
+from core.db.connection_stats               import ConnectionStats
+from core.response_utils.response_builder   import ResponseBuilder
+from core.response_utils.response_messages  import ResponseMessages
+
+
+class DatabaseStatsView(APIView):
+    """ Retorna as estatísticas das conexões com o banco do worker que atendeu a requisição (apenas staff). """
+
+    permission_classes = [ IsAdminUser ]
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        return ResponseBuilder.build_response(
+            ResponseMessages.DB_STATS,
+
+            data=ConnectionStats.as_dict()
+        )
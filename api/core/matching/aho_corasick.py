@@ -0,0 +1,122 @@
+"""
+Autômato de Aho-Corasick para busca simultânea de várias palavras-chave em um texto.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+from collections import deque
+
+
+class AhoCorasick:
+    """
+    Autômato de Aho-Corasick.
+
+    Compila um conjunto de padrões uma única vez e encontra todas as ocorrências de todos
+    eles em uma única passada pelo texto, em tempo O(tamanho do texto + ocorrências),
+    independente da quantidade de padrões.
+    """
+
+    def __init__(self, patterns):
+        """
+        Compila o autômato.
+
+        :param patterns:    Iterável com os padrões a buscar (strings não vazias).
+        """
+
+        self.goto   = [ dict() ]
+        self.fail   = [ 0 ]
+        self.output = [ tuple() ]
+
+        for pattern in set(patterns):
+            if pattern:
+                self._add_pattern(pattern)
+
+        self._build_fail_links()
+
+    # ini: methods
+
+    def _add_pattern(self, pattern: str):
+        """
+        Adiciona um padrão à árvore de prefixos.
+
+        :param pattern: Padrão a adicionar.
+        """
+
+        state = 0
+        for char in pattern:
+            next_state = self.goto[state].get(char)
+
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto.append(dict())
+                self.fail.append(0)
+                self.output.append(tuple())
+                self.goto[state][char] = next_state
+
+            state = next_state
+
+        self.output[state] += (pattern,)
+
+    def _build_fail_links(self):
+        """ Calcula os links de falha em largura e propaga as saídas de cada estado. """
+
+        queue = deque(self.goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+
+                fail = self.fail[state]
+                while fail and char not in self.goto[fail]:
+                    fail = self.fail[fail]
+
+                self.fail[next_state]   = self.goto[fail].get(char, 0)
+                self.output[next_state] += self.output[self.fail[next_state]]
+
+    def iter_matches(self, text: str):
+        """
+        Percorre o texto uma única vez, retornando cada ocorrência encontrada.
+
+        :param text:    Texto a percorrer.
+        :return:        Gerador de tuplas (posição inicial, padrão).
+        """
+
+        goto, fail, output = self.goto, self.fail, self.output
+
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+
+            state = goto[state].get(char, 0)
+
+            for pattern in output[state]:
+                yield index - len(pattern) + 1, pattern
+
+    def find(self, text: str, whole_words: bool = True) -> set:
+        """
+        Retorna os padrões encontrados no texto.
+
+        :param text:        Texto a percorrer.
+        :param whole_words: Considera apenas ocorrências delimitadas por caracteres não alfanuméricos.
+        :return:            Conjunto de padrões encontrados.
+        """
+
+        found = set()
+        for start, pattern in self.iter_matches(text):
+            if whole_words:
+                end = start + len(pattern)
+
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                if end < len(text) and text[end].isalnum():
+                    continue
+
+            found.add(pattern)
+
+        return found
+
+    # end: methods
@@ -0,0 +1,132 @@
+"""
+Métricas da API no formato do Prometheus.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import os
+
+from django.conf        import settings
+from prometheus_client  import REGISTRY, CollectorRegistry, Counter, Histogram, multiprocess
+
+
+# A pasta das métricas de vários processos é recriada pelo gunicorn ao iniciar (gunicorn.conf.py);
+# processos que rodam sem ele (ex.: comandos do manage.py) a criam aqui, antes do primeiro incremento
+if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+    os.makedirs(os.environ['PROMETHEUS_MULTIPROC_DIR'], exist_ok=True)
+
+# Requisições
+REQUEST_DURATION = Histogram(
+    'cti_http_request_duration_seconds',
+    'Duração das requisições, por action.',
+    [ 'action', 'method', 'status' ],
+)
+REQUEST_DB_DURATION = Histogram(
+    'cti_http_request_db_duration_seconds',
+    'Tempo no banco de dados por requisição, por action.',
+    [ 'action' ],
+)
+REQUEST_DB_QUERIES = Counter(
+    'cti_http_request_db_queries',
+    'Consultas SQL executadas, por action.',
+    [ 'action' ],
+)
+
+# Ingestão e execução dos alertas
+POSTS_INGESTED = Counter(
+    'cti_posts_ingested',
+    'Posts alertados gravados, por origem (single: um por requisição; batch: bulk e stream).',
+    [ 'source' ],
+)
+ALERTS_ADVANCED = Counter(
+    'cti_alerts_advanced',
+    'Alertas avançados ou desativados, por origem (single: update/run; batch: run/advance).',
+    [ 'source' ],
+)
+
+# Caches e throttling
+CACHE_REQUESTS = Counter(
+    'cti_cache_requests',
+    'Leituras dos caches, por cache e resultado (hit ou miss).',
+    [ 'cache', 'result' ],
+)
+THROTTLE_REJECTIONS = Counter(
+    'cti_throttle_rejections',
+    'Requisições recusadas pelo throttling, por escopo.',
+    [ 'scope' ],
+)
+
+
+def get_registry():
+    """
+    Retorna o registro a exportar.
+
+    Com PROMETHEUS_MULTIPROC_DIR (variável de ambiente, definida antes de o processo iniciar),
+    cada worker grava suas métricas em arquivos nessa pasta e o registro agrega os de todos os
+    workers, então qualquer worker que atender o `/metrics` retorna os totais do servidor.
+
+    :return:    Registro do Prometheus.
+    """
+
+    if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+
+    return registry
+
+
+def observe_request(action: str, method: str, status: int, values: dict):
+    """
+    Registra a duração e as consultas de uma requisição.
+
+    :param action:  Nome da action (ServerTimingMiddleware.get_action_name).
+    :param method:  Método HTTP.
+    :param status:  Status HTTP da resposta.
+    :param values:  Medições da requisição (RequestTiming.as_dict).
+    """
+
+    if not settings.METRICS_ENABLED:
+        return
+
+    # Sem resolução de URL (404), todas as requisições ficam em uma série só
+    action = action or 'unresolved'
+
+    REQUEST_DURATION.labels(action, method, status).observe(values['total_ms'] / 1000)
+    REQUEST_DB_DURATION.labels(action).observe(values['db_ms'] / 1000)
+    REQUEST_DB_QUERIES.labels(action).inc(values['queries'])
+
+
+def count_posts_ingested(source: str, count: int):
+    """ Conta posts alertados gravados. """
+
+    if settings.METRICS_ENABLED and count:
+        POSTS_INGESTED.labels(source).inc(count)
+
+
+def count_alerts_advanced(source: str, count: int):
+    """ Conta alertas avançados ou desativados. """
+
+    if settings.METRICS_ENABLED and count:
+        ALERTS_ADVANCED.labels(source).inc(count)
+
+
+def count_cache_requests(cache: str, hits: int, misses: int):
+    """ Conta acertos e faltas de um cache. """
+
+    if not settings.METRICS_ENABLED:
+        return
+
+    if hits:
+        CACHE_REQUESTS.labels(cache, 'hit').inc(hits)
+    if misses:
+        CACHE_REQUESTS.labels(cache, 'miss').inc(misses)
+
+
+def count_throttle_rejection(scope: str):
+    """ Conta uma requisição recusada pelo throttling. """
+
+    if settings.METRICS_ENABLED:
+        THROTTLE_REJECTIONS.labels(scope).inc()
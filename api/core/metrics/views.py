@@ -0,0 +1,30 @@
+"""
+View de exportação das métricas para o Prometheus.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import hmac
+
+from django.conf        import settings
+from django.http        import HttpResponse
+from prometheus_client  import CONTENT_TYPE_LATEST, generate_latest
+
+from core.metrics.metrics import get_registry
+
+
+def metrics_view(request):
+    """
+    Exporta as métricas no formato texto do Prometheus.
+
+    View do Django (e não do DRF), para a coleta não passar por autenticação de usuário nem
+    throttling. Com METRICS_TOKEN, exige `Authorization: Bearer <token>`.
+    """
+
+    if settings.METRICS_TOKEN:
+        authorization = request.headers.get('Authorization', '')
+        if not hmac.compare_digest(authorization.encode(), f'Bearer {settings.METRICS_TOKEN}'.encode()):
+            return HttpResponse(status=401)
+
+    return HttpResponse(generate_latest(get_registry()), content_type=CONTENT_TYPE_LATEST)
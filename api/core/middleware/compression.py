@@ -0,0 +1,166 @@
+"""
+Middleware de compressão das respostas (brotli ou gzip, conforme o Accept-Encoding).
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import zlib
+
+import brotli
+
+from django.conf                import settings
+from django.utils.cache         import patch_vary_headers
+from django.utils.deprecation   import MiddlewareMixin
+
+
+class GzipCompressor:
+    """ Compressor gzip incremental. """
+
+    encoding = 'gzip'
+
+    def __init__(self):
+        # wbits 31: formato gzip (cabeçalho e CRC), e não zlib puro
+        self.compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    # ini: methods
+
+    def process(self, chunk: bytes) -> bytes:
+        """ Comprime um bloco e o libera para o cliente (sync flush). """
+
+        return self.compressor.compress(chunk) + self.compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self.compressor.flush()
+
+    # end: methods
+
+
+class BrotliCompressor:
+    """ Compressor brotli incremental. """
+
+    encoding = 'br'
+
+    def __init__(self):
+        self.compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+
+    # ini: methods
+
+    def process(self, chunk: bytes) -> bytes:
+        """ Comprime um bloco e o libera para o cliente. """
+
+        return self.compressor.process(chunk) + self.compressor.flush()
+
+    def finish(self) -> bytes:
+        return self.compressor.finish()
+
+    # end: methods
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Comprime as respostas JSON e texto com brotli ou gzip, o que o cliente aceitar (brotli tem
+    preferência), a partir de COMPRESSION_MIN_SIZE bytes. Respostas em streaming são sempre
+    comprimidas, bloco a bloco, sem esperar o fim da listagem.
+
+    Só os tipos de COMPRESSIBLE_TYPES são comprimidos: páginas HTML (admin) com token CSRF ficam
+    de fora, por causa do BREACH. ETags fortes viram fracas, como no GZipMiddleware do Django.
+    """
+
+    COMPRESSIBLE_TYPES = ('application/json', 'text/plain')
+
+    COMPRESSORS = {
+        'br'    : BrotliCompressor,
+        'gzip'  : GzipCompressor,
+    }
+
+    # ini: methods
+
+    def get_compressor(self, request):
+        """
+        Escolhe o compressor pelo Accept-Encoding da requisição.
+
+        :param request: Requisição HTTP.
+        :return:        Classe do compressor, ou None se o cliente não aceita nenhum.
+        """
+
+        accepted = set()
+        for item in request.META.get('HTTP_ACCEPT_ENCODING', '').split(','):
+            coding, *params = [ part.strip() for part in item.split(';') ]
+            quality         = next((param[2:] for param in params if param.startswith('q=')), '1')
+
+            try:
+                if float(quality) > 0:
+                    accepted.add(coding.lower())
+            except ValueError:
+                continue
+
+        for encoding, compressor in self.COMPRESSORS.items():
+            if encoding in accepted:
+                return compressor
+
+        return None
+
+    def process_response(self, request, response):
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        if response.has_header('Content-Encoding'):
+            return response
+
+        if not response.get('Content-Type', '').startswith(self.COMPRESSIBLE_TYPES):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        compressor_class = self.get_compressor(request)
+        if compressor_class is None:
+            return response
+
+        compressor = compressor_class()
+
+        if response.streaming:
+            response.streaming_content = self.compress_stream(response, compressor)
+            del response.headers['Content-Length']
+
+        else:
+            content = compressor.process(response.content) + compressor.finish()
+            if len(content) >= len(response.content):
+                return response
+
+            response.content = content
+            response.headers['Content-Length'] = str(len(content))
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = f'W/{etag}'
+
+        response.headers['Content-Encoding'] = compressor.encoding
+
+        return response
+
+    @staticmethod
+    def compress_stream(response, compressor):
+        """
+        Comprime o conteúdo de uma resposta em streaming, síncrona ou assíncrona.
+
+        :param response:    Resposta em streaming.
+        :param compressor:  Compressor da resposta.
+        :return:            Iterável (ou iterável assíncrono) com o conteúdo comprimido.
+        """
+
+        content = response.streaming_content
+
+        def stream():
+            for chunk in content:
+                yield compressor.process(chunk)
+            yield compressor.finish()
+
+        async def astream():
+            async for chunk in content:
+                yield compressor.process(chunk)
+            yield compressor.finish()
+
+        return astream() if response.is_async else stream()
+
+    # end: methods
@@ -0,0 +1,263 @@
+"""
+Middleware de profiling sob demanda de uma requisição, restrito a usuários staff.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import io
+import os
+import re
+import sys
+import time
+import pstats
+import cProfile
+import threading
+
+from collections                import Counter
+from asgiref.sync               import iscoroutinefunction, markcoroutinefunction
+from django.conf                import settings
+from django.http                import HttpResponse
+from django.utils               import timezone
+from django.core.exceptions     import MiddlewareNotUsed
+from rest_framework.request     import Request
+from rest_framework.settings    import api_settings
+from rest_framework.exceptions  import APIException
+
+from core.middleware.server_timing import ServerTimingMiddleware
+
+
+class StackSampler:
+    """
+    Profiler por amostragem: uma thread lê a pilha da thread da requisição a cada intervalo e
+    conta as pilhas no formato "collapsed" (`modulo:funcao;modulo:funcao N`), lido pelo
+    flamegraph.pl, speedscope e similares.
+    """
+
+    def __init__(self, interval: float):
+        self.interval   = interval
+        self.thread_id  = threading.get_ident()
+        self.stacks     = Counter()
+        self.stopped    = threading.Event()
+        self.sampler    = threading.Thread(target=self.run, daemon=True)
+        self.skip       = 0
+
+    # ini: methods
+
+    @staticmethod
+    def get_depth(frame) -> int:
+        """ Retorna a profundidade da pilha até o frame. """
+
+        depth = 0
+        while frame is not None:
+            depth += 1
+            frame = frame.f_back
+
+        return depth
+
+    def get_stack(self, frame) -> str:
+        """
+        Monta a pilha, a partir de quem ativou o profiler, até o frame, no formato collapsed.
+
+        :param frame:   Frame mais interno da pilha.
+        :return:        Pilha separada por `;`.
+        """
+
+        names = list()
+        while frame is not None:
+            names.append(f'{frame.f_globals.get("__name__", "?")}:{frame.f_code.co_name}')
+            frame = frame.f_back
+
+        return ';'.join(reversed(names[:len(names) - self.skip]))
+
+    def run(self):
+        """ Amostra a pilha da thread da requisição até ser parado. """
+
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[self.get_stack(frame)] += 1
+
+    def enable(self):
+        # Descarta das amostras os frames do servidor, acima de quem ativou o profiler
+        self.skip = self.get_depth(sys._getframe(2))
+        self.sampler.start()
+
+    def disable(self):
+        self.stopped.set()
+        self.sampler.join()
+
+    def get_output(self) -> str:
+        """ Retorna as pilhas amostradas, da mais frequente para a menos. """
+
+        return ''.join(f'{stack} {count}\n' for stack, count in self.stacks.most_common())
+
+    # end: methods
+
+
+class CProfiler:
+    """ Profiler determinístico (cProfile), com saída no formato do pstats. """
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    # ini: methods
+
+    def enable(self):
+        self.profile.enable()
+
+    def disable(self):
+        self.profile.disable()
+
+    def dump(self, path: str):
+        """ Grava o profile em arquivo binário, lido pelo pstats, snakeviz e similares. """
+
+        self.profile.dump_stats(path)
+
+    def get_output(self) -> str:
+        """ Retorna as funções com maior tempo acumulado, em texto. """
+
+        stream = io.StringIO()
+        pstats.Stats(self.profile, stream=stream).sort_stats('cumulative').print_stats(100)
+
+        return stream.getvalue()
+
+    # end: methods
+
+
+class ProfilerMiddleware:
+    """
+    Faz o profiling de uma requisição quando ela traz `?profile=<formato>` ou o cabeçalho
+    `X-Profile: <formato>` e foi autenticada por um usuário staff (PROFILER_ENABLED).
+
+    Formatos:
+    - `collapsed` (padrão): pilhas amostradas a cada PROFILER_INTERVAL segundos, para flamegraph;
+    - `pstats`: cProfile, com todas as chamadas (mais lento, mas com contagem de chamadas).
+
+    Com PROFILER_DIR, o profile é gravado em um arquivo nessa pasta e a resposta normal volta com
+    o caminho no cabeçalho `X-Profile-File`; sem ela, a resposta é o próprio profile em texto.
+
+    Só um profile roda por vez em cada processo; enquanto isso, as demais requisições marcadas são
+    atendidas sem profiling. As views assíncronas (ASYNC_READ_VIEWS) não são medidas, pois o ORM
+    roda em outra thread.
+    """
+
+    sync_capable    = True
+    async_capable   = True
+
+    FORMATS = {
+        'collapsed' : 'collapsed',
+        'pstats'    : 'prof',
+    }
+
+    lock = threading.Lock()
+
+    def __init__(self, get_response):
+        if not settings.PROFILER_ENABLED:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    # ini: methods
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        profile_format = self.get_profile_format(request)
+        if profile_format is None or not self.is_staff(request):
+            return self.get_response(request)
+
+        if not self.lock.acquire(blocking=False):
+            return self.get_response(request)
+
+        try:
+            profiler = CProfiler() if profile_format == 'pstats' else StackSampler(settings.PROFILER_INTERVAL)
+
+            start = time.perf_counter()
+            profiler.enable()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.disable()
+            elapsed = time.perf_counter() - start
+
+            return self.build_response(request, response, profiler, profile_format, elapsed)
+
+        finally:
+            self.lock.release()
+
+    async def __acall__(self, request):
+        return await self.get_response(request)
+
+    def get_profile_format(self, request) -> str:
+        """
+        Retorna o formato de profile pedido na requisição.
+
+        :param request: Requisição HTTP.
+        :return:        Formato (`collapsed` ou `pstats`), ou None se não foi pedido profile.
+        """
+
+        value = request.GET.get('profile') or request.headers.get('X-Profile')
+        if not value:
+            return None
+
+        return value if value in self.FORMATS else 'collapsed'
+
+    @staticmethod
+    def is_staff(request) -> bool:
+        """
+        Autentica a requisição com as autenticações do DRF e verifica se o usuário é staff.
+
+        A autenticação é refeita depois pela view; o custo extra só existe nas requisições marcadas.
+
+        :param request: Requisição HTTP.
+        :return:        Se o usuário é staff.
+        """
+
+        authenticators = [ authentication() for authentication in api_settings.DEFAULT_AUTHENTICATION_CLASSES ]
+
+        try:
+            user = Request(request, authenticators=authenticators).user
+        except APIException:
+            return False
+
+        return bool(user and user.is_staff)
+
+    def build_response(self, request, response, profiler, profile_format: str, elapsed: float):
+        """
+        Grava o profile em arquivo ou o retorna no lugar da resposta.
+
+        :param request:         Requisição HTTP.
+        :param response:        Resposta da view.
+        :param profiler:        Profiler usado.
+        :param profile_format:  Formato do profile.
+        :param elapsed:         Duração da requisição (s).
+        :return:                Resposta HTTP.
+        """
+
+        action = ServerTimingMiddleware.get_action_name(request) or 'unresolved'
+
+        if not settings.PROFILER_DIR:
+            output = HttpResponse(profiler.get_output(), content_type='text/plain; charset=utf-8')
+            output['X-Profile-Action']  = action
+            output['X-Profile-Status']  = response.status_code
+            output['X-Profile-Elapsed'] = f'{elapsed * 1000:.2f}'
+            return output
+
+        name = re.sub(r'[^\w.]+', '_', f'{timezone.now():%Y%m%d_%H%M%S_%f}_{action}')
+        path = os.path.join(settings.PROFILER_DIR, f'{name}.{self.FORMATS[profile_format]}')
+
+        os.makedirs(settings.PROFILER_DIR, exist_ok=True)
+        if profile_format == 'pstats':
+            profiler.dump(path)
+        else:
+            with open(path, 'w') as file:
+                file.write(profiler.get_output())
+
+        response['X-Profile-File'] = path
+        return response
+
+    # end: methods
@@ -0,0 +1,228 @@
+"""
+Middleware de instrumentação por requisição (Server-Timing e log estruturado).
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import json
+import time
+import logging
+
+from contextvars                import ContextVar
+from asgiref.sync               import iscoroutinefunction, markcoroutinefunction
+from django.db                  import connections
+from django.db.backends.signals import connection_created
+from django.conf                import settings
+from django.core.exceptions     import MiddlewareNotUsed
+
+from core.metrics.metrics import observe_request
+
+
+logger = logging.getLogger(__name__)
+
+# Medições da requisição em andamento. Uma variável de contexto (e não o objeto de conexão) porque
+# as views assíncronas consultam o banco em outra thread, via sync_to_async, que copia o contexto.
+current_timing = ContextVar('server_timing', default=None)
+
+
+def execute_wrapper(execute, sql, params, many, context):
+    """ Execute wrapper instalado em todas as conexões: mede a consulta se houver requisição medida. """
+
+    timing = current_timing.get()
+    if timing is None:
+        return execute(sql, params, many, context)
+
+    return timing(execute, sql, params, many, context)
+
+
+def install_execute_wrapper(connection, **kwargs):
+    """ Instala o execute wrapper na conexão (uma vez por objeto de conexão). """
+
+    if execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(execute_wrapper)
+
+
+class RequestTiming:
+    """ Tempos e consultas de uma requisição. """
+
+    def __init__(self):
+        self.start          = time.perf_counter()
+        self.queries        = 0
+        self.db_time        = 0.0
+        self.render_start   = None
+        self.render_time    = 0.0
+
+    # ini: methods
+
+    def __call__(self, execute, sql, params, many, context):
+        """ Execute wrapper do Django: conta a consulta e soma seu tempo. """
+
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.queries += 1
+
+    def start_render(self, response):
+        """ Marca o início da renderização e registra o fim dela ao terminar. """
+
+        self.render_start = time.perf_counter()
+        response.add_post_render_callback(self.finish_render)
+
+        return response
+
+    def finish_render(self, response):
+        """ Registra o tempo da renderização. """
+
+        self.render_time = time.perf_counter() - self.render_start
+
+    def as_dict(self) -> dict:
+        """
+        Retorna os tempos (ms) e a quantidade de consultas.
+
+        `view` é o tempo da cadeia de middlewares e da view sem a renderização, e inclui as
+        consultas e a serialização feitas pela view.
+        """
+
+        total = time.perf_counter() - self.start
+
+        return {
+            'queries'   : self.queries,
+            'db_ms'     : round(self.db_time * 1000, 2),
+            'view_ms'   : round((total - self.render_time) * 1000, 2),
+            'render_ms' : round(self.render_time * 1000, 2),
+            'total_ms'  : round(total * 1000, 2),
+        }
+
+    # end: methods
+
+
+class ServerTimingMiddleware:
+    """
+    Mede, para cada requisição, a quantidade de consultas SQL, o tempo no banco, o tempo da view
+    e o da renderização, e os publica no cabeçalho `Server-Timing` (SERVER_TIMING_HEADER) e em uma
+    linha de log JSON com o nome da action (SERVER_TIMING_LOG), ex.:
+    `AlertViewSet.list_active_alerts_run_today`. As mesmas medições alimentam as métricas por
+    action do Prometheus (METRICS_ENABLED).
+
+    As consultas são medidas por um execute wrapper do Django instalado nas conexões (sem guardar
+    o SQL), então o custo é de algumas chamadas de `perf_counter` por consulta. Deve ser o primeiro middleware, para o
+    tempo total incluir os demais.
+    """
+
+    sync_capable    = True
+    async_capable   = True
+
+    def __init__(self, get_response):
+        if not (settings.SERVER_TIMING_HEADER or settings.SERVER_TIMING_LOG or settings.METRICS_ENABLED):
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+        # Conexões abertas a partir de agora, em qualquer thread
+        connection_created.connect(install_execute_wrapper, dispatch_uid='server_timing')
+
+    # ini: methods
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        # Conexão da thread atual, caso já estivesse aberta antes do middleware
+        install_execute_wrapper(connections['default'])
+
+        timing  = request._server_timing = RequestTiming()
+        token   = current_timing.set(timing)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_timing.reset(token)
+
+        return self.finish(request, response, timing)
+
+    async def __acall__(self, request):
+        timing  = request._server_timing = RequestTiming()
+        token   = current_timing.set(timing)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_timing.reset(token)
+
+        return self.finish(request, response, timing)
+
+    def process_template_response(self, request, response):
+        """ Chamado antes da renderização das respostas do DRF. """
+
+        timing = getattr(request, '_server_timing', None)
+        if timing is not None:
+            timing.start_render(response)
+
+        return response
+
+    @staticmethod
+    def get_action_name(request) -> str:
+        """
+        Retorna o nome da view e da action que atendeu a requisição (ex.: `AlertViewSet.list`).
+
+        :param request: Requisição HTTP.
+        :return:        Nome da action, ou None se a URL não foi resolvida.
+        """
+
+        match = getattr(request, 'resolver_match', None)
+        if match is None:
+            return None
+
+        func    = match.func
+        method  = request.method.lower()
+
+        # Endpoints com leitura assíncrona e escrita no ViewSet (read_write_view)
+        if hasattr(func, 'read_view'):
+            func = func.read_view if request.method in ('GET', 'HEAD') else func.write_view
+
+        view_class = getattr(func, 'cls', None) or getattr(func, 'view_class', None)
+        if view_class is None:
+            return f'{func.__module__}.{func.__name__}'
+
+        actions = getattr(func, 'actions', None) or dict()
+
+        return f'{view_class.__name__}.{actions.get(method, method)}'
+
+    def finish(self, request, response, timing: RequestTiming):
+        """
+        Publica as medições da requisição no cabeçalho, no log e nas métricas.
+
+        :param request:     Requisição HTTP.
+        :param response:    Resposta HTTP.
+        :param timing:      Medições da requisição.
+        :return:            Resposta HTTP.
+        """
+
+        values = timing.as_dict()
+        action = self.get_action_name(request)
+
+        observe_request(action, request.method, response.status_code, values)
+
+        if settings.SERVER_TIMING_HEADER:
+            response['Server-Timing'] = ', '.join([
+                f'db;dur={values["db_ms"]};desc="{values["queries"]} queries"',
+                f'view;dur={values["view_ms"]}',
+                f'render;dur={values["render_ms"]}',
+                f'total;dur={values["total_ms"]}',
+            ])
+
+        if settings.SERVER_TIMING_LOG:
+            logger.info(json.dumps({
+                'action'    : action,
+                'method'    : request.method,
+                'path'      : request.path,
+                'status'    : response.status_code,
+                **values,
+            }))
+
+        return response
+
+    # end: methods
@@ -0,0 +1,265 @@
+"""
+Paginação por chave (keyset / cursor) para as listagens da API.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import json
+import base64
+
+from functools                  import reduce
+from django.db.models           import Q, QuerySet
+from django.core.exceptions     import ValidationError
+from rest_framework.request     import Request
+
+
+class PaginationError(ValueError):
+    """ Erro nos parâmetros de paginação informados na requisição. """
+
+
+class KeysetPagination:
+    """
+    Paginação por chave, opcional, ativada pelos parâmetros `page_size` e/ou `cursor`.
+
+    Cada página é buscada com `WHERE (campos) > (valores do último registro) ORDER BY campos LIMIT n`,
+    sem COUNT(*) nem OFFSET, então páginas profundas custam o mesmo que a primeira. O cursor
+    retornado em `next` é opaco para o cliente (base64 dos valores da ordenação do último registro).
+    """
+
+    page_size_query_param   = 'page_size'
+    cursor_query_param      = 'cursor'
+
+    default_page_size       = 100
+    max_page_size           = 1000
+
+    def __init__(self, ordering: tuple):
+        """
+        Inicializa a paginação.
+
+        :param ordering:    Campos da ordenação (ascendente). O último deve ser único, ex.: ('date', 'id').
+        """
+
+        self.ordering = tuple(ordering)
+
+    # ini: methods
+
+    @classmethod
+    def is_requested(cls, request: Request) -> bool:
+        """
+        Indica se a requisição pediu paginação.
+
+        :param request: Requisição HTTP.
+        :return:        True se `page_size` ou `cursor` foram informados.
+        """
+
+        return (
+            cls.page_size_query_param in request.query_params or
+            cls.cursor_query_param in request.query_params
+        )
+
+    def get_page_size(self, request: Request) -> int:
+        """
+        Retorna o tamanho de página solicitado.
+
+        :param request: Requisição HTTP.
+        :return:        Tamanho da página.
+        """
+
+        page_size = request.query_params.get(self.page_size_query_param)
+        if page_size is None:
+            return self.default_page_size
+
+        try:
+            page_size = int(page_size)
+        except ValueError:
+            raise PaginationError(f'{self.page_size_query_param} deve ser um número inteiro.')
+
+        if not 1 <= page_size <= self.max_page_size:
+            raise PaginationError(f'{self.page_size_query_param} deve estar entre 1 e {self.max_page_size}.')
+
+        return page_size
+
+    @staticmethod
+    def get_value(instance, field: str):
+        """
+        Retorna o valor de um campo do registro.
+
+        :param instance:    Registro (instância do model ou dicionário, em querysets com `.values()`).
+        :param field:       Nome do campo.
+        :return:            Valor do campo.
+        """
+
+        return instance[field] if isinstance(instance, dict) else getattr(instance, field)
+
+    def encode_cursor(self, instance) -> str:
+        """
+        Gera o cursor opaco a partir do último registro da página.
+
+        :param instance:    Último registro da página.
+        :return:            Cursor.
+        """
+
+        values = list()
+        for field in self.ordering:
+            value = self.get_value(instance, field)
+            values.append(value.isoformat() if hasattr(value, 'isoformat') else value)
+
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    def decode_cursor(self, cursor: str, model) -> list:
+        """
+        Decodifica o cursor recebido, convertendo cada valor para o tipo do campo.
+
+        :param cursor:  Cursor recebido na requisição.
+        :param model:   Model do queryset paginado.
+        :return:        Valores dos campos da ordenação.
+        """
+
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+
+            if type(values) != list or len(values) != len(self.ordering):
+                raise ValueError
+
+            return [
+                model._meta.get_field(field).to_python(value)
+                for field, value in zip(self.ordering, values)
+            ]
+
+        except (ValueError, TypeError, ValidationError):
+            raise PaginationError('Cursor inválido.')
+
+    def get_keyset_filter(self, values: list) -> Q:
+        """
+        Monta o filtro equivalente a `(campos) > (valores)`.
+
+        O primeiro campo também é filtrado com `>=`, para o planner usar o índice como intervalo.
+
+        :param values:  Valores dos campos da ordenação do último registro.
+        :return:        Filtro da próxima página.
+        """
+
+        conditions = list()
+        for position, field in enumerate(self.ordering):
+            equals = { name: value for name, value in zip(self.ordering[:position], values[:position]) }
+            conditions.append(Q(**equals, **{ f'{field}__gt': values[position] }))
+
+        return Q(**{ f'{self.ordering[0]}__gte': values[0] }) & reduce(lambda a, b: a | b, conditions)
+
+    def get_page_queryset(self, queryset: QuerySet, request: Request) -> tuple:
+        """
+        Monta a consulta da página solicitada (um registro a mais, para saber se há próxima página).
+
+        :param queryset:    QuerySet a paginar.
+        :param request:     Requisição HTTP.
+        :return:            Tupla (QuerySet da página, tamanho da página).
+        """
+
+        page_size   = self.get_page_size(request)
+        cursor      = request.query_params.get(self.cursor_query_param)
+
+        queryset = queryset.order_by(*self.ordering)
+        if cursor:
+            queryset = queryset.filter(self.get_keyset_filter(self.decode_cursor(cursor, queryset.model)))
+
+        return queryset[:page_size + 1], page_size
+
+    def get_page(self, page: list, page_size: int) -> tuple:
+        """
+        Separa os registros da página e os dados de paginação.
+
+        :param page:        Registros lidos (até page_size + 1).
+        :param page_size:   Tamanho da página.
+        :return:            Tupla (registros da página, dados de paginação para a resposta).
+        """
+
+        next_cursor = None
+        if len(page) > page_size:
+            page = page[:page_size]
+            next_cursor = self.encode_cursor(page[-1])
+
+        return page, {
+            'next'      : next_cursor,
+            'page_size' : page_size,
+        }
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request) -> tuple:
+        """
+        Busca a página solicitada do queryset.
+
+        :param queryset:    QuerySet a paginar.
+        :param request:     Requisição HTTP.
+        :return:            Tupla (registros da página, dados de paginação para a resposta).
+        """
+
+        queryset, page_size = self.get_page_queryset(queryset, request)
+
+        return self.get_page(list(queryset), page_size)
+
+    async def apaginate_queryset(self, queryset: QuerySet, request: Request) -> tuple:
+        """
+        Versão assíncrona do paginate_queryset (ORM assíncrono).
+
+        :param queryset:    QuerySet a paginar.
+        :param request:     Requisição HTTP.
+        :return:            Tupla (registros da página, dados de paginação para a resposta).
+        """
+
+        queryset, page_size = self.get_page_queryset(queryset, request)
+
+        return self.get_page([ instance async for instance in queryset ], page_size)
+
+    def iter_chunks(self, queryset: QuerySet, chunk_size: int):
+        """
+        Percorre o queryset inteiro em blocos, buscando cada bloco pela chave do último registro.
+
+        Usado no modo streaming: cada bloco é uma consulta curta pelo índice da ordenação (com os
+        prefetch_related do queryset), sem manter um cursor aberto no servidor. Um `.iterator()`
+        consumido depois do fim da view roda fora de transação, e o Postgres materializa o
+        resultado inteiro do cursor `WITH HOLD` antes de entregar o primeiro registro.
+
+        :param queryset:    QuerySet a percorrer.
+        :param chunk_size:  Quantidade de registros por bloco.
+        :return:            Gerador com os registros, na ordem da paginação.
+        """
+
+        queryset    = queryset.order_by(*self.ordering)
+        chunk       = queryset
+
+        while True:
+            page = list(chunk[:chunk_size])
+
+            yield from page
+
+            if len(page) < chunk_size:
+                break
+
+            values  = [ self.get_value(page[-1], field) for field in self.ordering ]
+            chunk   = queryset.filter(self.get_keyset_filter(values))
+
+    async def aiter_chunks(self, queryset: QuerySet, chunk_size: int):
+        """
+        Versão assíncrona do iter_chunks, usada no modo streaming das views assíncronas.
+
+        :param queryset:    QuerySet a percorrer.
+        :param chunk_size:  Quantidade de registros por bloco.
+        :return:            Gerador assíncrono com os registros, na ordem da paginação.
+        """
+
+        queryset    = queryset.order_by(*self.ordering)
+        chunk       = queryset
+
+        while True:
+            page = [ instance async for instance in chunk[:chunk_size] ]
+
+            for instance in page:
+                yield instance
+
+            if len(page) < chunk_size:
+                break
+
+            values  = [ self.get_value(page[-1], field) for field in self.ordering ]
+            chunk   = queryset.filter(self.get_keyset_filter(values))
+
+    # end: methods
@@ -0,0 +1,99 @@
+"""
+Parser para corpos de requisição em JSON delimitado por linhas (NDJSON).
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import orjson
+
+from django.conf                import settings
+from rest_framework.parsers     import BaseParser
+from rest_framework.request     import Request
+from rest_framework.exceptions  import ParseError, UnsupportedMediaType
+
+
+class NDJSONParser(BaseParser):
+    """
+    Parser de NDJSON que lê o corpo da requisição de forma incremental.
+
+    Em vez de carregar o corpo inteiro, `request.data` passa a ser um gerador que decodifica
+    uma linha por vez do stream. Linhas com JSON inválido não interrompem a leitura: no lugar
+    do objeto é retornada uma instância de ParseError, para que o consumidor registre o erro
+    e siga para a próxima linha.
+    """
+
+    media_type = 'application/x-ndjson'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Retorna um gerador com os objetos de cada linha do stream.
+
+        :param stream:          Stream do corpo da requisição.
+        :param media_type:      Media type da requisição.
+        :param parser_context:  Contexto do parser.
+        :return:                Gerador de objetos (ou ParseError, para linhas inválidas).
+        """
+
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        return self.iter_lines(stream, encoding)
+
+    @staticmethod
+    def iter_lines(stream, encoding: str):
+        """
+        Decodifica o stream linha a linha, ignorando linhas em branco.
+
+        :param stream:      Stream do corpo da requisição.
+        :param encoding:    Encoding do corpo da requisição.
+        :return:            Gerador de objetos (ou ParseError, para linhas inválidas).
+        """
+
+        for line_number, line in enumerate(iter(stream.readline, b''), start=1):
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                yield orjson.loads(line.decode(encoding))
+
+            except ValueError as err:
+                yield ParseError(f'JSON parse error (line {line_number}) - {err}')
+
+    @staticmethod
+    def is_chunked(request: Request) -> bool:
+        """ Indica se o corpo da requisição foi enviado em partes (Transfer-Encoding: chunked). """
+
+        return 'chunked' in request.META.get('HTTP_TRANSFER_ENCODING', '').lower()
+
+    @staticmethod
+    def can_read_chunked(request: Request) -> bool:
+        """
+        Indica se o servidor entrega o corpo chunked já decodificado em `wsgi.input` (ex.: gunicorn),
+        marcando-o com `wsgi.input_terminated`. Sem isso, o corpo não pode ser lido sem Content-Length.
+        """
+
+        return bool(request.META.get('wsgi.input_terminated'))
+
+    @classmethod
+    def get_data(cls, request: Request):
+        """
+        Retorna o corpo da requisição já decodificado pelo parser da view.
+
+        Sem Content-Length (corpo chunked), o Django limita o stream da requisição a zero bytes e o DRF
+        trata o corpo como vazio, sem chamar o parser. Nesse caso o parser lê direto de `wsgi.input`,
+        que o servidor entrega sem a codificação chunked (ver `can_read_chunked`).
+
+        :param request: Requisição HTTP.
+        :return:        Mesmo retorno de `request.data` (gerador de objetos, para NDJSON).
+        """
+
+        if not cls.is_chunked(request):
+            return request.data
+
+        parser = request.negotiator.select_parser(request, request.parsers)
+        if parser is None:
+            raise UnsupportedMediaType(request.content_type)
+
+        return parser.parse(request.META['wsgi.input'], request.content_type, request.parser_context)
@@ -0,0 +1,33 @@
+"""
+Parser JSON baseado no orjson.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import orjson
+
+from rest_framework.parsers     import BaseParser
+from rest_framework.exceptions  import ParseError
+
+
+class ORJSONParser(BaseParser):
+    """ Parser de JSON com orjson, no lugar do JSONParser do DRF (biblioteca padrão). """
+
+    media_type = 'application/json'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Decodifica o corpo da requisição.
+
+        :param stream:          Stream do corpo da requisição.
+        :param media_type:      Media type da requisição.
+        :param parser_context:  Contexto do parser.
+        :return:                Objeto decodificado.
+        """
+
+        try:
+            return orjson.loads(stream.read())
+
+        except orjson.JSONDecodeError as err:
+            raise ParseError(f'JSON parse error - {err}')
@@ -0,0 +1,51 @@
+"""
+Renderer JSON baseado no orjson.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import orjson
+
+from rest_framework.renderers   import BaseRenderer
+from rest_framework.utils       import encoders
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Renderer JSON com orjson, que serializa em C `date`, `datetime`, `UUID`, floats e subclasses
+    de dict e list (ReturnDict, ReturnList) sem passar pelo `json` da biblioteca padrão.
+
+    Os demais tipos (Decimal, textos traduzidos, QuerySet...) caem no encoder do DRF, então a
+    saída é a mesma do JSONRenderer, mas sem espaços e com `datetime` em UTC terminado em `Z`.
+    """
+
+    media_type  = 'application/json'
+    format      = 'json'
+    charset     = None
+
+    OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    # Fallback para os tipos que o orjson não conhece
+    encoder = encoders.JSONEncoder()
+
+    # ini: methods
+
+    @classmethod
+    def dumps(cls, data) -> bytes:
+        """
+        Serializa os dados em JSON.
+
+        :param data:    Dados a serializar.
+        :return:        JSON em bytes (UTF-8).
+        """
+
+        return orjson.dumps(data, default=cls.encoder.default, option=cls.OPTIONS)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        if data is None:
+            return b''
+
+        return self.dumps(data)
+
+    # end: methods
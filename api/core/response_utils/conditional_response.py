@@ -0,0 +1,121 @@
+"""
+Respostas condicionais (ETag / If-None-Match) para as listagens da API.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import hashlib
+
+from django.db.models           import Count, Max, QuerySet, Subquery, Value
+from django.utils.http          import parse_etags, quote_etag
+from rest_framework             import status
+from rest_framework.request     import Request
+from rest_framework.response    import Response
+
+
+class ConditionalResponse:
+    """
+    Validador barato para listagens e resposta `304 Not Modified`.
+
+    A versão de uma listagem é calculada em uma única consulta: quantidade e maior `updated_at`
+    dos registros listados, mais a quantidade e o maior `updated_at` das tabelas cujos campos
+    aparecem na resposta (ex.: fóruns e palavras-chave). Mudanças nos ManyToMany atualizam o
+    `updated_at` do registro dono (ver app_alert_param.signals); remover um fórum ou palavra-chave
+    apaga seus vínculos em cascata sem esse sinal, mas muda a quantidade da tabela. A ETag combina
+    essa versão com o caminho da requisição, então paginação e filtros geram validadores diferentes.
+    """
+
+    # ini: methods
+
+    @staticmethod
+    def get_version_aggregates(related_models: tuple = ()) -> dict:
+        """
+        Monta as agregações da versão de uma listagem.
+
+        :param related_models:  Models cujos dados também aparecem na resposta.
+        :return:                Dicionário de agregações para o aggregate().
+        """
+
+        related = dict()
+        for index, model in enumerate(related_models):
+            related[f'related_{index}'] = Max(Subquery(
+                model.objects.order_by('-updated_at').values('updated_at')[:1]
+            ))
+            related[f'related_{index}_count'] = Max(Subquery(
+                model.objects.order_by().annotate(group=Value(1)).values('group').annotate(total=Count('*')).values('total')
+            ))
+
+        return {
+            'count'         : Count('id'),
+            'updated_at'    : Max('updated_at'),
+            **related
+        }
+
+    @classmethod
+    def get_version(cls, queryset: QuerySet, related_models: tuple = ()) -> tuple:
+        """
+        Calcula a versão de uma listagem sem carregar os registros.
+
+        :param queryset:        QuerySet listado.
+        :param related_models:  Models cujos dados também aparecem na resposta.
+        :return:                Tupla com a versão da listagem.
+        """
+
+        version = queryset.order_by().aggregate(**cls.get_version_aggregates(related_models))
+
+        return tuple(version.values())
+
+    @classmethod
+    async def aget_version(cls, queryset: QuerySet, related_models: tuple = ()) -> tuple:
+        """ Versão assíncrona do get_version (ORM assíncrono). """
+
+        version = await queryset.order_by().aaggregate(**cls.get_version_aggregates(related_models))
+
+        return tuple(version.values())
+
+    @staticmethod
+    def get_etag(request: Request, version: tuple) -> str:
+        """
+        Monta a ETag (fraca) da resposta.
+
+        :param request: Requisição HTTP.
+        :param version: Versão da listagem (get_version).
+        :return:        ETag entre aspas.
+        """
+
+        digest = hashlib.sha1(f'{request.get_full_path()}|{version}'.encode()).hexdigest()
+
+        return f'W/{quote_etag(digest)}'
+
+    @staticmethod
+    def is_not_modified(request: Request, etag: str) -> bool:
+        """
+        Indica se a ETag enviada em `If-None-Match` ainda é válida.
+
+        :param request: Requisição HTTP.
+        :param etag:    ETag atual da resposta.
+        :return:        True se o cliente já tem a versão atual.
+        """
+
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if not if_none_match:
+            return False
+
+        etags = parse_etags(if_none_match)
+
+        # Comparação fraca (RFC 9110): ignora o prefixo W/
+        return '*' in etags or etag.removeprefix('W/') in [ tag.removeprefix('W/') for tag in etags ]
+
+    @staticmethod
+    def build_not_modified(etag: str) -> Response:
+        """
+        Monta a resposta `304 Not Modified`.
+
+        :param etag:    ETag atual da resposta.
+        :return:        Resposta HTTP sem corpo.
+        """
+
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={ 'ETag': etag })
+
+    # end: methods
@@ -5,15 +5,31 @@ Esse módulo é responsável por construir as respostas das requisições da API
 :created at:        2025-07-18
 """
 
+from django.http                import StreamingHttpResponse
 from rest_framework             import status
+from rest_framework.request     import Request
 from rest_framework.response    import Response
 
+from core.renderers.orjson_renderer import ORJSONRenderer
+
 
 class ResponseBuilder:
     """ Classe para construir as respostas das requisições da API. """
 
+    # Parâmetro de query que ativa o modo streaming nas listagens
+    STREAM_QUERY_PARAM  = 'stream'
+
+    # Tamanho aproximado (bytes) de cada bloco enviado no modo streaming
+    STREAM_BUFFER_SIZE  = 64 * 1024
+
     @staticmethod
-    def build_response(message: str, data=None, error=None, http_status=status.HTTP_200_OK) -> Response:
+    def build_response(
+            message: str,
+            data=None,
+            error=None,
+            http_status=status.HTTP_200_OK,
+            pagination: dict = None
+        ) -> Response:
         """
         Método para construir a resposta da requisição.
 
@@ -21,31 +37,94 @@ class ResponseBuilder:
         :param data:        Dados da resposta.
         :param error:       Erro da resposta.
         :param http_status: Status HTTP da resposta.
+        :param pagination:  Dados de paginação (cursor da próxima página), quando a listagem é paginada.
         :return:            Dicionário com os dados da resposta.
         """
 
         if error:
-            return Response(
-                {
-                    'message'   : message,
-                    'error'     : error,
-                },
-                status=http_status
-            )
-        
+            body = {
+                'message'   : message,
+                'error'     : error,
+            }
+
         elif data:
-            return Response(
-                {
-                    'message'   : message,
-                    'data'      : data,
-                },
-                status=http_status
-            )
-        
+            body = {
+                'message'   : message,
+                'data'      : data,
+            }
+
         else:
-            return Response(
-                {
-                    'message'   : message,
-                },
-                status=http_status
-            )
+            body = {
+                'message'   : message,
+            }
+
+        if pagination is not None:
+            body['pagination'] = pagination
+
+        return Response(body, status=http_status)
+
+    @classmethod
+    def is_stream_requested(cls, request: Request) -> bool:
+        """
+        Indica se a requisição pediu a resposta em modo streaming (`?stream=true`).
+
+        :param request: Requisição HTTP.
+        :return:        True se o modo streaming foi solicitado.
+        """
+
+        return request.query_params.get(cls.STREAM_QUERY_PARAM, '').lower() in ('1', 'true')
+
+    @classmethod
+    def build_streaming_response(cls, message: str, data, http_status=status.HTTP_200_OK) -> StreamingHttpResponse:
+        """
+        Método para construir a resposta da requisição em modo streaming.
+
+        O envelope `{"message": ..., "data": [...]}` é escrito de forma incremental: cada item de
+        `data` é renderizado só quando é consumido, então `data` pode ser um gerador que lê o queryset
+        em blocos (KeysetPagination.iter_chunks) e a memória do worker não cresce com a quantidade
+        de registros.
+        `data` também pode ser um iterável assíncrono (views assíncronas, servidas via ASGI).
+
+        :param message:     Mensagem da resposta.
+        :param data:        Iterável com os itens da resposta.
+        :param http_status: Status HTTP da resposta.
+        :return:            Resposta HTTP em streaming.
+        """
+
+        head = ORJSONRenderer.dumps({ 'message': message })[:-1] + b',"data":['
+
+        def render(buffer: bytearray, index: int, item) -> bool:
+            if index:
+                buffer += b','
+            buffer += ORJSONRenderer.dumps(item)
+
+            return len(buffer) >= cls.STREAM_BUFFER_SIZE
+
+        def stream():
+            yield head
+
+            buffer = bytearray()
+            for index, item in enumerate(data):
+                if render(buffer, index, item):
+                    yield bytes(buffer)
+                    buffer.clear()
+
+            yield bytes(buffer) + b']}'
+
+        async def astream():
+            yield head
+
+            buffer  = bytearray()
+            index   = 0
+            async for item in data:
+                if render(buffer, index, item):
+                    yield bytes(buffer)
+                    buffer.clear()
+                index += 1
+
+            yield bytes(buffer) + b']}'
+
+        # Iteráveis assíncronos (views assíncronas) são servidos sem bloquear o event loop
+        content = astream() if hasattr(data, '__aiter__') else stream()
+
+        return StreamingHttpResponse(content, content_type=ORJSONRenderer.media_type, status=http_status)
@@ -34,4 +34,19 @@ class ResponseErrorCode:
     ERROR_CREATE_POST_ALERTED           = (19, 'Erro ao tentar criar post alertado.'                    )
     ERROR_LIST_POSTS_ALERTED            = (20, 'Erro ao tentar listar posts alertados.'                 )
     ERROR_LIST_POSTS_ALERTED_BY_ALERT   = (21, 'Erro ao tentar listar posts alertados por alerta.'      )
+
+    ERROR_INVALID_BULK_BODY             = (22, 'O corpo da requisição deve ser uma lista de posts.'     )
+    ERROR_ALERT_NOT_FOUND               = (23, 'Alerta não encontrado.'                                 )
+    ERROR_FORUM_NOT_FOUND               = (24, 'Fórum não encontrado.'                                  )
+
+    ERROR_INVALID_PAGINATION            = (25, 'Parâmetros de paginação inválidos.'                     )
+
+    ERROR_BUILD_MATCHER                 = (26, 'Erro ao tentar compilar palavras-chave dos alertas.'    )
+
+    ERROR_CLAIM_ALERTS                  = (27, 'Erro ao tentar reservar alertas.'                       )
+    ERROR_ALERT_LEASE                   = (28, 'Alerta não está reservado com o token informado.'       )
+
+    ERROR_INVALID_FIELDS                = (29, 'Parâmetros de campos ou formato inválidos.'             )
+    ERROR_INVALID_ARCHIVED              = (30, 'Parâmetros da listagem de arquivados inválidos.'        )
+    ERROR_LENGTH_REQUIRED               = (31, 'Corpo chunked não suportado; envie Content-Length.'     )
     pass
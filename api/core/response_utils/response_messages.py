@@ -11,10 +11,12 @@ class ResponseMessages:
 
     SUCCESS_CREATE_ALERT        = 'Alerta criado com sucesso.'
     SUCCESS_CREATE_POST_ALERTED = 'Post alertado criado com sucesso.'
+    SUCCESS_BULK_POST_ALERTED   = 'Lote de posts alertados processado.'
 
     ERROR_EMPTY_BODY            = 'O corpo da requisição está vazio.'
     ERROR_MISSING_FIELDS        = 'Parâmetro obrigatório não informado.'
     ERROR_GET_REQUEST           = 'Erro ao tentar obter a requisição.'
+    ERROR_LENGTH_REQUIRED       = 'Corpo chunked não suportado; envie Content-Length.'
     ERROR_INVALID_DATE          = 'Data inválida.'
     ERROR_CREATE_ALERT          = 'Erro ao tentar criar alerta.'
 
@@ -23,20 +25,33 @@ class ResponseMessages:
 
     ERROR_LIST_ALERTS           = 'Erro ao tentar listar alertas.'
     ERROR_FOUND_ALERT           = 'Alerta não encontrado.'
+    ERROR_INVALID_PAGINATION    = 'Parâmetros de paginação inválidos.'
+    ERROR_INVALID_FIELDS        = 'Parâmetros de campos ou formato inválidos.'
+    ERROR_INVALID_ARCHIVED      = 'Parâmetros da listagem de arquivados inválidos.'
 
     ALERT_INACTIVE              = 'Alerta foi inativado.'
     ALERT_INACTIVE_METHOD       = 'Alerta desativado com sucesso.'
 
     ALERT_RUN_UPDATED           = 'Próximo dia a rodar alerta atualizado com sucesso.'
+    CLAIM_ALERTS                = 'Alertas reservados com sucesso.'
+    ALERTS_RUN_ADVANCED         = 'Próximo dia a rodar dos alertas atualizado com sucesso.'
     ALERT_KEYWORDS_UPDATED      = 'Palavras-chave do alerta atualizadas com sucesso.'
     ALERT_FORUMS_UPDATED        = 'Fóruns do alerta atualizados com sucesso.'
     ALERT_EMAILS_UPDATED        = 'Emails do alerta atualizados com sucesso.'
 
     ERROR_ALERT_UPDATE_RUN      = 'Erro ao tentar atualizar próximo dia a rodar alerta.'
+    ERROR_CLAIM_ALERTS          = 'Erro ao tentar reservar alertas.'
     ERROR_ALERT_UPDATE_KEYWORDS = 'Erro ao tentar atualizar palavras-chave do alerta.'
     ERROR_ALERT_UPDATE_FORUMS   = 'Erro ao tentar atualizar fóruns do alerta.'
     ERROR_ALERT_UPDATE_EMAILS   = 'Erro ao tentar atualizar emails do alerta.'
 
     ERROR_CREATE_POST_ALERTED   = 'Erro ao tentar criar post alertado.'
+    ERROR_BULK_POST_ALERTED     = 'Nenhum post alertado do lote pôde ser criado.'
     ERROR_LIST_POSTS_ALERTED    = 'Erro ao tentar listar posts alertados.'
+
+    MATCH_POSTS                 = 'Posts verificados com sucesso.'
+    ERROR_MATCH_POSTS           = 'Erro ao tentar verificar posts.'
+
+    DB_STATS                    = 'Estatísticas das conexões com o banco de dados.'
+    ALERT_CACHE_STATS           = 'Estatísticas do cache de alertas.'
     pass
@@ -0,0 +1,170 @@
+"""
+Seleção de campos (`?fields=`) e formato colunar (`?layout=columnar`) para as listagens da API.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+from django.db.models           import QuerySet
+from rest_framework.request     import Request
+
+
+class SparseFieldsetError(ValueError):
+    """ Erro nos parâmetros `fields` ou `layout` informados na requisição. """
+
+
+class SparseFieldset:
+    """
+    Listagem com os campos pedidos em `?fields=a,b,c` e/ou no formato `?layout=columnar`.
+
+    Quando pedida, a listagem lê só as colunas necessárias com `.values()` (sem instanciar models,
+    sem serializer e sem os JOINs e prefetch dos campos não pedidos) e monta cada item direto do
+    dicionário da linha. No formato colunar, `data` traz uma lista por campo, na ordem dos
+    registros, em vez de um objeto por registro: `{"id_post": [...], "date": [...]}`.
+    """
+
+    fields_query_param  = 'fields'
+    layout_query_param  = 'layout'
+
+    ROWS        = 'rows'
+    COLUMNAR    = 'columnar'
+
+    def __init__(self, fields: dict, converters: dict = None, required: tuple = ()):
+        """
+        Inicializa a seleção de campos.
+
+        :param fields:      Campos disponíveis, na ordem padrão: nome na resposta -> lookup do
+                            `.values()` (ex.: `forum__forum_name`) ou expressão anotada.
+        :param converters:  Funções aplicadas ao valor de um campo (ex.: datetime para texto).
+        :param required:    Lookups sempre lidos, mesmo se não pedidos (ex.: campos da paginação).
+        """
+
+        self.fields     = fields
+        self.converters = converters or dict()
+        self.required   = tuple(required)
+
+    # ini: methods
+
+    def is_requested(self, request: Request) -> bool:
+        """
+        Indica se a requisição pediu seleção de campos ou outro formato.
+
+        :param request: Requisição HTTP.
+        :return:        True se `fields` ou `layout` foram informados.
+        """
+
+        return (
+            self.fields_query_param in request.query_params or
+            self.layout_query_param in request.query_params
+        )
+
+    def get_fields(self, request: Request) -> list:
+        """
+        Retorna os campos pedidos, na ordem informada (todos, se `fields` não foi informado).
+
+        :param request: Requisição HTTP.
+        :return:        Nomes dos campos.
+        """
+
+        fields = request.query_params.get(self.fields_query_param)
+        if fields is None:
+            return list(self.fields)
+
+        fields = list(dict.fromkeys(field.strip() for field in fields.split(',') if field.strip()))
+        if not fields:
+            raise SparseFieldsetError(f'{self.fields_query_param} deve ter ao menos um campo.')
+
+        invalid = [ field for field in fields if field not in self.fields ]
+        if invalid:
+            raise SparseFieldsetError(
+                f'Campos inválidos: {", ".join(invalid)}. Disponíveis: {", ".join(self.fields)}.'
+            )
+
+        return fields
+
+    def is_columnar(self, request: Request) -> bool:
+        """
+        Indica se a requisição pediu o formato colunar.
+
+        :param request: Requisição HTTP.
+        :return:        True para `layout=columnar`.
+        """
+
+        layout = request.query_params.get(self.layout_query_param, self.ROWS)
+        if layout not in (self.ROWS, self.COLUMNAR):
+            raise SparseFieldsetError(f'{self.layout_query_param} deve ser {self.ROWS} ou {self.COLUMNAR}.')
+
+        return layout == self.COLUMNAR
+
+    def get_lookup(self, field: str) -> str:
+        """ Retorna a chave do campo no dicionário da linha (`.values()`). """
+
+        lookup = self.fields[field]
+
+        return lookup if isinstance(lookup, str) else f'_{field}'
+
+    def get_queryset(self, queryset: QuerySet, fields: list) -> QuerySet:
+        """
+        Restringe o queryset às colunas dos campos pedidos.
+
+        :param queryset:    QuerySet da listagem (sem select_related/prefetch_related).
+        :param fields:      Campos pedidos.
+        :return:            QuerySet de dicionários (`.values()`).
+        """
+
+        annotations = {
+            self.get_lookup(field): self.fields[field]
+            for field in fields if not isinstance(self.fields[field], str)
+        }
+        if annotations:
+            queryset = queryset.annotate(**annotations)
+
+        lookups = dict.fromkeys([ *self.required, *( self.get_lookup(field) for field in fields ) ])
+
+        return queryset.values(*lookups)
+
+    def get_plan(self, fields: list) -> list:
+        """
+        Prepara a montagem dos itens: resolve uma vez, por campo, a chave na linha e o conversor.
+
+        :param fields:  Campos pedidos.
+        :return:        Lista de tuplas (nome na resposta, chave na linha, conversor ou None).
+        """
+
+        return [ (field, self.get_lookup(field), self.converters.get(field)) for field in fields ]
+
+    @staticmethod
+    def get_row(row: dict, plan: list) -> dict:
+        """
+        Monta o item da resposta a partir da linha lida.
+
+        :param row:     Linha do `.values()`.
+        :param plan:    Campos pedidos (get_plan).
+        :return:        Item com os campos pedidos, na ordem pedida.
+        """
+
+        return {
+            field: row[lookup] if converter is None or row[lookup] is None else converter(row[lookup])
+            for field, lookup, converter in plan
+        }
+
+    @staticmethod
+    def get_columns(rows: list, plan: list) -> dict:
+        """
+        Monta os dados no formato colunar.
+
+        :param rows:    Linhas do `.values()`.
+        :param plan:    Campos pedidos (get_plan).
+        :return:        Dicionário campo -> lista de valores, na ordem das linhas.
+        """
+
+        columns = dict()
+        for field, lookup, converter in plan:
+            if converter is None:
+                columns[field] = [ row[lookup] for row in rows ]
+            else:
+                columns[field] = [ None if row[lookup] is None else converter(row[lookup]) for row in rows ]
+
+        return columns
+
+    # end: methods
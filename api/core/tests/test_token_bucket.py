@@ -0,0 +1,111 @@
+"""
+Testes do token bucket no Redis (script Lua) e dos escopos do throttling.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import time
+
+from types                      import SimpleNamespace
+from unittest                   import mock
+
+import fakeredis
+
+from django.conf                import settings
+from django.test                import SimpleTestCase, override_settings
+from django.contrib.auth.models import User
+from rest_framework.request     import Request
+from rest_framework.test        import APIRequestFactory
+
+from core.throttling.token_bucket           import RedisTokenBucketStore
+from core.throttling.token_bucket_throttle  import TokenBucketThrottle
+
+
+class RedisTokenBucketStoreTestCase(SimpleTestCase):
+    """ O script Lua repõe tokens pelo tempo decorrido, limita a rajada à capacidade e separa as chaves. """
+
+    # ini: methods
+
+    def setUp(self):
+        self.store  = RedisTokenBucketStore(fakeredis.FakeRedis())
+        self.now    = time.time()
+
+        patcher = mock.patch('core.throttling.token_bucket.time.time', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def consume(self, key: str = 'bucket') -> tuple:
+        return self.store.consume(key, capacity=5, refill_rate=1.0)
+
+    def test_burst(self):
+        results = [ self.consume()[0] for _ in range(6) ]
+
+        self.assertEqual(results, [ True ] * 5 + [ False ])
+
+        allowed, wait = self.consume()
+        self.assertFalse(allowed)
+        self.assertAlmostEqual(wait, 1.0, places=2)
+
+    def test_refill(self):
+        for _ in range(5):
+            self.consume()
+
+        self.now += 2.5
+
+        self.assertEqual([ self.consume()[0] for _ in range(3) ], [ True, True, False ])
+        self.assertAlmostEqual(self.consume()[1], 0.5, places=2)
+
+    def test_refill_up_to_capacity(self):
+        self.consume()
+
+        self.now += 60
+
+        self.assertEqual([ self.consume()[0] for _ in range(6) ], [ True ] * 5 + [ False ])
+
+    def test_separate_keys(self):
+        for _ in range(5):
+            self.consume('first')
+
+        self.assertFalse(self.consume('first')[0])
+        self.assertTrue(self.consume('second')[0])
+
+    # end: methods
+
+
+@override_settings(REST_FRAMEWORK={
+    **settings.REST_FRAMEWORK,
+    'DEFAULT_THROTTLE_RATES': { 'read': '2/minute', 'write': '2/minute', 'ingestion': '3/minute' },
+})
+class TokenBucketThrottleTestCase(SimpleTestCase):
+    """ Cada escopo (leitura, escrita e ingestão) tem seu próprio bucket, por usuário. """
+
+    # ini: methods
+
+    def setUp(self):
+        store = RedisTokenBucketStore(fakeredis.FakeRedis())
+
+        patcher = mock.patch('core.throttling.token_bucket_throttle.get_token_bucket_store', return_value=store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.view = SimpleNamespace(action='bulk_create', throttle_scopes={ 'bulk_create': 'ingestion' })
+
+    def allow(self, method: str, user_id: int = 1, view=None) -> bool:
+        request         = Request(getattr(APIRequestFactory(), method)('/'))
+        request.user    = User(pk=user_id)
+
+        return TokenBucketThrottle().allow_request(request, view or SimpleNamespace())
+
+    def test_scopes(self):
+        self.assertEqual([ self.allow('get') for _ in range(3) ], [ True, True, False ])
+
+        # Leituras esgotadas não limitam escritas nem ingestão
+        self.assertEqual([ self.allow('post') for _ in range(3) ], [ True, True, False ])
+        self.assertEqual([ self.allow('post', view=self.view) for _ in range(4) ], [ True, True, True, False ])
+
+    def test_users(self):
+        self.assertEqual([ self.allow('get') for _ in range(3) ], [ True, True, False ])
+        self.assertTrue(self.allow('get', user_id=2))
+
+    # end: methods
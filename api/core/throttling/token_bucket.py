@@ -0,0 +1,161 @@
+"""
+Armazenamento dos token buckets usados no throttling da API.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import math
+import time
+import logging
+import threading
+
+from django.conf import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class LocalTokenBucketStore:
+    """
+    Token buckets em memória do processo.
+
+    Usado apenas quando nenhum Redis está configurado (desenvolvimento): cada worker tem seus
+    próprios buckets, então o limite efetivo é multiplicado pela quantidade de workers.
+    """
+
+    def __init__(self):
+        self._lock      = threading.Lock()
+        self._buckets   = dict()
+
+    # ini: methods
+
+    def consume(self, key: str, capacity: int, refill_rate: float, tokens: int = 1) -> tuple:
+        """
+        Tenta consumir tokens do bucket.
+
+        :param key:         Chave do bucket.
+        :param capacity:    Capacidade do bucket (rajada máxima).
+        :param refill_rate: Tokens repostos por segundo.
+        :param tokens:      Tokens a consumir.
+        :return:            Tupla (permitido, segundos até haver tokens suficientes).
+        """
+
+        now = time.monotonic()
+
+        with self._lock:
+            available, updated_at = self._buckets.get(key, (capacity, now))
+            available = min(capacity, available + (now - updated_at) * refill_rate)
+
+            allowed = available >= tokens
+            if allowed:
+                available -= tokens
+
+            self._buckets[key] = (available, now)
+
+        return allowed, 0.0 if allowed else (tokens - available) / refill_rate
+
+    # end: methods
+
+
+class RedisTokenBucketStore:
+    """
+    Token buckets no Redis, compartilhados por todos os workers.
+
+    Cada consumo é um único script Lua (atômico no Redis): repõe os tokens pelo tempo decorrido,
+    consome se houver saldo e grava o estado com expiração igual ao tempo de encher o bucket.
+    """
+
+    SCRIPT = """
+        local capacity      = tonumber(ARGV[1])
+        local refill_rate   = tonumber(ARGV[2])
+        local now           = tonumber(ARGV[3])
+        local tokens        = tonumber(ARGV[4])
+
+        local bucket    = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+        local available = tonumber(bucket[1]) or capacity
+        local updated   = tonumber(bucket[2]) or now
+
+        available = math.min(capacity, available + math.max(0, now - updated) * refill_rate)
+
+        local allowed = 0
+        local wait    = 0
+        if available >= tokens then
+            available = available - tokens
+            allowed   = 1
+        else
+            wait = (tokens - available) / refill_rate
+        end
+
+        redis.call('HSET', KEYS[1], 'tokens', tostring(available), 'updated_at', tostring(now))
+        redis.call('PEXPIRE', KEYS[1], ARGV[5])
+
+        return { allowed, tostring(wait) }
+    """
+
+    def __init__(self, client):
+        """
+        Inicializa o armazenamento.
+
+        :param client:  Cliente Redis.
+        """
+
+        self.client = client
+        self.script = client.register_script(self.SCRIPT)
+
+    # ini: methods
+
+    def consume(self, key: str, capacity: int, refill_rate: float, tokens: int = 1) -> tuple:
+        """
+        Tenta consumir tokens do bucket.
+
+        :param key:         Chave do bucket.
+        :param capacity:    Capacidade do bucket (rajada máxima).
+        :param refill_rate: Tokens repostos por segundo.
+        :param tokens:      Tokens a consumir.
+        :return:            Tupla (permitido, segundos até haver tokens suficientes).
+        """
+
+        ttl_ms = math.ceil(1000 * capacity / refill_rate) + 1000
+
+        allowed, wait = self.script(
+            keys=[ key ],
+            args=[ capacity, refill_rate, time.time(), tokens, ttl_ms ],
+        )
+
+        return bool(allowed), float(wait)
+
+    # end: methods
+
+
+_store      = None
+_store_lock = threading.Lock()
+
+
+def get_token_bucket_store():
+    """
+    Retorna o armazenamento de token buckets do processo.
+
+    Usa o Redis de `THROTTLE_REDIS_URL` se configurado; caso contrário, buckets em memória.
+
+    :return:    Armazenamento de token buckets.
+    """
+
+    global _store
+
+    with _store_lock:
+        if _store is None:
+            if settings.THROTTLE_REDIS_URL:
+                import redis
+
+                client = redis.Redis.from_url(
+                    settings.THROTTLE_REDIS_URL,
+                    socket_timeout          = 0.1,
+                    socket_connect_timeout  = 0.1,
+                )
+                _store = RedisTokenBucketStore(client)
+            else:
+                logger.warning('THROTTLE_REDIS_URL não configurado: throttling por processo.')
+                _store = LocalTokenBucketStore()
+
+        return _store
@@ -0,0 +1,90 @@
+"""
+Throttle por token bucket, com escopos separados por tipo de endpoint.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import logging
+
+from rest_framework.settings    import api_settings
+from rest_framework.throttling  import SimpleRateThrottle
+
+from core.metrics.metrics         import count_throttle_rejection
+from core.throttling.token_bucket import get_token_bucket_store
+
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucketThrottle(SimpleRateThrottle):
+    """
+    Throttle por usuário (ou IP, para anônimos) com token bucket compartilhado entre workers.
+
+    O escopo vem de `view.throttle_scopes[view.action]`, quando definido (ex.: `ingestion` nas
+    escritas do gerador), ou do método HTTP: `read` para GET/HEAD/OPTIONS e `write` para os demais.
+    Cada escopo tem seu próprio bucket e taxa (DEFAULT_THROTTLE_RATES), então rajadas de ingestão
+    não consomem o limite das leituras. A taxa `n/período` vira um bucket de capacidade `n`
+    reposto a `n/período` tokens por segundo. Se o Redis estiver indisponível, a requisição passa.
+    """
+
+    READ_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+    def __init__(self):
+        # A taxa depende do escopo, conhecido apenas em allow_request
+        self.wait_seconds = None
+
+    # ini: methods
+
+    def get_scope(self, request, view) -> str:
+        """
+        Retorna o escopo de throttling da requisição.
+
+        :param request: Requisição HTTP.
+        :param view:    View que atende a requisição.
+        :return:        Nome do escopo.
+        """
+
+        scope = getattr(view, 'throttle_scopes', dict()).get(getattr(view, 'action', None))
+        if scope:
+            return scope
+
+        return 'read' if request.method in self.READ_METHODS else 'write'
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+
+        return self.cache_format % { 'scope': self.scope, 'ident': ident }
+
+    def allow_request(self, request, view):
+        self.scope = self.get_scope(request, view)
+
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+        if rate is None:
+            return True
+
+        num_requests, duration = self.parse_rate(rate)
+
+        try:
+            allowed, self.wait_seconds = get_token_bucket_store().consume(
+                self.get_cache_key(request, view),
+                capacity    = num_requests,
+                refill_rate = num_requests / duration,
+            )
+
+        except Exception as err:
+            logger.warning(f'Throttling indisponível, requisição liberada: {type(err)}')
+            return True
+
+        if not allowed:
+            count_throttle_rejection(self.scope)
+
+        return allowed
+
+    def wait(self):
+        return self.wait_seconds
+
+    # end: methods
@@ -0,0 +1,83 @@
+"""
+APIView do DRF com handlers assíncronos.
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+from asgiref.sync               import sync_to_async
+from rest_framework.views       import APIView
+from rest_framework.request     import Request
+from rest_framework.response    import Response
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView cujos handlers são corrotinas (`async def get(...)`).
+
+    O DRF 3.15 só despacha handlers síncronos; aqui o dispatch é assíncrono, então, servido via
+    ASGI, a view não ocupa uma thread do worker enquanto espera o banco. Autenticação, permissões
+    e throttling continuam síncronos (banco e cache) e rodam via sync_to_async; o handler usa o
+    ORM assíncrono.
+    """
+
+    # ini: methods
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args       = args
+        self.kwargs     = kwargs
+        request         = self.initialize_request(request, *args, **kwargs)
+        self.request    = request
+        self.headers    = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = await handler(request, *args, **kwargs)
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+
+        return self.response
+
+    async def options(self, request: Request, *args, **kwargs) -> Response:
+        """ OPTIONS assíncrono: o Django exige que todos os handlers da view sejam do mesmo tipo. """
+
+        return super().options(request, *args, **kwargs)
+
+    # end: methods
+
+
+def read_write_view(read_view, write_view):
+    """
+    Combina, no mesmo endpoint, uma view assíncrona para leituras (GET/HEAD) e a view síncrona
+    das demais requisições (ex.: GET `alert/` assíncrono e POST `alert/` no ViewSet).
+
+    :param read_view:   View assíncrona das leituras.
+    :param write_view:  View síncrona das demais requisições.
+    :return:            View assíncrona que despacha pelo método HTTP.
+    """
+
+    write_view = sync_to_async(write_view)
+
+    async def view(request, *args, **kwargs):
+        if request.method in ('GET', 'HEAD'):
+            return await read_view(request, *args, **kwargs)
+
+        return await write_view(request, *args, **kwargs)
+
+    # O csrf_exempt do Django 4.2 embrulha a view em uma função síncrona
+    view.csrf_exempt = True
+
+    # Views originais, para identificar a action (ex.: ServerTimingMiddleware)
+    view.read_view  = read_view
+    view.write_view = write_view
+
+    return view
@@ -0,0 +1,49 @@
+"""
+Configuração do gunicorn (carregada automaticamente da pasta de trabalho).
+
+:created by:    Mateus Herrera
+:created at:    2026-10-18
+"""
+
+import os
+import shutil
+
+
+def check_throttle_store(server):
+    """
+    Sem THROTTLE_REDIS_URL, cada worker tem seus próprios token buckets e o limite efetivo do
+    throttling é multiplicado pela quantidade de workers. Com mais de um worker, o servidor não
+    inicia em produção e avisa em desenvolvimento.
+    """
+
+    from decouple import config
+
+    workers = server.cfg.workers
+    if workers <= 1 or config('THROTTLE_REDIS_URL', default=''):
+        return
+
+    message = f'THROTTLE_REDIS_URL não configurado com {workers} workers: o throttling valeria por worker.'
+    if config('ENV') == 'prod':
+        raise RuntimeError(message)
+
+    server.log.warning(message)
+
+
+def on_starting(server):
+    """ Confere o Redis do throttling e limpa as métricas de execuções anteriores (PROMETHEUS_MULTIPROC_DIR). """
+
+    check_throttle_store(server)
+
+    directory = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if directory:
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """ Descarta as métricas de gauge do worker que terminou; os contadores continuam somados. """
+
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)